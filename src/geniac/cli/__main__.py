@@ -11,11 +11,14 @@ from logging.config import dictConfig
 from sys import argv
 
 from geniac import __version__
+from geniac.cli.commands.batch import GeniacLintBatch
 from geniac.cli.commands.clean import GeniacClean
 from geniac.cli.commands.configs import GeniacConfigs
+from geniac.cli.commands.daemon import GeniacDaemon, GeniacLintClient
 from geniac.cli.commands.init import GeniacInit
 from geniac.cli.commands.install import GeniacInstall
 from geniac.cli.commands.lint import GeniacLint
+from geniac.cli.commands.lsp import GeniacLanguageServer
 from geniac.cli.commands.options import GeniacOptions
 from geniac.cli.commands.recipes import GeniacRecipes
 from geniac.cli.commands.test import GeniacTest
@@ -95,6 +98,8 @@ class GeniacEntryPoint:
         "clean": logging.INFO,
         "configs": logging.INFO,
         "recipes": logging.INFO,
+        "daemon": logging.INFO,
+        "lsp": logging.WARNING,
     }
     DEFAULT_OPTS = (
         MethodRecord(
@@ -147,6 +152,40 @@ class GeniacEntryPoint:
                 "metavar": "BRANCH",
             },
         ),
+        MethodRecord(
+            args=["--depth"],
+            kwargs={
+                "help": _(
+                    "Number of commits cloned if project path is a correct git URL (shallow "
+                    "clone)"
+                ),
+                "dest": "depth",
+                "type": int,
+                "metavar": "N",
+            },
+        ),
+        MethodRecord(
+            args=["--filter"],
+            kwargs={
+                "help": _(
+                    "Partial clone filter, such as blob:none, used if project path is a correct "
+                    "git URL"
+                ),
+                "dest": "clone_filter",
+                "metavar": "FILTER",
+            },
+        ),
+        MethodRecord(
+            args=["--sparse"],
+            kwargs={
+                "help": _(
+                    "Only check out the folders needed by the command if project path is a "
+                    "correct git URL"
+                ),
+                "dest": "sparse",
+                "action": "store_true",
+            },
+        ),
     )
     DEFAULT_ARGS = (
         MethodRecord(
@@ -172,6 +211,156 @@ class GeniacEntryPoint:
                 "action": "store_true",
             },
         ),
+        MethodRecord(
+            args=["--refresh-conda-cache"],
+            kwargs={
+                "dest": "refreshCondaCache",
+                "help": _("Ignore conda search results kept in the geniac cache"),
+                "action": "store_true",
+            },
+        ),
+        MethodRecord(
+            args=["--no-result-cache"],
+            kwargs={
+                "dest": "no_result_cache",
+                "help": _("Lint the project even if it has not changed since the last run"),
+                "action": "store_true",
+            },
+        ),
+        MethodRecord(
+            args=["--select"],
+            kwargs={
+                "dest": "select",
+                "help": _(
+                    "Comma separated list of the lint rules to check (glob patterns are allowed)"
+                ),
+                "metavar": "RULES",
+            },
+        ),
+        MethodRecord(
+            args=["--ignore"],
+            kwargs={
+                "dest": "ignore",
+                "help": _(
+                    "Comma separated list of the lint rules to skip (glob patterns are allowed)"
+                ),
+                "metavar": "RULES",
+            },
+        ),
+        MethodRecord(
+            args=["--max-errors"],
+            kwargs={
+                "dest": "maxErrors",
+                "help": _("Stop the lint once N errors have been reported (0 for no limit)"),
+                "metavar": "N",
+                "type": int,
+            },
+        ),
+        MethodRecord(
+            args=["--fail-fast"],
+            kwargs={
+                "dest": "failFast",
+                "help": _("Stop the lint at the first error"),
+                "action": "store_true",
+            },
+        ),
+        MethodRecord(
+            args=["--diagnostics-jsonl"],
+            kwargs={
+                "dest": "diagnostics_jsonl",
+                "help": _(
+                    "Write each finding as a JSON object on its own line in FILE "
+                    "(- for the standard output)"
+                ),
+                "metavar": "FILE",
+            },
+        ),
+        MethodRecord(
+            args=["--sarif"],
+            kwargs={
+                "dest": "sarif",
+                "help": _("Write the findings in FILE with the SARIF format"),
+                "metavar": "FILE",
+            },
+        ),
+        MethodRecord(
+            args=["--profile"],
+            kwargs={
+                "dest": "profile",
+                "help": _(
+                    "Print the time, files, regex, glob, stat and subprocess calls of each lint "
+                    "phase and rule"
+                ),
+                "action": "store_true",
+            },
+        ),
+        MethodRecord(
+            args=["--profile-json"],
+            kwargs={
+                "dest": "profile_json",
+                "help": _("Write the lint profile in FILE (JSON format)"),
+                "metavar": "FILE",
+            },
+        ),
+        MethodRecord(
+            args=["--projects"],
+            kwargs={
+                "dest": "projects",
+                "help": _("Lint several Nextflow projects in one run (SRC_PATH is ignored)"),
+                "nargs": "+",
+                "metavar": "DIR",
+            },
+        ),
+        MethodRecord(
+            args=["--projects-file"],
+            kwargs={
+                "dest": "projects_file",
+                "help": _("File listing the paths of the Nextflow projects to lint (one per line)"),
+                "metavar": "FILE",
+            },
+        ),
+        MethodRecord(
+            args=["--staged"],
+            kwargs={
+                "dest": "staged",
+                "help": _(
+                    "Lint the files as they are staged in the git index and only the rules "
+                    "depending on the staged changes"
+                ),
+                "action": "store_true",
+            },
+        ),
+        MethodRecord(
+            args=["--rev"],
+            kwargs={
+                "dest": "rev",
+                "help": _(
+                    "Lint the files of a git revision (commit, branch or tag) read from the git "
+                    "repository without checking it out"
+                ),
+                "metavar": "REF",
+            },
+        ),
+        MethodRecord(
+            args=["--daemon"],
+            kwargs={
+                "dest": "daemon",
+                "help": _(
+                    "Send the lint to the geniac daemon of the project, which is started if it "
+                    "is not running"
+                ),
+                "action": "store_true",
+            },
+        ),
+        MethodRecord(
+            args=["-j", "--jobs"],
+            kwargs={
+                "dest": "jobs",
+                "help": _("Number of projects linted in parallel (default: number of CPUs)"),
+                "type": int,
+                "metavar": "N",
+            },
+        ),
     )
     INIT_ARGS = (
         MethodRecord(
@@ -194,7 +383,38 @@ class GeniacEntryPoint:
     CLEAN_ARGS = tuple(
         list(INIT_ARGS)
         + [
-            # Put here specific args for options cmd
+            MethodRecord(
+                args=["--images"],
+                kwargs={
+                    "dest": "images",
+                    "help": _("Only remove the container images of the build folder"),
+                    "action": "store_true",
+                },
+            ),
+            MethodRecord(
+                args=["--work"],
+                kwargs={
+                    "dest": "work",
+                    "help": _("Only remove the Nextflow work folders of the build folder"),
+                    "action": "store_true",
+                },
+            ),
+            MethodRecord(
+                args=["--cmake-cache"],
+                kwargs={
+                    "dest": "cmake_cache",
+                    "help": _("Only remove the CMake cache of the build folder"),
+                    "action": "store_true",
+                },
+            ),
+            MethodRecord(
+                args=["--dry-run"],
+                kwargs={
+                    "dest": "dry_run",
+                    "help": _("Only report the disk space which would be reclaimed"),
+                    "action": "store_true",
+                },
+            ),
         ]
     )
     CONFIGS_ARGS = tuple(
@@ -209,6 +429,16 @@ class GeniacEntryPoint:
             # Put here specific args for options cmd
         ]
     )
+    DAEMON_ARGS = (
+        MethodRecord(
+            args=["--stop"],
+            kwargs={
+                "dest": "stop",
+                "help": _("Stop the daemon of the project"),
+                "action": "store_true",
+            },
+        ),
+    )
     TEST_ARGS = tuple(
         [
             MethodRecord(
@@ -320,8 +550,20 @@ class GeniacEntryPoint:
 
     def lint_cmd(self):
         """Geniac Lint subcommand"""
+        if self.parsed_args.get("projects") or self.parsed_args.get("projects_file"):
+            return GeniacLintBatch(**self.parsed_args, parser=self.parser)
+        if self.parsed_args.get("daemon"):
+            return GeniacLintClient(**self.parsed_args, parser=self.parser)
         return GeniacLint(**self.parsed_args, parser=self.parser)
 
+    def daemon_cmd(self):
+        """Geniac daemon subcommand"""
+        return GeniacDaemon(**self.parsed_args, parser=self.parser)
+
+    def lsp_cmd(self):
+        """Geniac lsp subcommand"""
+        return GeniacLanguageServer(**self.parsed_args)
+
     def install_cmd(self):
         """Geniac install subcommand"""
         return GeniacInstall(**self.parsed_args, parser=self.parser)
@@ -429,12 +671,32 @@ class GeniacEntryPoint:
         )
         parser_init.set_defaults(func=self.init_cmd, which="init")
 
+        # Geniac daemon
+        parser_daemon = subparsers.add_parser(
+            "daemon",
+            help=_("Keep a geniac process running to lint a project on request"),
+            parents=[parent_parser],
+            formatter_class=ArgumentDefaultsHelpFormatter,
+        )
+        parser_daemon.set_defaults(func=self.daemon_cmd, which="daemon")
+
+        # Geniac language server
+        parser_lsp = subparsers.add_parser(
+            "lsp",
+            help=_("Publish lint diagnostics in editors with the Language Server Protocol"),
+            parents=[parent_parser],
+            formatter_class=ArgumentDefaultsHelpFormatter,
+        )
+        parser_lsp.set_defaults(func=self.lsp_cmd, which="lsp")
+
         for (argparse_args, parser) in (
             (self.LINT_ARGS, parser_lint),
             (self.INSTALL_ARGS, parser_install),
             (self.OPTIONS_ARGS, parser_options),
+            (self.CLEAN_ARGS, parser_clean),
             (self.TEST_ARGS, parser_test),
             (self.INIT_ARGS, parser_init),
+            (self.DAEMON_ARGS, parser_daemon),
         ):
             for argparse_arg in argparse_args:
                 parser.add_argument(*argparse_arg.args, **argparse_arg.kwargs)
@@ -3,13 +3,23 @@
 
 """base.py: CLI geniac interface"""
 
+import errno
+import hashlib
+import json
 import logging
 import os
 import subprocess
+import uuid
 from abc import abstractmethod
+from fnmatch import fnmatchcase
+from pathlib import Path
 from shutil import which
+from tempfile import TemporaryDirectory
 
 from geniac.cli.utils.base import GeniacBase
+from geniac.cli.utils.cleanup import TOMBSTONE_PREFIX
+from geniac.cli.utils.fs import exchange_paths, materialize_tree
+from geniac.cli.utils.profiler import profile_subprocess
 
 __author__ = "Fabrice Allain"
 __copyright__ = "Institut Curie 2020"
@@ -20,6 +30,9 @@ _logger = logging.getLogger(__name__)
 class GeniacCommand(GeniacBase):
     """Base geniac command"""
 
+    # Digest of the last CMake configuration of a build folder
+    CMAKE_STAMP_NAME = ".geniac-cmake"
+
     def __init__(self, *args, **kwargs):
         """"""
         super().__init__(*args, **kwargs)
@@ -43,13 +56,14 @@ class GeniacCommand(GeniacBase):
             " ".join(cmd),
         )
         try:
-            cmd_out = subprocess.run(
-                cmd,
-                capture_output=kwargs.get("capture_output", True),
-                check=kwargs.get("check", True),
-                cwd=working_directory,
-                encoding="utf8",
-            )
+            with profile_subprocess():
+                cmd_out = subprocess.run(
+                    cmd,
+                    capture_output=kwargs.get("capture_output", True),
+                    check=kwargs.get("check", True),
+                    cwd=working_directory,
+                    encoding="utf8",
+                )
         except subprocess.CalledProcessError as error:
             if error and error.stdout:
                 self.info(
@@ -80,6 +94,98 @@ class GeniacCommand(GeniacBase):
                 )
         return cmd_out
 
+    def _cmake_configure(self, cmd: list, **kwargs):
+        """Call CMake configure command unless the build folder is already configured with it
+
+        The configuration is only skipped in a reused working directory whose project has not
+        changed since the build folder was configured.
+        """
+        build_dir = Path(kwargs.get("cwd", os.getcwd()))
+        stamp_path = build_dir / self.CMAKE_STAMP_NAME
+        stamp = hashlib.sha1(json.dumps([self.workdir_fingerprint, cmd]).encode()).hexdigest()
+        if (
+            self.workdir_fingerprint
+            and (build_dir / "CMakeCache.txt").is_file()
+            and stamp_path.is_file()
+            and stamp_path.read_text(encoding="utf8") == stamp
+        ):
+            self.info(
+                "Build folder %s is already configured, skipping '%s' command",
+                build_dir.as_posix(),
+                kwargs.get("cmd_name", cmd[0]),
+            )
+            return None
+        stamp_path.unlink(missing_ok=True)
+        cmd_out = self._subprocess_run(cmd, **kwargs)
+        if cmd_out and self.workdir_fingerprint:
+            stamp_path.write_text(stamp, encoding="utf8")
+        return cmd_out
+
+    def publish_outputs(self, sources: dict, output_dir: Path, excluded: tuple = ()):
+        """Replace atomically an output folder with folders generated in the build folder
+
+        The new output is prepared in a staging folder next to output_dir, then swapped with
+        the previous output, so that output_dir is never seen half written. The generated
+        folders are moved into the staging folder if the build folder is temporary and on the
+        same file system, and copied otherwise.
+
+        Args:
+            sources (dict): {path relative to output_dir: generated folder}
+            output_dir (Path): output folder
+            excluded (tuple): glob patterns of the generated files which are not published
+        """
+        output_dir = Path(output_dir)
+        # Staging folders left by an interrupted run are collected as tombstones
+        staging_dir = output_dir.parent / (
+            f"{TOMBSTONE_PREFIX}{output_dir.name}-staging-{uuid.uuid4().hex[:8]}"
+        )
+        for rel_path, source_dir in sources.items():
+            dst_dir = staging_dir / rel_path
+            dst_dir.parent.mkdir(parents=True, exist_ok=True)
+            # Outputs of a kept build folder are needed by the next make calls
+            moved = False
+            if isinstance(self._tmp_dir, TemporaryDirectory):
+                try:
+                    os.rename(source_dir, dst_dir)
+                    moved = True
+                except OSError as error:
+                    if error.errno != errno.EXDEV:
+                        raise
+            if moved:
+                for path in [_ for _ in dst_dir.rglob("*") if _.is_file()]:
+                    if any(
+                        fnmatchcase(path.relative_to(dst_dir).as_posix(), pattern)
+                        for pattern in excluded
+                    ):
+                        path.unlink()
+            else:
+                materialize_tree(
+                    source_dir,
+                    dst_dir,
+                    methods=("reflink", "copy"),
+                    excluded=excluded,
+                    workers=self.default_config.getint(
+                        self.GENIAC_WORKDIR, "copyWorkers", fallback=1
+                    ),
+                )
+
+        if not output_dir.exists():
+            os.rename(staging_dir, output_dir)
+            return
+        try:
+            exchange_paths(staging_dir, output_dir)
+        except OSError as error:
+            self.debug("Unable to swap %s with its new content: %s", output_dir, error)
+            previous_dir = self.cleaner.bury(output_dir)
+            if previous_dir is None:
+                self.cleaner.remove(output_dir)
+            os.rename(staging_dir, output_dir)
+        else:
+            previous_dir = staging_dir
+        if previous_dir is not None:
+            self.cleaner.remove(previous_dir)
+        self.info("The folder '%s' has been replaced with the new outputs.", output_dir.as_posix())
+
     @abstractmethod
     def run(self):
         """Main entry point for every geniac sub command"""
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""batch.py: Lint several Nextflow projects in one geniac process"""
+
+import io
+import logging
+import multiprocessing
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from itertools import repeat
+from pathlib import Path
+
+import geniac.cli.utils.errorcounter
+from geniac.cli.commands.lint import GeniacLint
+from geniac.cli.utils.base import GeniacBase, read_default_config
+from geniac.cli.utils.diagnostics import Diagnostic, DiagnosticsHandler
+from geniac.cli.utils.logging import ExitOnExceptionHandler, LogMixin, RecordCollector
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+def lint_project(src_path: str, lint_kwargs: dict, lint: GeniacLint = None) -> tuple:
+    """Lint a project and capture what is written on the console and the standard output
+
+    Args:
+        src_path (str): path to the Nextflow project
+        lint_kwargs (dict): options passed to the lint command
+        lint (GeniacLint): lint command already created for the project, used instead of a new
+            one
+
+    Returns:
+        src_path (str): path to the Nextflow project
+        status (int): exit status of the lint
+        output (str): console output of the lint
+        records (list): records saved by a RecordCollector during the lint
+    """
+    output = io.StringIO()
+    handlers = [
+        handler
+        for handler in logging.getLogger().handlers
+        if isinstance(handler, ExitOnExceptionHandler)
+    ]
+    streams = [handler.setStream(output) for handler in handlers]
+    geniac.cli.utils.errorcounter.error_counter = 0
+    status = 0
+    collector = RecordCollector()
+    try:
+        with collector, redirect_stdout(output):
+            (lint or GeniacLint(src_path, **lint_kwargs)).run()
+    except SystemExit as exit_error:
+        status = exit_error.code or 0
+    except Exception:  # pylint: disable=broad-except
+        # A crash on a project should not stop the lint of the others
+        output.write(traceback.format_exc())
+        status = 1
+    finally:
+        for handler, stream in zip(handlers, streams):
+            handler.setStream(stream)
+    if not status and geniac.cli.utils.errorcounter.error_counter > 0:
+        status = 1
+    geniac.cli.utils.errorcounter.error_counter = 0
+    return src_path, status, output.getvalue(), collector.records
+
+
+class GeniacLintBatch(LogMixin):
+    """Lint several projects with a pool of worker processes
+
+    Workers are forked once and lint several projects each, sharing the geniac.ini snapshot,
+    the compiled regexes, the parsed files and the conda search results between projects.
+    """
+
+    def __init__(
+        self,
+        projects: list = None,
+        projects_file: str = None,
+        jobs: int = None,
+        diagnostics_jsonl: str = None,
+        sarif: str = None,
+        **kwargs,
+    ):
+        """
+
+        Args:
+            projects (list): paths to the Nextflow projects
+            projects_file (str): manifest file listing the paths to the Nextflow projects
+            jobs (int): number of worker processes
+            diagnostics_jsonl (str): JSON Lines output of the diagnostics of every project
+            sarif (str): SARIF output of the diagnostics of every project
+        """
+        super().__init__()
+        self.projects = [str(project) for project in projects or []]
+        if projects_file:
+            self.projects += self.read_projects_file(projects_file)
+        self.jobs = max(1, jobs or min(len(self.projects), os.cpu_count() or 1))
+        # Diagnostics are sent by the workers with their results
+        self.diagnostics = DiagnosticsHandler.from_options(
+            diagnostics_jsonl, sarif, logger_name=None
+        )
+        self.lint_kwargs = {
+            option: value
+            for option, value in kwargs.items()
+            if option not in ("src_path", "func", "parser")
+        }
+
+    @staticmethod
+    def read_projects_file(projects_file: str) -> list:
+        """Read a manifest with one project path per line
+
+        Empty lines and lines starting with # are skipped. Relative paths are relative to the
+        folder of the manifest.
+        """
+        projects_file = Path(projects_file)
+        projects = []
+        with projects_file.open(encoding="utf8") as manifest:
+            for line in manifest:
+                if not (line := line.strip()) or line.startswith("#"):
+                    continue
+                project = Path(line).expanduser()
+                if not project.is_absolute():
+                    project = projects_file.parent / project
+                projects.append(str(project))
+        return projects
+
+    def run(self):
+        """Lint every project and report their diagnostics separately"""
+        if not self.projects:
+            self.critical("No project to lint.")
+        # Load shared data before forking so that workers inherit it
+        read_default_config(*GeniacBase.DEFAULT_CONFIG)
+
+        executor = None
+        if self.jobs > 1 and "fork" in multiprocessing.get_all_start_methods():
+            executor = ProcessPoolExecutor(
+                self.jobs, mp_context=multiprocessing.get_context("fork")
+            )
+            results = executor.map(lint_project, self.projects, repeat(self.lint_kwargs))
+        else:
+            results = map(lint_project, self.projects, repeat(self.lint_kwargs))
+
+        failed = []
+        try:
+            with self.diagnostics:
+                # Diagnostics are written on stderr if stdout is used for JSON Lines
+                console = sys.stderr if self.diagnostics.moved_handlers else sys.stdout
+                for src_path, status, output, records in results:
+                    console.write(f"==> {src_path} <==\n{output}")
+                    console.write(f"Exit status: {status}\n\n")
+                    console.flush()
+                    for levelno, _, message, rule, file, line in records:
+                        self.diagnostics.write(
+                            Diagnostic(
+                                rule, logging.getLevelName(levelno).lower(), file, line, message
+                            )
+                        )
+                    if status:
+                        failed.append(src_path)
+        finally:
+            if executor:
+                executor.shutdown()
+
+        if failed:
+            self.error(
+                "Lint failed for %s of the %s projects: %s",
+                len(failed),
+                len(self.projects),
+                ", ".join(failed),
+            )
+            raise SystemExit(1)
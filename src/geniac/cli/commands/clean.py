@@ -1,15 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-"""options.py: Geniac CMake option class"""
+"""clean.py: Geniac clean command"""
 
 import logging
-import re
-import shutil
-import os
-from pathlib import Path
 
-from geniac.cli.commands.init import GeniacInit
+from geniac.cli.commands.base import GeniacCommand
+from geniac.cli.utils.cleanup import disk_usage, format_size
 
 __author__ = "Fabrice Allain"
 __copyright__ = "Institut Curie 2020"
@@ -17,28 +14,105 @@ __copyright__ = "Institut Curie 2020"
 _logger = logging.getLogger(__name__)
 
 
-class GeniacClean(GeniacInit):
-    """Geniac CMake Recipes class"""
+class GeniacClean(GeniacCommand):
+    """Geniac working directory cleaner
+
+    The build folder of an existing working directory is cleaned in place, without copying the
+    project first.
+    """
+
+    # Options of geniac.clean section listing the build files removed by each selection
+    CLEAN_TARGETS = ("images", "work", "cmakeCache")
 
     def __init__(
         self,
         *args,
         src_path: str = None,
+        images: bool = False,
+        work: bool = False,
+        cmake_cache: bool = False,
+        dry_run: bool = False,
         **kwargs,
     ):
-        """Init flags specific to GRecipes command"""
-        super().__init__(
-            *args, src_path=src_path, post_clean=True, init_build=False, **kwargs
+        """
+
+        Args:
+            src_path (str): path to a geniac working directory
+            images (bool): only remove the container images
+            work (bool): only remove the Nextflow work folders
+            cmake_cache (bool): only remove the CMake cache
+            dry_run (bool): only report the space which would be reclaimed
+        """
+        super().__init__(*args, src_path=src_path, **kwargs)
+        self.targets = [
+            target
+            for target, selected in zip(self.CLEAN_TARGETS, (images, work, cmake_cache))
+            if selected
+        ]
+        self.dry_run = dry_run
+
+    def _target_paths(self, target: str) -> list:
+        """Paths of the build folder matching the patterns of a clean target"""
+        return sorted(
+            {
+                path
+                for pattern in self.default_config.get(
+                    self.config_section, target, fallback=""
+                ).split()
+                for path in self.working_dirs["build"].glob(pattern)
+            }
         )
 
     def clean_build(self):
-        """Clean build directory"""
+        """Clean build directory, or only the selected targets, and report the space reclaimed"""
+        build_dir = self.working_dirs["build"]
+        if not (self.project_type == "wd" or self.working_dir_is_valid) or not (
+            self.working_dirs["cache"].is_dir() and build_dir.is_dir()
+        ):
+            self.error(
+                "The folder '%s' is not a geniac working directory with a build folder.",
+                self.working_dir.as_posix()
+                if self.working_dir_is_valid
+                else str(self.src_path),
+            )
+            return
+        # Finish the removals interrupted by previous runs
+        self.cleaner.collect(self.working_dir)
 
-        build_dir = self.working_dirs["build"].as_posix()
-        if os.path.isdir(build_dir):
-            shutil.rmtree(build_dir)
-            os.mkdir(build_dir)
-            self.info("The folder '%s' has been cleaned.", build_dir)
+        selection = (
+            {target: self._target_paths(target) for target in self.targets}
+            if self.targets
+            else {"build": list(build_dir.iterdir())}
+        )
+        reclaimed = 0
+        for target, paths in selection.items():
+            size = sum(disk_usage(path) for path in paths)
+            reclaimed += size
+            self.info(
+                "%s: %s path(s), %s%s",
+                target,
+                len(paths),
+                format_size(size),
+                " (dry run)" if self.dry_run else "",
+            )
+            if self.dry_run:
+                continue
+            if target == "build":
+                self.cleaner.remove(build_dir, recreate=True)
+            else:
+                self.cleaner.remove(*paths)
+        if self.dry_run:
+            self.info(
+                "Cleaning the folder '%s' would reclaim %s.",
+                build_dir.as_posix(),
+                format_size(reclaimed),
+            )
+        else:
+            self.info(
+                "The folder '%s' has been cleaned, %s reclaimed.",
+                build_dir.as_posix(),
+                format_size(reclaimed),
+            )
 
     def run(self):
         """
@@ -5,7 +5,6 @@
 
 import logging
 import re
-import shutil
 import os
 from pathlib import Path
 
@@ -35,7 +34,7 @@ class GeniacConfigs(GeniacInit):
         """Generate config files"""
 
         cmake_run = (
-            self._subprocess_run(
+            self._cmake_configure(
                 ["cmake", "-DCMAKE_INSTALL_PREFIX=" + (self.working_dirs["src"]).as_posix() + "/../.install", (self.working_dirs["src"] / "geniac").as_posix()],
                 check=True,
                 capture_output=True,
@@ -59,11 +58,12 @@ class GeniacConfigs(GeniacInit):
         )
         output_dir = Path(self.working_dirs["build"].as_posix() + "/../configs").as_posix()
         output_dir = os.path.realpath(output_dir)
-        if os.path.isdir(output_dir):
-            shutil.rmtree(output_dir)
-            self.info("The folder '%s' has been deleted and will be reinitialized.", output_dir)
 
-        shutil.copytree((self.working_dirs["build"]).as_posix() + "/workDir/results/conf/", output_dir, ignore=shutil.ignore_patterns("*.txt"))
+        self.publish_outputs(
+            {".": self.working_dirs["build"] / "workDir" / "results" / "conf"},
+            output_dir,
+            excluded=("*.txt",),
+        )
         self.info("The '%s' folder has been created with the config files generated by geniac.", output_dir)
 
     def run(self):
@@ -0,0 +1,339 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""daemon.py: Resident geniac process serving lint requests over a Unix socket"""
+
+import hashlib
+import json
+import logging
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from geniac import __version__
+from geniac.cli.commands.base import GeniacCommand
+from geniac.cli.commands.batch import lint_project
+from geniac.cli.commands.lint import GeniacLint
+from geniac.cli.utils.diagnostics import Diagnostic, DiagnosticsHandler
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+# Unix socket paths longer than this limit are not supported on every platform
+SOCKET_PATH_MAX_LENGTH = 100
+
+
+def daemon_socket_path(cache_dir: Path, src_path: str) -> Path:
+    """Path of the Unix socket of the daemon serving a project
+
+    The socket is created in the geniac cache directory, or in the temporary directory if the
+    resulting path is too long for a Unix socket.
+    """
+    key = hashlib.sha1(str(Path(src_path).resolve()).encode()).hexdigest()[:16]
+    path = Path(cache_dir) / "daemon" / f"lint-{key}.sock"
+    if len(str(path)) > SOCKET_PATH_MAX_LENGTH:
+        path = Path(tempfile.gettempdir()) / f"geniac-{os.getuid()}" / f"lint-{key}.sock"
+    return path
+
+
+def send_request(socket_path: Path, request: dict, timeout: float = None) -> dict:
+    """Send a JSON request to a daemon and return its JSON response"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(str(socket_path))
+        with client.makefile("rwb") as stream:
+            stream.write(json.dumps(request).encode() + b"\n")
+            stream.flush()
+            response = stream.readline()
+    if not response:
+        raise ConnectionError(f"No response from the geniac daemon {socket_path}")
+    return json.loads(response)
+
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """Read one JSON request per connection and write the JSON response"""
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError as error:
+            response = {"error": f"Invalid request: {error}"}
+        else:
+            response = self.server.geniac_daemon.handle(request)
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class GeniacDaemon(GeniacCommand):
+    """Keep a geniac process running for a project and lint it on request
+
+    Modules, the geniac configuration, the parsed files and the caches stay loaded between
+    requests. The lint of each project is kept with the fingerprint of its inputs, so that its
+    result is returned again as long as the project files do not change. Requests are served
+    one at a time. The daemon stops once it has been idle for idleTimeout seconds.
+    """
+
+    # Maximum number of lints kept between requests
+    WARM_LINTS_MAX = 8
+
+    def __init__(self, *args, stop: bool = False, **kwargs):
+        """
+
+        Args:
+            stop (bool): stop the running daemon of the project instead of starting one
+        """
+        kwargs.setdefault("config_section", "geniac.daemon")
+        super().__init__(*args, **kwargs)
+        self._stop = stop
+        self._stopped = False
+        self._lints = OrderedDict()
+        self.requests = 0
+
+    @property
+    def socket_path(self) -> Path:
+        """Unix socket of the daemon of the project"""
+        return daemon_socket_path(self.cache_dir, self.src_path)
+
+    def is_running(self) -> bool:
+        """Check if a daemon answers on the socket of the project"""
+        try:
+            return bool(send_request(self.socket_path, {"command": "ping"}, timeout=5))
+        except (OSError, ValueError):
+            return False
+
+    def handle(self, request: dict) -> dict:
+        """Answer a request sent to the daemon"""
+        command = request.get("command")
+        if command == "ping":
+            return {"version": __version__, "pid": os.getpid(), "requests": self.requests}
+        if command == "stop":
+            self._stopped = True
+            return {"stopped": True}
+        if command != "lint":
+            return {"error": f"Unknown command {command}"}
+        if request.get("version") != __version__:
+            # Modules loaded by the daemon are outdated, a new one should be started
+            self._stopped = True
+            return {"error": f"geniac daemon version {__version__} differs from client"}
+        self.requests += 1
+        src_path = request.get("src_path", str(self.src_path))
+        options = request.get("options", {})
+        root_logger = logging.getLogger()
+        levels = [root_logger.level] + [handler.level for handler in root_logger.handlers]
+        log_level = options.pop("log_level", None) or logging.WARNING
+        root_logger.setLevel(log_level)
+        for handler in root_logger.handlers:
+            handler.setLevel(log_level)
+        try:
+            return self._lint(src_path, options, log_level)
+        finally:
+            root_logger.setLevel(levels[0])
+            for handler, level in zip(root_logger.handlers, levels[1:]):
+                handler.setLevel(level)
+
+    def _lint(self, src_path: str, options: dict, log_level) -> dict:
+        """Lint a project unless the lint kept for the same options has unchanged inputs"""
+        key = json.dumps([str(Path(src_path).resolve()), options, log_level], sort_keys=True)
+        warm = self._lints.pop(key, None)
+        lint = warm["lint"] if warm is not None else GeniacLint(src_path, **options)
+        state = None
+        # Staged files and git revisions are read from git objects which are not fingerprinted
+        if not options.get("staged") and not options.get("rev") and lint.result_cacheable:
+            fingerprint, manifest = lint.inputs_fingerprint(warm["manifest"] if warm else None)
+            state = {
+                "fingerprint": fingerprint,
+                "manifest": manifest,
+                "config": self._config_stat(options.get("config_file")),
+            }
+            if (
+                warm is not None
+                and (warm["fingerprint"], warm["config"]) == (fingerprint, state["config"])
+                and time.time() < warm["expires"]
+            ):
+                self.debug("Inputs of %s unchanged, reusing its lint result.", src_path)
+                self._lints[key] = warm
+                return warm["response"]
+        if warm is not None:
+            # The project changed since the lint kept in memory
+            lint = GeniacLint(src_path, **options)
+        _, status, output, records = lint_project(src_path, options, lint=lint)
+        response = {"status": status, "output": output, "records": records}
+        if state is not None:
+            config, expires = lint.default_config, float("inf")
+            if config.getboolean(lint.GENIAC_PARAMS, "refreshCondaCache", fallback=False):
+                expires = 0
+            elif config.getboolean(lint.GENIAC_PARAMS, "condaCheck", fallback=False):
+                # A conda check with a negative result should be run again later
+                expires = time.time() + config.getfloat(
+                    lint.GENIAC_PARAMS, "condaCacheNegativeTtl", fallback=86400
+                )
+            self._lints[key] = {**state, "lint": lint, "expires": expires, "response": response}
+            while len(self._lints) > self.WARM_LINTS_MAX:
+                self._lints.popitem(last=False)
+        return response
+
+    @staticmethod
+    def _config_stat(config_file: str) -> list:
+        """Size and modification time of the configuration file of a lint, if any"""
+        try:
+            stat = os.stat(config_file)
+        except (OSError, TypeError):
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def serve(self):
+        """Serve requests until the daemon is stopped or idle"""
+        socket_path = self.socket_path
+        if socket_path.exists():
+            if self.is_running():
+                self.info("A geniac daemon is already running on %s.", socket_path)
+                return
+            # Left by a daemon which has been killed
+            socket_path.unlink()
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # The socket is only accessible to the user from its creation
+        umask = os.umask(0o077)
+        try:
+            server = socketserver.UnixStreamServer(str(socket_path), _DaemonRequestHandler)
+        finally:
+            os.umask(umask)
+        with server:
+            server.geniac_daemon = self
+            server.timeout = self.default_config.getfloat(
+                self.config_section, "idleTimeout", fallback=1800
+            )
+            server.handle_timeout = self._idle
+            self.info("geniac daemon listening on %s.", socket_path)
+            try:
+                while not self._stopped:
+                    server.handle_request()
+            finally:
+                socket_path.unlink(missing_ok=True)
+        self.info("geniac daemon stopped after %s lint request(s).", self.requests)
+
+    def _idle(self):
+        """Stop the daemon when no request has been received during idleTimeout"""
+        self.info("geniac daemon idle, stopping.")
+        self._stopped = True
+
+    def run(self):
+        """Start the daemon or stop the running one"""
+        if not self._stop:
+            self.serve()
+            return
+        try:
+            send_request(self.socket_path, {"command": "stop"}, timeout=5)
+        except (OSError, ValueError):
+            self.info("No geniac daemon is running for %s.", self.src_path)
+        else:
+            self.info("geniac daemon of %s stopped.", self.src_path)
+
+
+class GeniacLintClient(GeniacDaemon):
+    """Send a lint request to the daemon of the project, starting it if needed
+
+    The lint is run in the current process if the daemon cannot be reached.
+    """
+
+    # Options of the client which are not sent to the daemon
+    CLIENT_OPTIONS = (
+        "func", "parser", "which", "daemon", "only_stream", "diagnostics_jsonl", "sarif",
+    )
+    # Options given as paths relative to the current directory
+    PATH_OPTIONS = ("config_file", "profile_json")
+
+    def __init__(self, *args, diagnostics_jsonl: str = None, sarif: str = None, **kwargs):
+        """
+
+        Args:
+            diagnostics_jsonl (str): JSON Lines output of the diagnostics
+            sarif (str): SARIF output of the diagnostics
+        """
+        super().__init__(*args, **kwargs)
+        self._diagnostics_jsonl = diagnostics_jsonl
+        self._sarif = sarif
+        self.lint_kwargs = {
+            option: str(Path(value).resolve()) if option in self.PATH_OPTIONS and value else value
+            for option, value in kwargs.items()
+            if option not in self.CLIENT_OPTIONS + ("src_path",)
+        }
+
+    def start_daemon(self) -> bool:
+        """Start a daemon in the background and wait until it answers"""
+        cmd = [sys.executable, "-m", "geniac.cli", "--no-logfiles"]
+        if config_file := self.lint_kwargs.get("config_file"):
+            cmd += ["-c", config_file]
+        cmd += ["daemon", str(Path(self.src_path).resolve())]
+        self.debug("Starting geniac daemon: %s", " ".join(cmd))
+        subprocess.Popen(  # pylint: disable=consider-using-with
+            cmd,
+            cwd=self.src_path,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        timeout = self.default_config.getfloat(self.config_section, "startTimeout", fallback=10)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.is_running():
+                return True
+            time.sleep(0.05)
+        return False
+
+    def _request_lint(self) -> dict:
+        """Send the lint request, starting a daemon if none is running"""
+        request = {
+            "command": "lint",
+            "version": __version__,
+            "src_path": str(Path(self.src_path).resolve()),
+            "options": self.lint_kwargs,
+        }
+        for attempt in range(2):
+            try:
+                response = send_request(self.socket_path, request)
+            except (OSError, ValueError) as error:
+                self.debug("geniac daemon not reachable: %s", error)
+            else:
+                if "error" not in response:
+                    return response
+                self.debug("geniac daemon error: %s", response["error"])
+                # Wait for the outdated daemon to release its socket
+                deadline = time.monotonic() + 5
+                while self.socket_path.exists() and time.monotonic() < deadline:
+                    time.sleep(0.05)
+            if attempt or not self.start_daemon():
+                break
+        return None
+
+    def run(self):
+        """Lint the project with the daemon and report the result"""
+        if (response := self._request_lint()) is None:
+            self.warning("Unable to reach a geniac daemon, running the lint in this process.")
+            GeniacLint(
+                self.src_path,
+                diagnostics_jsonl=self._diagnostics_jsonl,
+                sarif=self._sarif,
+                **self.lint_kwargs,
+            ).run()
+            return
+
+        with DiagnosticsHandler.from_options(
+            self._diagnostics_jsonl, self._sarif, logger_name=None
+        ) as diagnostics:
+            # Diagnostics are written on stderr if stdout is used for JSON Lines
+            console = sys.stderr if self._diagnostics_jsonl == "-" else sys.stdout
+            console.write(response["output"])
+            console.flush()
+            for levelno, _, message, rule, file, line in response["records"]:
+                diagnostics.write(
+                    Diagnostic(rule, logging.getLevelName(levelno).lower(), file, line, message)
+                )
+        if response["status"]:
+            raise SystemExit(response["status"])
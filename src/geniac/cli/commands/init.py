@@ -40,7 +40,7 @@ class GeniacInit(GeniacCommand):
 
     def init_build_folder(self):
         """Call cmake without options into the build folder"""
-        self._subprocess_run(
+        self._cmake_configure(
             ["cmake", (self.working_dirs["src"] / "geniac").as_posix()],
             check=True,
             cwd=self.working_dirs["build"],
@@ -76,4 +76,5 @@ class GeniacInit(GeniacCommand):
     def __exit__(self, *args):
         """Delete temporary folder if it has been correctly initialized and post_clean flag"""
         if self._tmp_dir and self.post_clean:
+            self.cleaner.remove(self._tmp_dir.name)
             self._tmp_dir.cleanup()
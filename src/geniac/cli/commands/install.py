@@ -213,7 +213,7 @@ class GeniacInstall(GeniacInit):
 
     def build(self):
         """Launch CMake build command with cmake options inferred from mode"""
-        self._subprocess_run(
+        self._cmake_configure(
             f'cmake {(self.working_dirs["src"] / "geniac").as_posix()} '
             f"-DCMAKE_INSTALL_PREFIX={self.install_path.as_posix()} "
             f"{' '.join(self.cmake_options)}".split(),
@@ -3,57 +3,202 @@
 
 """check.py: Linter command for geniac"""
 
-import re
+import hashlib
 import os
-import subprocess
+import sys
 from collections import OrderedDict
+from contextlib import closing, contextmanager
+from fnmatch import fnmatchcase
 from inspect import getfullargspec
 from pathlib import Path
-from shutil import which
+from typing import NamedTuple
 import yaml
-from yaml.loader import SafeLoader
 
 from geniac.cli.commands.base import GeniacCommand
 from geniac.cli.parsers.base import DEFAULT_ENCODING
 from geniac.cli.parsers.config import NextflowConfig, NextflowConfigContainer
 from geniac.cli.parsers.scripts import NextflowScript
+from geniac import __version__
+from geniac.cli.utils.cache import GeniacCache, fingerprint_files, iter_files
+from geniac.cli.utils.conda import (
+    CondaRecipeChecker,
+    RepodataIndex,
+    load_conda_env,
+    split_repodata_source,
+)
+from geniac.cli.utils.diagnostics import (
+    DiagnosticsHandler,
+    ErrorBudgetExceeded,
+    disabled_rules,
+    error_budget,
+    rule_context,
+    rule_enabled,
+)
+from geniac.cli.utils.labels import LabelIndex
+from geniac.cli.utils.logging import RecordCollector
+from geniac.cli.utils.profiler import LintProfiler, ProfiledPattern, profile_count
+from geniac.cli.utils.vfs import GitIndexTree, GitRevisionTree, LocalTree
 
 __author__ = "Fabrice Allain"
 __copyright__ = "Institut Curie 2025"
 
 
+class LintRule(NamedTuple):
+    """Lint rule registered in GeniacLint
+
+    Attributes:
+        rule_id (str): identifier used with --select and --ignore
+        description (str): what the rule checks
+        phases (tuple): project parsing phases the rule needs
+        cost (str): cost class among GeniacLint.COST_CLASSES
+        check (str): GeniacLint method checking the rule once its phases are loaded (None if the
+            rule is checked while its phases are parsed)
+    """
+
+    rule_id: str
+    description: str
+    phases: tuple = ()
+    cost: str = "cheap"
+    check: str = None
+
+
 class GeniacLint(GeniacCommand):
     """Linter command for geniac"""
 
+    # Cost classes of the lint rules, from the cheapest to the most expensive
+    COST_CLASSES = ("cheap", "parse", "io", "subprocess")
+    # Project parsing phases with their method and the rule reporting their findings
+    PHASES = OrderedDict(
+        (
+            ("workflow", ("get_processes_from_workflow", "workflow-scripts")),
+            ("configs", ("get_labels_from_config_files", "config-files")),
+            ("folders", ("get_labels_from_folders", "dependencies")),
+        )
+    )
+    # Registered lint rules, checked by cost class and then in this order
+    RULES = (
+        LintRule(
+            "tree-structure",
+            "Required folders and files of the project exist",
+            check="check_tree_folder",
+        ),
+        LintRule(
+            "workflow-scripts",
+            "Workflow scripts exist and every process has a label",
+            ("workflow",),
+            "parse",
+        ),
+        LintRule(
+            "config-files",
+            "Nextflow config files exist, are included and define valid parameters",
+            ("workflow", "configs"),
+            "parse",
+        ),
+        LintRule(
+            "conda-pattern",
+            "Conda recipes and environment files in params.geniac.tools follow geniac patterns",
+            ("configs",),
+            "parse",
+        ),
+        LintRule(
+            "conda-availability",
+            "Conda recipes exist on the conda channels (with --conda-check)",
+            ("configs",),
+            "subprocess",
+            check="check_conda_availability",
+        ),
+        LintRule(
+            "renv-init",
+            "renv labels define their scopes and are initialized with a renvInit process",
+            ("workflow", "configs"),
+            "io",
+        ),
+        LintRule(
+            "module-cmake",
+            "Modules are built and installed with CMake directives",
+            ("folders",),
+            "io",
+        ),
+        LintRule(
+            "dependencies",
+            "Dependencies are located in a tool folder and used in container recipes",
+            ("folders",),
+            "io",
+        ),
+        LintRule(
+            "env-sourcing",
+            "Environment files match a label and are sourced by the related processes",
+            ("workflow", "configs", "folders"),
+        ),
+        LintRule(
+            "process-labels",
+            "Process labels correspond to a tool and every tool is used",
+            ("workflow", "configs", "folders"),
+            check="check_labels",
+        ),
+        LintRule(
+            "extra-sections",
+            "Labels in the extra sections of geniac.config correspond to a tool",
+            ("configs", "folders"),
+            check="check_extra_section_geniac_config",
+        ),
+        LintRule(
+            "container-labels",
+            "Container recipes generated by geniac are not in the repository",
+            ("configs", "folders"),
+            check="check_labels_containers",
+        ),
+        LintRule(
+            "renv-labels",
+            "Labels starting with renv are only used for renv tools",
+            ("configs", "folders"),
+            check="check_labels_renv",
+        ),
+        LintRule(
+            "conda-labels",
+            "Conda recipes used in the workflow are declared in geniac.config",
+            ("workflow", "configs", "folders"),
+            check="check_labels_conda_geniac",
+        ),
+    )
+    # Rules reporting the checks of the geniac directories
+    FOLDER_RULES = {"modules": "module-cmake", "env": "env-sourcing"}
+
     # REGEX check if a string is a valid conda recipe
-    CONDA_RECIPES_RE = re.compile(
+    CONDA_RECIPES_RE = ProfiledPattern(
         r"(?P<recipes>(([\w-]+::[.\w-]+=[^=]+=[\w]+) ?)+)"
     )
     # REGEX check if a string from a yml recipe is valid
-    CONDA_YML_RECIPES_RE = re.compile(
+    CONDA_YML_RECIPES_RE = ProfiledPattern(
         r"(?P<recipes>(([.\w-]+=[^=]+=[\w]+|[\w-]+::[.\w-]+=[^=]+=[\w]+) ?)+)"
     )
     # REGEX check if a string from a yml recipe with pip is valid
-    CONDA_YML_PIP_RECIPES_RE = re.compile(
+    CONDA_YML_PIP_RECIPES_RE = ProfiledPattern(
         r"(?P<recipes>([.\w-]+==[\d.]))"
     )
     # REGEX to check if a string is a path for yml or yaml file
-    CONDA_PATH_RE = re.compile(
+    CONDA_PATH_RE = ProfiledPattern(
         #r"(?P<nxfvar>\${(baseDir|projectDir)})/(?P<basepath>[/\w]+\.(?P<ext>yml|yaml))"
         r"(?P<nxfvar>\${(baseDir|projectDir)})/(?P<basepath>.+\.(?P<ext>yml|yaml))"
     )
     # REGEX to check if a string is a path for renv.lock file
-    RENV_LOCKFILE_PATH_RE = re.compile(
+    RENV_LOCKFILE_PATH_RE = ProfiledPattern(
         r"(?P<nxfvar>\${(baseDir|projectDir)})/(?P<basepath>[/\w]+\.(?P<ext>lock))"
     )
+    # REGEX to check if a label uses information from another label recipe
+    LABEL_USED_BY_A_LABEL_RE = ProfiledPattern(
+        r"\s*\$\{params\.geniac\.tools\.(?P<usedLabel>.+)\}\s*"
+    )
+    # REGEX to check if a label is reserved to tools with R and renv
+    RENV_LABEL_RE = ProfiledPattern(r"^renv.*")
     # REGEX to check if install cmake directive has been correctly added in the main CMakeLists.txt
-    INSTALL_MAIN_CMAKE_RE = re.compile(
+    INSTALL_MAIN_CMAKE_RE = ProfiledPattern(
         r"install\([\s\w_${}\-/=]*DESTINATION +"
         r"(?P<destination>\${CMAKE_INSTALL_PREFIX}/\${pipeline_dir}/bin/fromSource)[\s)]"
     )
     # REGEX to check if install cmake directive has been correctly added in the
     # module CMakeLists.txt
-    INSTALL_MODULE_CMAKE_RE = re.compile(
+    INSTALL_MODULE_CMAKE_RE = ProfiledPattern(
         r"install\s*\([\s\w_${}\-/=]*DESTINATION +[\s\w_${}\-/=]*\)"
     )
     # REGEX to check if ExternalProject cmake directive has been correctly added in the main
@@ -81,10 +226,40 @@ class GeniacLint(GeniacCommand):
     GENIAC_CONFIG_FILES = "geniac.lint.generated.config"
     GENIAC_CHECK_CONFIG = "geniac.lint.expected.config"
 
-    def __init__(self, src_path, *args, **kwargs):
-        """Init flags specific to GCheck command"""
+    # Cache key prefix of the lint results
+    RESULT_CACHE_PREFIX = "lint.result:"
+
+    def __init__(
+        self,
+        src_path,
+        *args,
+        no_result_cache: bool = False,
+        diagnostics_jsonl: str = None,
+        sarif: str = None,
+        profile: bool = False,
+        profile_json: str = None,
+        documents: dict = None,
+        staged: bool = False,
+        rev: str = None,
+        **kwargs,
+    ):
+        """Init flags specific to GCheck command
+
+        Args:
+            documents (dict): text of the workflow and config files edited but not saved, by path
+            staged (bool): lint the files staged in the git index and only the related rules
+            rev (str): lint the files of a git revision without checking it out
+        """
         super().__init__(*args, src_path=src_path, **kwargs)
-        self._project_tree = self._format_tree_config()
+        self.documents = documents if documents is not None else {}
+        self._staged = staged
+        self._rev = rev
+        self._project_tree = None
+        self._no_result_cache = no_result_cache
+        self._diagnostics_jsonl = diagnostics_jsonl
+        self._sarif = sarif
+        self._profile_json = profile_json
+        self.profiler = LintProfiler(enabled=profile or bool(profile_json))
         self._labels_from_folders = OrderedDict()
         self._labels_from_configs = OrderedDict()
         self._processes_from_workflow = OrderedDict()
@@ -93,13 +268,45 @@ class GeniacLint(GeniacCommand):
         self._renvinitinclude_from_workflow = OrderedDict()
         self._labels_from_workflow = []
         self._labels_all = []
+        self._labels_index = None
+        self._parse_cache = None
+        self._conda_checker = None
         self._nxf_config_container = NextflowConfigContainer()
 
+    @property
+    def tree(self):
+        """View of the project files read by the linter"""
+        if self._tree is None:
+            if self._staged and self._rev:
+                self.critical("Options --staged and --rev cannot be used together.")
+            if self._rev:
+                try:
+                    self._tree = GitRevisionTree(self.src_path, self._rev)
+                except ValueError as error:
+                    self.critical("Unable to read git revision %s: %s.", self._rev, error)
+            elif self._staged:
+                try:
+                    self._tree = GitIndexTree(self.src_path)
+                except ValueError as error:
+                    self.critical("Option --staged requires a git repository: %s.", error)
+            else:
+                self._tree = LocalTree(self.src_path)
+        return self._tree
+
     @property
     def project_tree(self):
         """Formatted tree configuration"""
+        if self._project_tree is None:
+            self._project_tree = self._format_tree_config()
         return self._project_tree
 
+    @property
+    def parse_cache(self):
+        """Persistent cache of parsed files"""
+        if self._parse_cache is None:
+            self._parse_cache = GeniacCache.shared(self.cache_dir / "parse.json")
+        return self._parse_cache
+
     @property
     def nxf_config_container(self):
         """Namespace for Nextflow configuration files"""
@@ -181,6 +388,13 @@ class GeniacLint(GeniacCommand):
             )
         return self._labels_all
 
+    @property
+    def labels_index(self):
+        """Prefix index built once from all the labels"""
+        if self._labels_index is None:
+            self._labels_index = LabelIndex(self.labels_all)
+        return self._labels_index
+
     def _get_current_files(self, config_tree: dict, tree_section: str):
         """
         Get current file list from a specific section
@@ -204,11 +418,11 @@ class GeniacLint(GeniacCommand):
             sorted(
                 [
                     _
-                    for _ in dir_path.glob("**/*" if recursive_flag else "*")
-                    if _ not in excluded_files and not _.is_dir()
+                    for _ in self.tree.glob(dir_path, "**/*" if recursive_flag else "*")
+                    if _ not in excluded_files and not self.tree.is_dir(_)
                 ]
             )
-            if dir_path.exists()
+            if self.tree.exists(dir_path)
             else ()
         )
 
@@ -345,7 +559,7 @@ class GeniacLint(GeniacCommand):
                     if self.src_path.is_relative_to(Path.cwd())
                     else self.src_path
                 )
-                if required and not path.exists():
+                if required and not self.tree.exists(path):
                     extra_msg = (
                         " Add it to your project if you want your "
                         "workflow to be compatible with geniac tools."
@@ -355,7 +569,7 @@ class GeniacLint(GeniacCommand):
                     self.critical(
                         "Directory %s does not exist.%s", formatted_path, extra_msg
                     )
-                elif recommended and not path.exists():
+                elif recommended and not self.tree.exists(path):
                     self.warning(
                         "Directory %s does not exist. It is recommended to have one in your "
                         "project.",
@@ -410,8 +624,8 @@ class GeniacLint(GeniacCommand):
         )
 
         for _, script_path in script_paths.items():
-            if script_path.exists():
-                script.read(script_path)
+            if self.tree.exists(script_path) or script_path in self.documents:
+                self._read_source(script, script_path)
             else:
                 self.error(
                     "Workflow script %s does not exist.",
@@ -419,15 +633,17 @@ class GeniacLint(GeniacCommand):
                 )
 
         # Check if there is processes without label in the actual workflow
+        processes = script.content.get("process")
         # fmt: off
-        for process in (processes := script.content.get("process")):
+        for process in processes if rule_enabled("workflow-scripts") else ():
             if not processes.get(process).get("label"):
                 process_path = Path(
                     processes.get(process).get('NextflowScriptPath')
                 ).relative_to(self.src_path)
                 self.error(
                     "Process %s in %s does not have any label.",
-                    process, process_path
+                    process, process_path,
+                    extra=self._process_location(processes.get(process)),
                 )
         # fmt: on
 
@@ -436,6 +652,44 @@ class GeniacLint(GeniacCommand):
         self.renvinitout_from_workflow = script.content.get("renvInitOut", OrderedDict())
         self.renvinitinclude_from_workflow = script.content.get("renvInitInclude", OrderedDict())
 
+    def _process_location(self, process_scope: dict) -> dict:
+        """File and line of a process, given as extra attributes of a log record"""
+        script_path = Path(process_scope.get("NextflowScriptPath"))
+        return {
+            "file": script_path.relative_to(self.src_path).as_posix(),
+            "line": process_scope.get("NextflowScriptLine"),
+        }
+
+    def _read_source(self, parser, path: Path, **kwargs):
+        """Parse a file, or the text of its document if it is edited
+
+        Files are parsed block by block so that the blocks which did not change since a previous
+        lint in the same process (editor session, daemon) are not parsed again. The blocks of
+        staged files are also kept in the parse cache, since each commit starts a new process.
+        """
+        if (text := self.documents.get(path)) is None:
+            text = self.tree.read_text(path)
+        if self.tree.changes is not None:
+            kwargs["block_store"] = self.parse_cache
+            kwargs["block_ttl"] = self.default_config.getfloat(
+                self.GENIAC_PARAMS, "parseCacheTtl", fallback=604800
+            )
+        parser.read_text(text, path, **kwargs)
+
+    def reset_phases(self, phases):
+        """Forget what the given parsing phases found so that they can be run again"""
+        if "workflow" in phases:
+            self._processes_from_workflow = OrderedDict()
+            self._labels_from_workflow = []
+        if "configs" in phases:
+            self._labels_from_configs = OrderedDict()
+            self._nxf_config_container = NextflowConfigContainer()
+            self._conda_checker = None
+        if "folders" in phases:
+            self._labels_from_folders = OrderedDict()
+        self._labels_all = []
+        self._labels_index = None
+
     def _check_geniac_config(
         self, config: NextflowConfig, conda_check: bool = False
     ) -> list:
@@ -453,22 +707,52 @@ class GeniacLint(GeniacCommand):
         labels_variables_tools = []
 
         # Check parameters according to their default values
-        config.check_config_scope("params")
-
-        # REGEX to check if a label uses information from another label
-        # recipe
-        LABEL_USED_BY_A_LABEL = r"\s*\$\{params\.geniac\.tools\.(?P<usedLabel>.+)\}\s*"
+        if rule_enabled("config-files"):
+            config.check_config_scope("params")
+
+        # Conda recipes are not searched at all if the rule is disabled
+        conda_check = conda_check and rule_enabled("conda-availability")
+
+        # Recipes are collected for all the tools first and checked with the conda-availability
+        # rule once the cheaper rules have been checked
+        conda_cache = GeniacCache.shared(self.cache_dir / "conda.json")
+        conda_repodata = self.default_config.get(self.GENIAC_PARAMS, "condaRepodata")
+        conda_checker = CondaRecipeChecker(
+            max_workers=self.default_config.getint(self.GENIAC_PARAMS, "condaCheckWorkers"),
+            cache=conda_cache,
+            ttl=self.default_config.getfloat(self.GENIAC_PARAMS, "condaCacheTtl"),
+            negative_ttl=self.default_config.getfloat(
+                self.GENIAC_PARAMS, "condaCacheNegativeTtl"
+            ),
+            refresh=self.default_config.getboolean(self.GENIAC_PARAMS, "refreshCondaCache"),
+            index=RepodataIndex(conda_repodata.split(), cache=conda_cache)
+            if conda_check and conda_repodata
+            else None,
+        )
 
         # Check if conda command exists
-        if conda_check:
-           cmd = which("conda")
-           if cmd == None:
-              self.error(
-                  "Conda is not available in your path. Geniac will not check if tool "
-                  "recipes are correct. Add conda in your PATH: export PATH=/path/to/conda/bin:$PATH"
-              )
-           else:
-              self.info("conda is in the PATH")
+        with self._rule_context("conda-availability"):
+            if conda_check:
+               if not conda_checker.is_available and conda_checker.index is not None:
+                  self.error(
+                      "No conda package found in the repodata files %s. Geniac will not check if "
+                      "tool recipes are correct.",
+                      conda_repodata.split(),
+                  )
+                  conda_check = False
+               elif not conda_checker.is_available:
+                  self.error(
+                      "Conda is not available in your path. Geniac will not check if tool "
+                      "recipes are correct. Add conda in your PATH: export PATH=/path/to/conda/bin:$PATH"
+                  )
+                  conda_check = False
+               elif conda_checker.index is not None:
+                  self.info(
+                      "Conda recipes are checked with the repodata index of the channels %s.",
+                      conda_checker.index.channels,
+                  )
+               else:
+                  self.info("conda is in the PATH")
 
         # Check each label in params.geniac.tools
         self.info(
@@ -476,36 +760,36 @@ class GeniacLint(GeniacCommand):
             if conda_check
             else "Checking of conda recipes turned off."
         )
-        geniac_tools_list = config.get("params.geniac.tools", OrderedDict()).items()
-        conda_env_name = []
-        for label, value in geniac_tools_list:
-            # If the len(value) equals 1, then this is a standard label,
-            # otherwise, it contains scopes such as the label for renv.
-            if len(value) == 1:
-                [recipe] = value
-                (recipe, n_sub) = re.subn(LABEL_USED_BY_A_LABEL , "", recipe)
-                if n_sub > 0:
-                    [from_labels] = value
-                    from_labels = from_labels.split()
-                    from_labels = list(filter(re.compile(LABEL_USED_BY_A_LABEL).match, from_labels))
-                    for new_used_label in from_labels:
-                        new_used_label = re.match(LABEL_USED_BY_A_LABEL, new_used_label)
-                        new_used_label = new_used_label.group('usedLabel')
-                        labels_variables_tools.append(new_used_label)
-                    self.info("The label '%s' defined in the geniac.config file uses information from the labels %s.", label, labels_variables_tools)
-                labels_geniac_tools.append(label)
-                if len(recipe) != 0:
-                    # If the tool value is a path to an environment file (yml or yaml ext),
-                    # check if the path exists
-                    if match := GeniacLint.CONDA_PATH_RE.search(recipe):
-                        if conda_path := Path(self.src_path / match.groupdict().get("basepath")):
-                            if conda_path.exists():
-                                with open(conda_path, 'r') as yml_f:
-                                    try:
-                                        yml_content = list(yaml.load_all(yml_f, Loader=SafeLoader))[0]
-                                    except yaml.YAMLError as exception:
-                                        self.error("The file '%s' is not correctly formatted. Check that the YAML syntax is correct.", conda_path.relative_to(self.src_path))
-                                        raise exception
+        # Recipes are only analyzed if their patterns or their availability are checked
+        check_patterns = rule_enabled("conda-pattern")
+        with self._rule_context("conda-pattern"):
+            geniac_tools_list = config.get("params.geniac.tools", OrderedDict()).items()
+            conda_env_name = []
+            for label, value in geniac_tools_list:
+                # Findings about the tool are located at its definition in the config file
+                location = config.location(f"params.geniac.tools.{label}")
+                # If the len(value) equals 1, then this is a standard label,
+                # otherwise, it contains scopes such as the label for renv.
+                if len(value) == 1:
+                    [recipe] = value
+                    (recipe, n_sub) = GeniacLint.LABEL_USED_BY_A_LABEL_RE.subn("", recipe)
+                    if n_sub > 0:
+                        [from_labels] = value
+                        from_labels = from_labels.split()
+                        from_labels = list(filter(GeniacLint.LABEL_USED_BY_A_LABEL_RE.match, from_labels))
+                        for new_used_label in from_labels:
+                            new_used_label = GeniacLint.LABEL_USED_BY_A_LABEL_RE.match(new_used_label)
+                            new_used_label = new_used_label.group('usedLabel')
+                            labels_variables_tools.append(new_used_label)
+                        self.info("The label '%s' defined in the geniac.config file uses information from the labels %s.", label, labels_variables_tools)
+                    labels_geniac_tools.append(label)
+                    if len(recipe) != 0 and (check_patterns or conda_check):
+                        # If the tool value is a path to an environment file (yml or yaml ext),
+                        # check if the path exists
+                        if match := GeniacLint.CONDA_PATH_RE.search(recipe):
+                            if conda_path := Path(self.src_path / match.groupdict().get("basepath")):
+                                if self.tree.exists(conda_path):
+                                    yml_content = self._load_conda_yml(conda_path)
                                     if not 'name' in yml_content:
                                         self.error(
                                             "Conda file %s related to %s tool does not have a name entry for the conda environment. For example, add 'name: someValue_env' in the file %s.",
@@ -517,8 +801,8 @@ class GeniacLint(GeniacCommand):
                                         conda_env_name.append(yml_content['name'])
 
                                     conda_no_defaults_channel = self.default_config.getboolean(self.GENIAC_PARAMS, "condaNoDefaultsChannel")
+                                    has_nodefaults_channel = False
                                     if 'channels' in yml_content and conda_no_defaults_channel:
-                                        has_nodefaults_channel = False
                                         for channel_in_yml in yml_content['channels']:
                                             if channel_in_yml == 'defaults':
                                                    self.error(
@@ -553,6 +837,13 @@ class GeniacLint(GeniacCommand):
                                                                conda_path.relative_to(self.src_path),
                                                                dep_in_yml
                                                                )
+                                                   if conda_check and conda_checker.index is not None:
+                                                       # Dependencies are looked up in the channels of the yml file
+                                                       conda_checker.add(
+                                                           dep_in_yml,
+                                                           label,
+                                                           channels=yml_content.get('channels') or (),
+                                                       )
                                             else:
                                                 if type(dep_in_yml) is dict and 'pip' in dep_in_yml:
                                                     for pip_tool in dep_in_yml['pip']:
@@ -565,163 +856,59 @@ class GeniacLint(GeniacCommand):
                                                                pip_tool,
                                                                label
                                                            )
-                                # Test that the name of the conda recipe (yml or yaml file) is consistent with the label
-                                if label != os.path.splitext(os.path.basename(conda_path))[0]:
-                                        self.error(
-                                                "In the file 'conf/geniac.config', the label '%s' uses the custom conda recipe '%s'. Rename the recipe into '%s' to match your label.",
-                                                label,
-                                                recipe,
-                                                os.path.dirname(recipe) + "/" + label + ".yml")
-                            else:
-                                self.error(
-                                    "Conda file %s related to %s tool does not exist.",
-                                    conda_path.relative_to(self.src_path),
-                                    label,
-                                )
-                    # Elif the tool value is a conda recipe
-                    #elif match := GeniacLint.CONDA_RECIPES_RE.match(recipe):
-                    else:
-                        for conda_recipe in recipe.split(" "):
-                            match = GeniacLint.CONDA_RECIPES_RE.match(conda_recipe)
-                            if not match:
-                               self.error(
-                                   "Value %s of %s tool does not follow the pattern "
-                                   '"condaChannelName::softName=version=buildString".',
-                                   conda_recipe,
-                                   label,
-                               )
-                            else:
-                               conda_no_defaults_channel = self.default_config.getboolean(self.GENIAC_PARAMS, "condaNoDefaultsChannel")
-                               if conda_no_defaults_channel:
-                                   if conda_recipe.startswith('defaults::'):
-                                       self.error(
-                                           "In the geniac.config file, the label '%s' uses the 'defaults' channel which must be removed to avoid license issue. Use another channel than defaults in the dependency '%s'",
-                                           label,
-                                           conda_recipe
-                                           )
-                                 
-                        if conda_check:
-                            # Check if the recipes exists in the actual OS with conda search
-                            try:
-                                conda_search = subprocess.run(
-                                    ["conda", "search", conda_recipe],
-                                    capture_output=True,
-                                    check=True,
-                                )
-                            except subprocess.CalledProcessError:
-                                self.error(
-                                    "Conda search command returned non-zero exit status for the recipe "
-                                    "%s[%s]. Either conda is not available or the recipe does not link "
-                                    "to an existing package or build. Check if the requested build is "
-                                    "still available on conda with the following command:"
-                                    "\n\t> conda search %s.",
-                                    conda_recipe,
-                                    label,
-                                    conda_recipe,
-                                )
-                            else:
-                                self.debug("Conda search output:\n%s", conda_search.stdout)
-            else:
-                if bool(re.match(r"^renv.*", label)):
-                    # renv.lock file must be located in a folder with the name of the label
-                    # we will test if the file exists later 
-                    renvLockfile = "${projectDir}/recipes/dependencies/" + label + "/renv.lock"
-                    #if list(self.processes_from_workflow.keys()).count(label + 'Init') < 1:
-                    # A dedicated renv<label>Init process takinf the <lavel> as argument must be called
-                    # The renv<label>Init process is used to create conda env when needed
-                    if list(self.renvinitlabel_from_workflow.keys()).count(label) < 1:
-                        self.error("The workflow has the process with label '%s' with R packages using renv. The process '%s('%s')' is missing. It must be called in your workflow. See https://geniac.readthedocs.io/en/latest/renv.html.", label, label + 'Init', label)
-                    else:
-                        # Check that renv<label>Init process is correctly named
-                        if self.renvinitlabel_from_workflow[label] != label + 'Init':
-                            self.error("The workflow has the process with label '%s' with R packages using renv. The process %s has been called in the workflow. Use the syntax %s instead (i.e. concatenate the label name \'%s\' with 'Init' suffix). See https://geniac.readthedocs.io/en/latest/renv.html.", label, '\'' +  self.renvinitlabel_from_workflow[label] + '(\'' + label + '\')' +'\'', '\'' + label + 'Init(' + '\'' + label + '\')\'', label)
-                        else:
-                            # Check that the module renvInit has been included
-                            if list(self.renvinitinclude_from_workflow.keys()).count(self.renvinitlabel_from_workflow[label])  < 1:
-                                self.error("The workflow has the process with label '%s' with R packages using renv. The include directive with the renvInit module is missing. Add a line such as: include { renvInit as %s } from \'./nf-modules/local/process/renvInit\'. See https://geniac.readthedocs.io/en/latest/renv.html.", label, label + 'Init')
-                            else:
-                                renvinit_file = self.src_path / str(self.renvinitinclude_from_workflow[self.renvinitlabel_from_workflow[label]] + ".nf")
-                                # Test that the renvInit module exist
-                                if not renvinit_file.exists():
-                                    self.error("The workflow has the process with label '%s' with R packages using renv. The module %s has been included but it does not exist. See https://geniac.readthedocs.io/en/latest/renv.html.", label, self.renvinitinclude_from_workflow[self.renvinitlabel_from_workflow[label]] + ".nf")
-                                    
-                            # Check that the output from renv<label>Init as been used by the process which possibl needs the conda env
-                            if list(self.renvinitout_from_workflow.keys()).count(self.renvinitlabel_from_workflow[label]) < 1:
-                                self.error("The workflow has the process with label '%s' with R packages using renv. The process with the label \'%s\' must be called with the argument %s. See https://geniac.readthedocs.io/en/latest/renv.html.", label, label, '\'' +  self.renvinitlabel_from_workflow[label] + '.out.renvInitDone\'')
-                            else:
-                                # Check that the process exist
-                                process_with_init = self.renvinitout_from_workflow[self.renvinitlabel_from_workflow[label]]
-                                if list(self.processes_from_workflow.keys()).count(process_with_init) < 1:
-                                    self.error("The workflow has the process with label '%s' with R packages using renv. The argument %s has been passed to the process \'%s\' which has not been defined. See https://geniac.readthedocs.io/en/latest/renv.html.", label, '\'' +  self.renvinitlabel_from_workflow[label] + '.out.renvInitDone\'', process_with_init)
+                                    # Test that the name of the conda recipe (yml or yaml file) is consistent with the label
+                                    if label != os.path.splitext(os.path.basename(conda_path))[0]:
+                                            self.error(
+                                                    "In the file 'conf/geniac.config', the label '%s' uses the custom conda recipe '%s'. Rename the recipe into '%s' to match your label.",
+                                                    label,
+                                                    recipe,
+                                                    os.path.dirname(recipe) + "/" + label + ".yml",
+                                                    extra=location)
                                 else:
-                                    # Check that correct process is used
-                                    if self.processes_from_workflow[process_with_init].get('label').count(label) < 1:
-                                        self.error("The workflow has the process with label '%s' with R packages using renv. The argument %s has been passed to the process \'%s\' but this process does not have any label \'%s\'. See https://geniac.readthedocs.io/en/latest/renv.html.", label, '\'' +  self.renvinitlabel_from_workflow[label] + '.out.renvInitDone\'', process_with_init, label)
-
-                    for scope in ['yml', 'env', 'bioc']:
-                        if value.get(scope) == None:
-                            self.error("In the renv label '%s', the scope '%s' is missing.", label, scope)
+                                    self.error(
+                                        "Conda file %s related to %s tool does not exist.",
+                                        conda_path.relative_to(self.src_path),
+                                        label,
+                                        extra=location,
+                                    )
+                        # Elif the tool value is a conda recipe
+                        #elif match := GeniacLint.CONDA_RECIPES_RE.match(recipe):
                         else:
-                            if scope == 'yml':
-                                [renvYml] = value.get('yml')
+                            for conda_recipe in recipe.split(" "):
+                                match = GeniacLint.CONDA_RECIPES_RE.match(conda_recipe)
+                                if not match:
+                                   self.error(
+                                       "Value %s of %s tool does not follow the pattern "
+                                       '"condaChannelName::softName=version=buildString".',
+                                       conda_recipe,
+                                       label,
+                                       extra=location,
+                                   )
+                                else:
+                                   conda_no_defaults_channel = self.default_config.getboolean(self.GENIAC_PARAMS, "condaNoDefaultsChannel")
+                                   if conda_no_defaults_channel:
+                                       if conda_recipe.startswith('defaults::'):
+                                           self.error(
+                                               "In the geniac.config file, the label '%s' uses the 'defaults' channel which must be removed to avoid license issue. Use another channel than defaults in the dependency '%s'",
+                                               label,
+                                               conda_recipe,
+                                               extra=location,
+                                               )
+                                   if conda_check:
+                                       # The recipe will be checked with conda search afterwards
+                                       conda_checker.add(conda_recipe, label)
+                elif rule_enabled("renv-init"):
+                    with self._rule_context("renv-init"):
+                        self._check_renv_tool(label, value)
 
-                                if match := GeniacLint.CONDA_PATH_RE.search(renvYml):
-                                    if (
-                                        conda_path := Path(
-                                            self.src_path / match.groupdict().get("basepath")
-                                        )
-                                    ) and not conda_path.exists():
-                                        self.error(
-                                            "Conda file %s related to the renv %s tool does not exist.",
-                                            conda_path.relative_to(self.src_path),
-                                            label,
-                                        )
-                                    else:
-                                        # check the defaults channel
-                                        with open(conda_path, 'r') as yml_f:
-                                            try:
-                                                yml_content = list(yaml.load_all(yml_f, Loader=SafeLoader))[0]
-                                            except yaml.YAMLError as exception:
-                                                self.error("The file '%s' is not correctly formatted. Check that the YAML syntax is correct.", conda_path.relative_to(self.src_path))
-                                                raise exception
-                                            if not 'name' in yml_content:
-                                                self.error(
-                                                    "Conda file %s related to %s tool does not have a name entry for the conda environment. For example, add 'name: someValue_env' in the file %s.",
-                                                    conda_path.relative_to(self.src_path),
-                                                    label,
-                                                    conda_path.relative_to(self.src_path)
-                                                )
-
-                                            conda_no_defaults_channel = self.default_config.getboolean(self.GENIAC_PARAMS, "condaNoDefaultsChannel")
-                                            if 'channels' in yml_content and conda_no_defaults_channel:
-                                                has_nodefaults_channel = False
-                                                for channel_in_yml in yml_content['channels']:
-                                                    if channel_in_yml == 'defaults':
-                                                           self.error(
-                                                               "In the file '%s', the 'defaults' channel entry must be removed to avoid license issue.",
-                                                               conda_path.relative_to(self.src_path)
-                                                           )
-                                                    if channel_in_yml == 'nodefaults':
-                                                        has_nodefaults_channel = True
-                                            if has_nodefaults_channel is False and conda_no_defaults_channel:
-                                                self.error(
-                                                    "In the file '%s', the 'nodefaults' channel is missing. It ensure that no package will be installed from the defaults channel to avoid license issue.",
-                                                    conda_path.relative_to(self.src_path)
-                                                )
-
-
-                    if match := GeniacLint.RENV_LOCKFILE_PATH_RE.search(renvLockfile):
-                        if (
-                            dep_path := Path(
-                                self.src_path / match.groupdict().get("basepath")
-                            )
-                        ) and not dep_path.exists():
-                            self.error("There is no 'recipes/dependencies/%s/renv.lock' file for the renv '%s' tool. You must add the renv.lock file.", label, label)
+        if conda_check:
+            self._conda_checker = conda_checker
 
         # Check that all yml file for conda recipe have a different "name" value
         duplicated_conda_env_name = find_duplicates(conda_env_name)
-        if duplicated_conda_env_name:
-            self.error("You have different conda recipes in the yml files located in the folder 'recipes/conda' which use the name conda environment name: %s. Use a different conda environment name for each recipe.", duplicated_conda_env_name)
+        if duplicated_conda_env_name and check_patterns:
+            with self._rule_context("conda-pattern"):
+                self.error("You have different conda recipes in the yml files located in the folder 'recipes/conda' which use the name conda environment name: %s. Use a different conda environment name for each recipe.", duplicated_conda_env_name)
 
         labels_not_present = set(labels_variables_tools) - set(labels_geniac_tools)
         if labels_not_present:
@@ -729,6 +916,153 @@ class GeniacLint(GeniacCommand):
 
         return labels_geniac_tools
 
+    def _check_renv_tool(self, label: str, value: dict):
+        """Check the scopes of a renv label in params.geniac.tools and its renvInit process"""
+        if bool(GeniacLint.RENV_LABEL_RE.match(label)):
+            # renv.lock file must be located in a folder with the name of the label
+            # we will test if the file exists later 
+            renvLockfile = "${projectDir}/recipes/dependencies/" + label + "/renv.lock"
+            #if list(self.processes_from_workflow.keys()).count(label + 'Init') < 1:
+            # A dedicated renv<label>Init process takinf the <lavel> as argument must be called
+            # The renv<label>Init process is used to create conda env when needed
+            if list(self.renvinitlabel_from_workflow.keys()).count(label) < 1:
+                self.error("The workflow has the process with label '%s' with R packages using renv. The process '%s('%s')' is missing. It must be called in your workflow. See https://geniac.readthedocs.io/en/latest/renv.html.", label, label + 'Init', label)
+            else:
+                # Check that renv<label>Init process is correctly named
+                if self.renvinitlabel_from_workflow[label] != label + 'Init':
+                    self.error("The workflow has the process with label '%s' with R packages using renv. The process %s has been called in the workflow. Use the syntax %s instead (i.e. concatenate the label name \'%s\' with 'Init' suffix). See https://geniac.readthedocs.io/en/latest/renv.html.", label, '\'' +  self.renvinitlabel_from_workflow[label] + '(\'' + label + '\')' +'\'', '\'' + label + 'Init(' + '\'' + label + '\')\'', label)
+                else:
+                    # Check that the module renvInit has been included
+                    if list(self.renvinitinclude_from_workflow.keys()).count(self.renvinitlabel_from_workflow[label])  < 1:
+                        self.error("The workflow has the process with label '%s' with R packages using renv. The include directive with the renvInit module is missing. Add a line such as: include { renvInit as %s } from \'./nf-modules/local/process/renvInit\'. See https://geniac.readthedocs.io/en/latest/renv.html.", label, label + 'Init')
+                    else:
+                        renvinit_file = self.src_path / str(self.renvinitinclude_from_workflow[self.renvinitlabel_from_workflow[label]] + ".nf")
+                        # Test that the renvInit module exist
+                        if not self.tree.exists(renvinit_file):
+                            self.error("The workflow has the process with label '%s' with R packages using renv. The module %s has been included but it does not exist. See https://geniac.readthedocs.io/en/latest/renv.html.", label, self.renvinitinclude_from_workflow[self.renvinitlabel_from_workflow[label]] + ".nf")
+
+                    # Check that the output from renv<label>Init as been used by the process which possibl needs the conda env
+                    if list(self.renvinitout_from_workflow.keys()).count(self.renvinitlabel_from_workflow[label]) < 1:
+                        self.error("The workflow has the process with label '%s' with R packages using renv. The process with the label \'%s\' must be called with the argument %s. See https://geniac.readthedocs.io/en/latest/renv.html.", label, label, '\'' +  self.renvinitlabel_from_workflow[label] + '.out.renvInitDone\'')
+                    else:
+                        # Check that the process exist
+                        process_with_init = self.renvinitout_from_workflow[self.renvinitlabel_from_workflow[label]]
+                        if list(self.processes_from_workflow.keys()).count(process_with_init) < 1:
+                            self.error("The workflow has the process with label '%s' with R packages using renv. The argument %s has been passed to the process \'%s\' which has not been defined. See https://geniac.readthedocs.io/en/latest/renv.html.", label, '\'' +  self.renvinitlabel_from_workflow[label] + '.out.renvInitDone\'', process_with_init)
+                        else:
+                            # Check that correct process is used
+                            if self.processes_from_workflow[process_with_init].get('label').count(label) < 1:
+                                self.error("The workflow has the process with label '%s' with R packages using renv. The argument %s has been passed to the process \'%s\' but this process does not have any label \'%s\'. See https://geniac.readthedocs.io/en/latest/renv.html.", label, '\'' +  self.renvinitlabel_from_workflow[label] + '.out.renvInitDone\'', process_with_init, label)
+
+            for scope in ['yml', 'env', 'bioc']:
+                if value.get(scope) == None:
+                    self.error(
+                        "In the renv label '%s', the scope '%s' is missing.",
+                        label,
+                        scope,
+                        extra=self.nxf_config_container.location(f"params.geniac.tools.{label}"),
+                    )
+                else:
+                    if scope == 'yml':
+                        [renvYml] = value.get('yml')
+
+                        if match := GeniacLint.CONDA_PATH_RE.search(renvYml):
+                            if (
+                                conda_path := Path(
+                                    self.src_path / match.groupdict().get("basepath")
+                                )
+                            ) and not self.tree.exists(conda_path):
+                                self.error(
+                                    "Conda file %s related to the renv %s tool does not exist.",
+                                    conda_path.relative_to(self.src_path),
+                                    label,
+                                )
+                            else:
+                                # check the defaults channel
+                                yml_content = self._load_conda_yml(conda_path)
+                                if not 'name' in yml_content:
+                                    self.error(
+                                        "Conda file %s related to %s tool does not have a name entry for the conda environment. For example, add 'name: someValue_env' in the file %s.",
+                                        conda_path.relative_to(self.src_path),
+                                        label,
+                                        conda_path.relative_to(self.src_path)
+                                    )
+
+                                conda_no_defaults_channel = self.default_config.getboolean(self.GENIAC_PARAMS, "condaNoDefaultsChannel")
+                                has_nodefaults_channel = False
+                                if 'channels' in yml_content and conda_no_defaults_channel:
+                                    for channel_in_yml in yml_content['channels']:
+                                        if channel_in_yml == 'defaults':
+                                               self.error(
+                                                   "In the file '%s', the 'defaults' channel entry must be removed to avoid license issue.",
+                                                   conda_path.relative_to(self.src_path)
+                                               )
+                                        if channel_in_yml == 'nodefaults':
+                                            has_nodefaults_channel = True
+                                if has_nodefaults_channel is False and conda_no_defaults_channel:
+                                    self.error(
+                                        "In the file '%s', the 'nodefaults' channel is missing. It ensure that no package will be installed from the defaults channel to avoid license issue.",
+                                        conda_path.relative_to(self.src_path)
+                                    )
+
+
+            if match := GeniacLint.RENV_LOCKFILE_PATH_RE.search(renvLockfile):
+                if (
+                    dep_path := Path(
+                        self.src_path / match.groupdict().get("basepath")
+                    )
+                ) and not self.tree.exists(dep_path):
+                    self.error("There is no 'recipes/dependencies/%s/renv.lock' file for the renv '%s' tool. You must add the renv.lock file.", label, label)
+
+    def _load_conda_yml(self, conda_path: Path) -> dict:
+        """Load name, channels and dependencies of a conda environment file"""
+        try:
+            return load_conda_env(
+                conda_path,
+                cache=self.parse_cache,
+                content=None if self.tree.is_local(conda_path) else self.tree.read_bytes(conda_path),
+            )
+        except yaml.YAMLError as exception:
+            self.error("The file '%s' is not correctly formatted. Check that the YAML syntax is correct.", conda_path.relative_to(self.src_path))
+            raise exception
+
+    def check_conda_availability(self):
+        """Check if the recipes in params.geniac.tools exist in the actual OS with conda search"""
+        if self._conda_checker is not None:
+            self._check_conda_recipes(self._conda_checker)
+
+    def _check_conda_recipes(self, conda_checker: CondaRecipeChecker):
+        """Check every distinct conda recipe and report the labels using the missing ones
+
+        If the lint is stopped while recipes are checked, running conda searches are killed.
+        """
+        with closing(conda_checker.iter_check()) as results:
+            self._report_conda_results(conda_checker, results)
+
+    def _report_conda_results(self, conda_checker: CondaRecipeChecker, results):
+        """Report the labels using missing conda recipes"""
+        for (conda_recipe, channels), result in results:
+            if result.found:
+                self.debug("Conda search output:\n%s", result.output)
+            elif conda_checker.index is not None:
+                self.error(
+                    "The recipe %s[%s] is not available in the conda repodata index: %s.",
+                    conda_recipe,
+                    ", ".join(conda_checker.recipes.get((conda_recipe, channels))),
+                    result.output,
+                )
+            else:
+                self.error(
+                    "Conda search command returned non-zero exit status for the recipe "
+                    "%s[%s]. Either conda is not available or the recipe does not link "
+                    "to an existing package or build. Check if the requested build is "
+                    "still available on conda with the following command:"
+                    "\n\t> conda search %s.",
+                    conda_recipe,
+                    ", ".join(conda_checker.recipes.get((conda_recipe, channels))),
+                    conda_recipe,
+                )
+
     def _check_process_config(self, config: NextflowConfig, config_path):
         """Check the content of a process config file
 
@@ -737,8 +1071,10 @@ class GeniacLint(GeniacCommand):
         """
         # For each process used with withName selector, check their existence in the
         # workflow
-        for config_process in config.get("process", OrderedDict()).get(
-            "withName", OrderedDict()
+        for config_process in (
+            config.get("process", OrderedDict()).get("withName", OrderedDict())
+            if rule_enabled("config-files")
+            else ()
         ):
             if config_process not in self.processes_from_workflow:
                 self.error(
@@ -765,6 +1101,8 @@ class GeniacLint(GeniacCommand):
             default_geniac_files_paths (list):
             default_config_paths (list):
         """
+        if not rule_enabled("config-files"):
+            return
         include_config_paths = [
             self.src_path / Path(include_path)
             for include_path in config.get("includeConfig", [])
@@ -798,6 +1136,8 @@ class GeniacLint(GeniacCommand):
 
     def _check_base_config(self, config: NextflowConfig):
         """Check the content of a base config file"""
+        if not rule_enabled("config-files"):
+            return
         self.debug("Check content of base config file without analyzing geniac scope")
         config.check_config_scope("params", skip_nested_scopes=["geniac"])
 
@@ -878,7 +1218,10 @@ class GeniacLint(GeniacCommand):
 
             # If the project config file does not exists and does not belong to default
             # geniac files
-            if not project_config_path.exists():
+            if (
+                not self.tree.exists(project_config_path)
+                and project_config_path not in self.documents
+            ):
                 if project_config_path not in expected_geniac_config_paths:
                     self.error(
                         "Nextflow config file %s does not exist.",
@@ -888,7 +1231,8 @@ class GeniacLint(GeniacCommand):
 
             # Read the Nextflow configuration file
             nxf_config = NextflowConfig(src_path=self.src_path, config_file=self.config_file)
-            nxf_config.read(
+            self._read_source(
+                nxf_config,
                 project_config_path,
                 warnings=config_key
                 not in self.default_config.options(GeniacLint.GENIAC_CHECK_CONFIG),
@@ -914,9 +1258,9 @@ class GeniacLint(GeniacCommand):
         labels_from_modules = []
         modules_dir = modules_tree.get("path")
         main_cmake_lists = modules_dir / "CMakeLists.txt"
-        if not main_cmake_lists.exists():
+        if not self.tree.exists(main_cmake_lists):
             # Output an error if modules directory is not empty
-            if any(modules_dir.iterdir()):
+            if self.tree.iterdir(modules_dir):
                 self.error(
                     "Folder %s requires a CMakeLists.txt file in order to automatically "
                     "build containers.",
@@ -924,11 +1268,25 @@ class GeniacLint(GeniacCommand):
                 )
             return []
 
-        with open(main_cmake_lists, encoding=DEFAULT_ENCODING) as cmake_file:
-            main_cmake_lists_content = cmake_file.read()
+        if not rule_enabled("module-cmake"):
+            # Only the labels are needed, CMake files are not read
+            return OrderedDict(
+                [
+                    (
+                        "modules",
+                        [
+                            module.stem
+                            for module in self.tree.iterdir(modules_dir)
+                            if self.tree.is_dir(module)
+                        ],
+                    )
+                ]
+            )
+
+        main_cmake_lists_content = self.tree.read_text(main_cmake_lists, DEFAULT_ENCODING)
 
         for module_dir in [
-            module for module in modules_dir.iterdir() if module.is_dir()
+            module for module in self.tree.iterdir(modules_dir) if self.tree.is_dir(module)
         ]:
             # If child correspond to a folder and the name of this folder is linked to
             # an existing bash script
@@ -937,17 +1295,16 @@ class GeniacLint(GeniacCommand):
             cmakelists_child = module_dir / "CMakeLists.txt"
             labels_from_modules += [module_name]
 
-            if cmakelists_child.exists():
+            if self.tree.exists(cmakelists_child):
                 self.debug("Found module directory with label %s.", module_name)
                 # Parse the CMakeLists.txt file to see if the label is correctly defined
-                check_main_cmlist_reg = re.compile(
+                check_main_cmlist_reg = ProfiledPattern(
                     GeniacLint.PROJECT_ADD_MAIN_CMAKE_RE_TEMP.format(label=module_name)
                 )
 
-                with open(
-                    cmakelists_child, encoding=DEFAULT_ENCODING
-                ) as cmake_module_file:
-                    module_cmake_lists_content = cmake_module_file.read()
+                module_cmake_lists_content = self.tree.read_text(
+                    cmakelists_child, DEFAULT_ENCODING
+                )
 
                 # First look if the is correctly added within the main CMakeLists.txt file
                 if check_main_cmlist_reg.search(main_cmake_lists_content):
@@ -1071,19 +1428,18 @@ class GeniacLint(GeniacCommand):
                 # Check if the file is used in recipe files
                 for recipe_path in recipe_files:
                     if recipe_path.suffix == recipe_ext:
-                        dependency_reg = re.compile(
+                        dependency_reg = ProfiledPattern(
                             getattr(
                                 GeniacLint, f"{recipe_type.upper()}_DEP_RE_TEMP", ""
                             ).format(dependency=dependency_path.name, tool=tool_name)
                         )
-                        with open(
-                            recipe_path, encoding=DEFAULT_ENCODING
-                        ) as recipe_file:
-                            recipe_flag = (
-                                True
-                                if dependency_reg.search(recipe_file.read())
-                                else recipe_flag
+                        recipe_flag = (
+                            True
+                            if dependency_reg.search(
+                                self.tree.read_text(recipe_path, DEFAULT_ENCODING)
                             )
+                            else recipe_flag
+                        )
 
                 # Throw an error if dependency not found in any recipe file
                 # TODO: should throw an error if dependency not found in one of the recipe files
@@ -1128,10 +1484,9 @@ class GeniacLint(GeniacCommand):
                     # If there is a script scope in the process
                     if script := process_scope.get("script", []):
                         for line in script:
-                            if re.search(
-                                fr"(source|\.)*{env_path.relative_to(self.src_path)}",
-                                line,
-                            ):
+                            if ProfiledPattern(
+                                fr"(source|\.)*{env_path.relative_to(self.src_path)}"
+                            ).search(line):
                                 source_flag = True
                                 envs_sourced += [env_path]
                     # If env file not sourced in the actual process
@@ -1141,6 +1496,7 @@ class GeniacLint(GeniacCommand):
                             process,
                             env_path.stem,
                             env_path.relative_to(self.src_path),
+                            extra=self._process_location(process_scope),
                         )
 
         if envs_unsourced := set(envs_found) - set(envs_sourced):
@@ -1179,34 +1535,45 @@ class GeniacLint(GeniacCommand):
         )
 
         # Get labels first
-        for _, geniac_dir in geniac_dirs.items():
+        for geniac_dir_name, geniac_dir in geniac_dirs.items():
             if geniac_dirpath := geniac_dir.get("tree", {}).get("path"):
-                if not geniac_dirpath.exists():
+                if not self.tree.exists(geniac_dirpath):
                     continue
             if get_label := geniac_dir.get("get_labels"):
-                self.labels_from_folders |= get_label(
-                    **{
-                        arg: geniac_trees.get(arg)
-                        for arg in getfullargspec(get_label).args
-                        if arg != "self"
-                    }
-                )
+                with self._rule_context(self.FOLDER_RULES.get(geniac_dir_name, "dependencies")):
+                    self.labels_from_folders |= get_label(
+                        **{
+                            arg: geniac_trees.get(arg)
+                            for arg in getfullargspec(get_label).args
+                            if arg != "self"
+                        }
+                    )
 
         # Then check directories
-        for _, geniac_dir in geniac_dirs.items():
+        for geniac_dir_name, geniac_dir in geniac_dirs.items():
             if geniac_dirpath := geniac_dir.get("tree", {}).get("path"):
-                if not geniac_dirpath.exists():
+                if not self.tree.exists(geniac_dirpath):
                     continue
-            if check_dir := geniac_dir.get("check_dir"):
-                check_dir(
-                    **{
-                        arg: geniac_trees.get(arg)
-                        for arg in getfullargspec(check_dir).args
-                        if arg != "self"
-                    }
-                )
+            rule_id = self.FOLDER_RULES.get(geniac_dir_name, "dependencies")
+            if (check_dir := geniac_dir.get("check_dir")) and rule_enabled(rule_id):
+                with self._rule_context(rule_id):
+                    check_dir(
+                        **{
+                            arg: geniac_trees.get(arg)
+                            for arg in getfullargspec(check_dir).args
+                            if arg != "self"
+                        }
+                    )
 
         # Check if singularity and docker have the same labels
+        if rule_enabled("container-labels"):
+            with self._rule_context("container-labels"):
+                self._check_containers_folders()
+
+        return self.labels_from_folders
+
+    def _check_containers_folders(self):
+        """Check if singularity and docker folders have the same labels"""
         if container_diff := sorted(
             list(
                 set(
@@ -1219,8 +1586,6 @@ class GeniacLint(GeniacCommand):
                 container_diff,
             )
 
-        return self.labels_from_folders
-
     def check_labels(
         self,
     ):
@@ -1265,7 +1630,7 @@ class GeniacLint(GeniacCommand):
                         foundLabelWithPrefix = False
                         candidateTools = []
                         for labelVariable in process_scope.get("labelVariable"):
-                            startWithLabel = list(filter(re.compile(r"^"+labelVariable+r".*").match, self.labels_all))
+                            startWithLabel = self.labels_index.startswith(labelVariable)
                             if len(startWithLabel) > 0:
                                 foundLabelWithPrefix = True
                                 candidateTools = startWithLabel
@@ -1282,19 +1647,22 @@ class GeniacLint(GeniacCommand):
                                     process,
                                     process_scope.get("labelVariableParams"),
                                     process_scope.get("labelVariable"),
-                                    self.labels_all
+                                    self.labels_all,
+                                    extra=self._process_location(process_scope),
                             )
                     else:
                         self.error(
                                 "The process '%s' does not have any label which corresponds to a tool. Available labels are:\n'%s'.",
                                 process,
-                                self.labels_all
+                                self.labels_all,
+                                extra=self._process_location(process_scope),
                         )
                 else:
                     self.error(
                             "The process '%s' does not have any label which corresponds to a tool. Available labels are:\n'%s'.",
                             process,
-                            self.labels_all
+                            self.labels_all,
+                            extra=self._process_location(process_scope),
                     )
 
             if len(matched_labels) > 1:
@@ -1303,6 +1671,7 @@ class GeniacLint(GeniacCommand):
                     "A process should have only one geniac.tools label.",
                     process,
                     matched_labels,
+                    extra=self._process_location(process_scope),
                 )
 
             if len(unmatched_labels) >= 1:
@@ -1317,6 +1686,7 @@ class GeniacLint(GeniacCommand):
                         self.src_path
                     ),
                     process_path,
+                    extra=self._process_location(process_scope),
                 )
 
         # Get the difference with labels from geniac tools and folders and labels used
@@ -1343,9 +1713,14 @@ class GeniacLint(GeniacCommand):
                 )
 
     def check_labels_containers(
-        self, container
+        self, containers: tuple = ("singularity", "docker")
     ):
         """Check labels for containers"""
+        for container in containers:
+            self._check_labels_container(container)
+
+    def _check_labels_container(self, container: str):
+        """Check labels for a container"""
         for label_name in ["modules"]:
             if container_diff := sorted(
                 list(
@@ -1390,7 +1765,7 @@ class GeniacLint(GeniacCommand):
         for (folder_name, label_list) in self.labels_from_folders.items():
             if folder_name != 'conda':
                 for label_name in label_list:
-                    if bool(re.match(r"^renv.*", label_name)):
+                    if bool(GeniacLint.RENV_LABEL_RE.match(label_name)):
                         self.error("In the folder for '%s', you have the label '%s'. Label which starts by 'renv' is only allowed for tools with R and renv. Change the name of your label.",
                                 folder_name,
                                 label_name)
@@ -1398,7 +1773,7 @@ class GeniacLint(GeniacCommand):
         for (config_name, label_list) in self.labels_from_configs.items():
             if config_name == 'geniac':
                 for label_name in label_list:
-                    if bool(re.match("^renv.*", label_name)):
+                    if bool(GeniacLint.RENV_LABEL_RE.match(label_name)):
                         self.error("In the config for '%s', you have the label '%s'. Label which starts by 'renv' is only allowed for tools with R and renv. Change the name of your label.",
                                 config_name,
                                 label_name)
@@ -1414,7 +1789,7 @@ class GeniacLint(GeniacCommand):
         labels_in_geniac = self.labels_from_configs.get("geniac", [])
         labels_in_workflow = self.labels_from_workflow
         for label in labels:
-            if not bool(re.match("^renv.*", label)):
+            if not bool(GeniacLint.RENV_LABEL_RE.match(label)):
                 if label in labels_in_workflow:
                     if label in labels_in_geniac:
                         self.debug("The conda recipe corresponding to the label '%s' is declared in the geniac.config file.", label)
@@ -1423,48 +1798,307 @@ class GeniacLint(GeniacCommand):
 
 
 
+    def _lint_options_digest(self) -> dict:
+        """Everything besides the project files which can change the lint result"""
+        options = {
+            "version": __version__,
+            "config": {
+                section: dict(self.default_config.items(section, raw=True))
+                for section in self.default_config.sections()
+            },
+        }
+        # Offline conda checks also depend on the content of the repodata files
+        repodata = self.default_config.get(self.GENIAC_PARAMS, "condaRepodata", fallback="") or ""
+        for source in repodata.split():
+            path = Path(split_repodata_source(source)[1]).expanduser()
+            profile_count("stats")
+            if path.is_file():
+                path = path.parent
+            else:
+                profile_count("stats")
+                if not path.is_dir():
+                    continue
+            options.setdefault("repodata", {})[source] = fingerprint_files(path)[0]
+        return options
+
+    def _lint_inputs(self) -> tuple:
+        """Files read by the lint rules and entries of the other project folders
+
+        The content of the workflow scripts, of the Nextflow config files and of the files of the
+        geniac directories is read by the rules. The other folders of the tree sections are only
+        listed, so that their data (e.g. test data or Nextflow work folders) is never hashed.
+
+        Returns:
+            paths (list): paths of the files read, relative to the project folder
+            listing (list): paths of the entries of the other folders which are not browsed
+                recursively, relative to the project folder
+        """
+        src_path = Path(self.src_path).resolve()
+        paths = set()
+        for section in (self.PROJECT_WORKFLOW, self.GENIAC_CHECK_CONFIG):
+            for option in self.default_config.options(section):
+                paths.update(self.get_config_path(section, option))
+        geniac_sections = {
+            f"{self.TREE_SUFFIX}.{tree_section}"
+            for _, tree_section in self.default_config.items(self.GENIAC_DIRS)
+        }
+        listing = set()
+        for tree_section in self.get_config_subsection(self.TREE_SUFFIX):
+            for option in ("mandatory", "optional"):
+                paths.update(self.get_config_path(tree_section, option))
+            folder = Path(self.default_config.get(tree_section, "path") or src_path).resolve()
+            recursive = self.default_config.getboolean(tree_section, "recursive", fallback=False)
+            if tree_section in geniac_sections:
+                paths.update(Path(path) for _, path in iter_files(folder, recursive=recursive))
+            elif not recursive:
+                listing.update(Path(path) for _, path in iter_files(folder, recursive=False))
+        return tuple(
+            sorted(
+                Path(path).resolve().relative_to(src_path).as_posix()
+                for path in group
+                if Path(path).resolve().is_relative_to(src_path)
+            )
+            for group in (paths, listing)
+        )
+
     def run(self):
         """Execute the main routine
 
+        Diagnostics of a previous run are replayed when neither the project files nor the lint
+        options changed since then.
+
         Returns:
 
         """
+        with DiagnosticsHandler.from_options(
+            self._diagnostics_jsonl, self._sarif
+        ), self.profiler.section("lint", "total"):
+            # Results are cached according to the files of the working tree or to the revision
+            if self.result_cacheable:
+                self._run_cached()
+            else:
+                self._run_checks()
 
+        if self.profiler.enabled:
+            self._report_profile()
 
-        # Check directory and setup directory flags
-        self.check_tree_folder()
+        # End the run with exit code
+        if self.error_flag:
+            raise SystemExit(1)
 
-        # Get list of labels from main nextflow script
-        self.get_processes_from_workflow()
+    @property
+    def result_cacheable(self) -> bool:
+        """Can the lint result be replayed as long as the inputs of the lint do not change ?"""
+        return (
+            not self._no_result_cache
+            and self.tree.changes is None
+            and self.default_config.getboolean(self.GENIAC_PARAMS, "resultCache", fallback=True)
+        )
 
-        # Get list of labels from project.config and geniac.config files
-        self.get_labels_from_config_files()
+    def inputs_fingerprint(self, manifest: dict = None) -> tuple:
+        """Fingerprint of the project files read or listed by the lint
 
-        # Get labels from folders
-        self.get_labels_from_folders()
+        Args:
+            manifest (dict): manifest of a previous fingerprint, whose files are not hashed
+                again if their size and modification time did not change
 
-        # Check if there is any inconsistency between the labels from configuration
-        # files and the main script
-        self.check_labels()
+        Returns:
+            fingerprint (str): digest of the inputs of the lint
+            manifest (dict): size, modification time and digest of each file read, or None if
+                the files are read at a git revision
+        """
+        if self.tree.fingerprint is not None:
+            return self.tree.fingerprint, None
+        paths, listing = self._lint_inputs()
+        fingerprint, manifest = fingerprint_files(self.src_path, manifest, paths=paths)
+        return hashlib.sha256("\0".join([fingerprint, *listing]).encode()).hexdigest(), manifest
+
+    def _report_profile(self):
+        """Print the profile of the lint and write it in a JSON file if requested"""
+        # Keep the standard output for diagnostics if they are written on it
+        output = sys.stderr if self._diagnostics_jsonl == "-" else sys.stdout
+        output.write(self.profiler.format_table() + "\n")
+        output.flush()
+        if self._profile_json:
+            self.profiler.dump(self._profile_json)
+
+    def _run_cached(self):
+        """Run the checks only if the lint result cache is outdated"""
+        result_cache = GeniacCache.shared(self.cache_dir / "lint.json")
+        cache_key = f"{self.RESULT_CACHE_PREFIX}{Path(self.src_path).resolve()}"
+        if self.tree.fingerprint is not None:
+            # Each git revision has its own result
+            cache_key += f"@{self.tree.fingerprint}"
+        previous = result_cache.get(cache_key) or {}
+        with self.profiler.section("phase", "fingerprint"):
+            fingerprint, manifest = self.inputs_fingerprint(previous.get("manifest"))
+            options = self._lint_options_digest()
+        refresh = self.default_config.getboolean(
+            self.GENIAC_PARAMS, "refreshCondaCache", fallback=False
+        )
 
-        # Check if there is any inconsistency between the labels  in the extra sections
-        # from geniac.config
-        self.check_extra_section_geniac_config()
+        if (
+            not refresh
+            and previous.get("fingerprint") == fingerprint
+            and previous.get("options") == options
+        ):
+            self.debug("Project unchanged since the last lint, replaying its diagnostics")
+            RecordCollector.replay(previous.get("records", []))
+            self.error_flag = previous.get("error_flag", False)
+            return
+
+        with RecordCollector() as collector:
+            self._run_checks()
+
+        # A conda check with a negative result should be run again later
+        ttl = None
+        if self.default_config.getboolean(self.GENIAC_PARAMS, "condaCheck", fallback=False):
+            ttl = self.default_config.getfloat(
+                self.GENIAC_PARAMS, "condaCacheNegativeTtl", fallback=86400
+            )
+        result_cache.set(
+            cache_key,
+            {
+                "fingerprint": fingerprint,
+                "manifest": manifest,
+                "options": options,
+                "records": collector.records,
+                "error_flag": self.error_flag,
+            },
+            ttl=ttl,
+        )
+        result_cache.save()
 
-        # Check that labels from container recipes have not been used elsewhere.
-        # This checks that the containers receipes have not been pushed in the git repository
-        self.check_labels_containers(container="singularity")
-        self.check_labels_containers(container="docker")
+    @property
+    def enabled_rules(self) -> list:
+        """Lint rules selected with the select and ignore options"""
+        patterns = {}
+        for option in ("select", "ignore"):
+            value = self.default_config.get(self.GENIAC_PARAMS, option, fallback="") or ""
+            patterns[option] = value.replace(",", " ").split()
+            for pattern in patterns[option]:
+                if not any(fnmatchcase(rule.rule_id, pattern) for rule in self.RULES):
+                    self.critical(
+                        "Unknown lint rule %s in %s option. Available rules are: %s.",
+                        pattern,
+                        option,
+                        ", ".join(rule.rule_id for rule in self.RULES),
+                    )
+        return [
+            rule
+            for rule in self.RULES
+            if (
+                not patterns["select"]
+                or any(fnmatchcase(rule.rule_id, pattern) for pattern in patterns["select"])
+            )
+            and not any(fnmatchcase(rule.rule_id, pattern) for pattern in patterns["ignore"])
+        ]
 
-        # Check labels for renv
-        self.check_labels_renv()
+    @contextmanager
+    def _rule_context(self, rule_id: str):
+        """Attach findings to a rule and profile it"""
+        with rule_context(rule_id), self.profiler.section("rule", rule_id):
+            yield
 
-        # Check that a conda recipe has its label defined in geniac.config"""
-        self.check_labels_conda_geniac()
+    def _run_checks(self):
+        """Run the enabled lint rules on the project
+
+        Only the parsing phases needed by the enabled rules are run. The findings of the other
+        rules are not reported and their expensive work (conda search, CMake files, container
+        recipes) is skipped. Rules are checked by cost class so that cheap structural rules
+        report their findings first. The lint stops once maxErrors errors have been reported.
+        """
+        rules = sorted(self.enabled_rules, key=lambda rule: self.COST_CLASSES.index(rule.cost))
+        if self.tree.changes is not None:
+            rules = self._rules_for_changes(rules, self.tree.changes)
+            if not rules:
+                self.info("No changed file is checked by the lint rules.")
+        phases = {phase for rule in rules for phase in rule.phases}
+        enabled_ids = {rule.rule_id for rule in rules}
+        max_errors = (
+            1
+            if self.default_config.getboolean(self.GENIAC_PARAMS, "failFast", fallback=False)
+            else self.default_config.getint(self.GENIAC_PARAMS, "maxErrors", fallback=0)
+        )
+        try:
+            with disabled_rules(
+                rule.rule_id for rule in self.RULES if rule not in rules
+            ), error_budget(max_errors):
+                self._run_rules(rules, phases, enabled_ids)
+        except ErrorBudgetExceeded as budget:
+            self.warning(
+                "Lint stopped after %s error(s), the remaining checks have been cancelled.",
+                budget.args[0],
+            )
+
+        # Keep parsed files for the next run
+        self.parse_cache.save()
+
+    def _rules_for_changes(self, rules: list, changes: dict) -> list:
+        """Lint rules depending on changed files
+
+        Workflow scripts are read by the workflow phase, config files by the configs phase and
+        the files of the geniac directories by the folders phase. The conda environment files and
+        renv lock files of the geniac directories are also read by the configs phase, with the
+        tools using them. Rules without any phase check the structure of the project and depend
+        only on added and removed files.
+
+        Args:
+            rules (list): lint rules
+            changes (dict): change type (A, D, M or R) of each changed file
+
+        Returns:
+            rules (list): lint rules needing at least one phase reading a changed file
+        """
+        geniac_dirs = {
+            geniac_dir: Path(
+                self.default_config.get(f"{self.TREE_SUFFIX}.{tree_section}", "path")
+            ).resolve()
+            for geniac_dir, tree_section in self.default_config.items(self.GENIAC_DIRS)
+            if geniac_dir != "conf"
+        }
+        recipe_dirs = [
+            geniac_dirs[name] for name in ("conda", "dependencies") if name in geniac_dirs
+        ]
+        phases = set()
+        for path in changes:
+            if path.suffix == ".nf":
+                phases.add("workflow")
+            elif path.suffix == ".config":
+                phases.add("configs")
+            elif (path.suffix in (".yml", ".yaml") or path.name == "renv.lock") and any(
+                path.is_relative_to(recipe_dir) for recipe_dir in recipe_dirs
+            ):
+                phases.add("configs")
+            if any(path.is_relative_to(geniac_dir) for geniac_dir in geniac_dirs.values()):
+                phases.add("folders")
+        structure_changed = any(change != "M" for change in changes.values())
+        self.debug("Changed files %s are read by the %s phases.", sorted(changes), sorted(phases))
+        return [
+            rule
+            for rule in rules
+            if set(rule.phases) & phases or (not rule.phases and structure_changed)
+        ]
+
+    def _run_rules(self, rules: list, phases: set, enabled_ids: set):
+        """Run the parsing phases and the checks of the lint rules"""
+        # Rules which do not need any parsing phase are checked first
+        for rule in rules:
+            if rule.check and not rule.phases:
+                with self._rule_context(rule.rule_id):
+                    getattr(self, rule.check)()
+
+        for phase, (method, rule_id) in self.PHASES.items():
+            if phase in phases:
+                self.debug("Loading %s phase for rules %s.", phase, sorted(enabled_ids))
+                with rule_context(rule_id), self.profiler.section("phase", phase):
+                    getattr(self, method)()
+
+        for rule in rules:
+            if rule.check and rule.phases:
+                with self._rule_context(rule.rule_id):
+                    getattr(self, rule.check)()
 
-        # End the run with exit code
-        if self.error_flag:
-            raise SystemExit(1)
 
 def find_duplicates(listOfElem):
     """Extract duplicates in a list"""
@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""lsp.py: Language Server Protocol front end of the geniac linter"""
+
+import json
+import logging
+import queue
+import sys
+import threading
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+import geniac.cli.utils.errorcounter
+from geniac.cli.commands.lint import GeniacLint
+from geniac.cli.utils.diagnostics import disabled_rules
+from geniac.cli.utils.logging import LogMixin, RecordCollector
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+# LSP diagnostic severities of the log levels
+LSP_SEVERITIES = {logging.CRITICAL: 1, logging.ERROR: 1, logging.WARNING: 2, logging.INFO: 3}
+# Phases run again each time a document is edited
+EDITED_PHASES = ("workflow", "configs")
+
+
+def read_message(stream) -> dict:
+    """Read a JSON-RPC message with its Content-Length header (None at the end of the stream)"""
+    length = None
+    while True:
+        header = stream.readline()
+        if not header:
+            return None
+        header = header.decode("ascii").strip()
+        if not header:
+            break
+        name, _, value = header.partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    if length is None:
+        return None
+    return json.loads(stream.read(length).decode("utf8"))
+
+
+def write_message(stream, message: dict):
+    """Write a JSON-RPC message with its Content-Length header"""
+    body = json.dumps({"jsonrpc": "2.0", **message}).encode("utf8")
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    stream.flush()
+
+
+def uri_to_path(uri: str) -> Path:
+    """Convert a file URI to a path"""
+    return Path(unquote(urlparse(uri).path))
+
+
+class TextDocument:
+    """Text of a document opened in the editor, updated with incremental changes"""
+
+    def __init__(self, uri: str, text: str, version: int = 0):
+        self.uri = uri
+        self.path = uri_to_path(uri)
+        self.version = version
+        self.lines = text.splitlines(keepends=True)
+
+    @property
+    def text(self) -> str:
+        """Full text of the document"""
+        return "".join(self.lines)
+
+    @staticmethod
+    def _index(line: str, character: int) -> int:
+        """Index in a line of a position given in UTF-16 code units"""
+        units = 0
+        for idx, char in enumerate(line):
+            if units >= character:
+                return idx
+            units += 2 if ord(char) > 0xFFFF else 1
+        return len(line)
+
+    def apply_change(self, change: dict):
+        """Apply a full or an incremental change sent with textDocument/didChange"""
+        if "range" not in change:
+            self.lines = change["text"].splitlines(keepends=True)
+            return
+        start, end = change["range"]["start"], change["range"]["end"]
+        start_line = min(start["line"], len(self.lines))
+        end_line = min(end["line"], len(self.lines))
+        first = self.lines[start_line] if start_line < len(self.lines) else ""
+        last = self.lines[end_line] if end_line < len(self.lines) else ""
+        # Only the lines touched by the change are split again
+        self.lines[start_line : end_line + 1] = (
+            first[: self._index(first, start["character"])]
+            + change["text"]
+            + last[self._index(last, end["character"]) :]
+        ).splitlines(keepends=True)
+
+
+class GeniacLanguageServer(LogMixin):
+    """Publish geniac lint diagnostics of the workflow and config files open in an editor
+
+    The whole project is linted when the server starts and when a file is saved. When a document
+    is edited, only its top level blocks which changed are parsed again. The workflow and config
+    phases are then run again from the parsed blocks and the label checks use the state of the
+    geniac folders found by the last full lint.
+    """
+
+    def __init__(self, src_path=".", stdin=None, stdout=None, **kwargs):
+        """
+
+        Args:
+            src_path (str): project used if the client does not give a root folder
+            stdin: binary stream from which the client messages are read
+            stdout: binary stream on which the server messages are written
+        """
+        super().__init__()
+        self.root = Path(src_path).resolve()
+        self.stdin = stdin or sys.stdin.buffer
+        self.stdout = stdout or sys.stdout.buffer
+        self.lint_kwargs = {
+            option: value
+            for option, value in kwargs.items()
+            if option in ("config_file", "select", "ignore")
+        }
+        self.documents = {}
+        self.lint = None
+        self._static_records = []
+        self._published = set()
+        self._active_path = None
+        self._messages = queue.Queue()
+
+    def run(self):
+        """Serve the client until it sends the exit notification"""
+        # The standard output is used by the protocol
+        handlers = [
+            handler
+            for handler in logging.getLogger().handlers
+            if isinstance(handler, logging.StreamHandler) and handler.stream is sys.stdout
+        ]
+        for handler in handlers:
+            handler.setStream(sys.stderr)
+        threading.Thread(target=self._read_messages, daemon=True).start()
+        try:
+            while (message := self._messages.get()) is not None:
+                edited = self.handle(message)
+                # Edits received in the meantime are applied before linting once
+                while not self._messages.empty():
+                    if (message := self._messages.get()) is None:
+                        return
+                    edited = self.handle(message) or edited
+                if edited:
+                    self.relint()
+                if message.get("method") == "exit":
+                    return
+        finally:
+            for handler in handlers:
+                handler.setStream(sys.stdout)
+            geniac.cli.utils.errorcounter.error_counter = 0
+
+    def _read_messages(self):
+        """Queue the messages of the client"""
+        while (message := read_message(self.stdin)) is not None:
+            self._messages.put(message)
+            if message.get("method") == "exit":
+                break
+        self._messages.put(None)
+
+    def handle(self, message: dict) -> bool:
+        """Handle a client message
+
+        Returns:
+            edited (bool): True if a document has been edited and should be linted again
+        """
+        method, params = message.get("method"), message.get("params") or {}
+        if method == "initialize":
+            if root_uri := params.get("rootUri"):
+                self.root = uri_to_path(root_uri).resolve()
+            elif root_path := params.get("rootPath"):
+                self.root = Path(root_path).resolve()
+            self._respond(
+                message,
+                {
+                    "capabilities": {
+                        "positionEncoding": "utf-16",
+                        "textDocumentSync": {"openClose": True, "change": 2, "save": True},
+                    },
+                    "serverInfo": {"name": "geniac"},
+                },
+            )
+        elif method == "initialized":
+            self.full_lint()
+        elif method == "shutdown":
+            self._respond(message, None)
+        elif method == "textDocument/didOpen":
+            document = params["textDocument"]
+            path = uri_to_path(document["uri"])
+            self.documents[path] = TextDocument(
+                document["uri"], document["text"], document.get("version", 0)
+            )
+            self._active_path = path
+            return True
+        elif method == "textDocument/didChange":
+            path = uri_to_path(params["textDocument"]["uri"])
+            if (document := self.documents.get(path)) is not None:
+                for change in params.get("contentChanges", []):
+                    document.apply_change(change)
+                document.version = params["textDocument"].get("version", document.version)
+                self._active_path = path
+                return True
+        elif method == "textDocument/didClose":
+            self.documents.pop(uri_to_path(params["textDocument"]["uri"]), None)
+            return True
+        elif method in ("textDocument/didSave", "workspace/didChangeWatchedFiles"):
+            self.full_lint()
+        elif "id" in message and method is not None:
+            self._respond(message, error={"code": -32601, "message": f"Unknown method {method}"})
+        return False
+
+    def _respond(self, request: dict, result=None, error: dict = None):
+        """Answer a client request"""
+        response = {"id": request.get("id")}
+        if error is not None:
+            response["error"] = error
+        else:
+            response["result"] = result
+        write_message(self.stdout, response)
+
+    def _collect(self, function, *args) -> list:
+        """Run a lint function and return the records of its findings"""
+        with RecordCollector() as collector:
+            try:
+                function(*args)
+            except SystemExit:
+                # Critical findings stop the lint but not the server
+                pass
+        return collector.records
+
+    def full_lint(self):
+        """Lint the whole project, including the geniac folders"""
+        self.lint = GeniacLint(
+            self.root,
+            documents={path: document.text for path, document in self.documents.items()},
+            **self.lint_kwargs,
+        )
+        records = self._collect(self.lint._run_checks)
+        # Findings of the phases and rules which are not checked again while editing
+        static_rules = (
+            {rule.rule_id for rule in GeniacLint.RULES if not rule.phases}
+            | {GeniacLint.PHASES["folders"][1]}
+            | set(GeniacLint.FOLDER_RULES.values())
+        )
+        self._static_records = [record for record in records if record[3] in static_rules]
+        self.publish(records)
+
+    def relint(self):
+        """Lint the edited documents again without browsing the geniac folders"""
+        if self.lint is None:
+            self.full_lint()
+            return
+        self.lint.documents = {path: document.text for path, document in self.documents.items()}
+        self.lint.reset_phases(EDITED_PHASES)
+
+        def run_rules():
+            # Conda recipes are not searched on each keystroke
+            rules = [
+                rule
+                for rule in self.lint.enabled_rules
+                if rule.phases and rule.rule_id != "conda-availability"
+            ]
+            with disabled_rules(rule.rule_id for rule in GeniacLint.RULES if rule not in rules):
+                self.lint._run_rules(rules, set(EDITED_PHASES), set())
+
+        self.publish(self._static_records + self._collect(run_rules))
+
+    def publish(self, records: list):
+        """Send the diagnostics of every file, clearing those of the files without findings"""
+        diagnostics = {}
+        default_path = self._active_path or self.root / "nextflow.config"
+        for levelno, _, message, rule, file, line in records:
+            path = default_path if not file else Path(file)
+            if not path.is_absolute():
+                path = self.root / path
+            # Findings which are not located in a file are shown on its first line
+            line = line - 1 if line else 0
+            diagnostics.setdefault(path.as_uri(), []).append(
+                {
+                    "range": {
+                        "start": {"line": line, "character": 0},
+                        "end": {"line": line + 1, "character": 0},
+                    },
+                    "severity": LSP_SEVERITIES.get(levelno, 3),
+                    "source": "geniac",
+                    "code": rule,
+                    "message": message,
+                }
+            )
+        for uri in self._published - set(diagnostics):
+            diagnostics[uri] = []
+        for uri, items in diagnostics.items():
+            write_message(
+                self.stdout,
+                {
+                    "method": "textDocument/publishDiagnostics",
+                    "params": {"uri": uri, "diagnostics": items},
+                },
+            )
+        self._published = {uri for uri, items in diagnostics.items() if items}
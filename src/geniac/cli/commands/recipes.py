@@ -5,7 +5,6 @@
 
 import logging
 import re
-import shutil
 import os
 from pathlib import Path
 
@@ -35,7 +34,7 @@ class GeniacRecipes(GeniacInit):
         """Generate container recipes"""
 
         cmake_run = (
-            self._subprocess_run(
+            self._cmake_configure(
                 ["cmake", "-DCMAKE_INSTALL_PREFIX=" + (self.working_dirs["src"]).as_posix() + "/../.install", (self.working_dirs["src"] / "geniac").as_posix()],
                 check=True,
                 capture_output=True,
@@ -71,12 +70,15 @@ class GeniacRecipes(GeniacInit):
         )
         output_dir = Path(self.working_dirs["build"].as_posix() + "/../recipes").as_posix()
         output_dir = os.path.realpath(output_dir)
-        if os.path.isdir(output_dir):
-            shutil.rmtree(output_dir)
-            self.info("The folder '%s' has been deleted and will be reinitialized.", output_dir)
 
-        shutil.copytree((self.working_dirs["build"]).as_posix() + "/workDir/results/docker/Dockerfiles/", output_dir + "/docker/")
-        shutil.copytree((self.working_dirs["build"]).as_posix() + "/workDir/results/singularity/deffiles/", output_dir + "/singularity/")
+        results_dir = self.working_dirs["build"] / "workDir" / "results"
+        self.publish_outputs(
+            {
+                "docker": results_dir / "docker" / "Dockerfiles",
+                "singularity": results_dir / "singularity" / "deffiles",
+            },
+            output_dir,
+        )
         self.info("The '%s' folder has been created with container recipes generated by geniac.", output_dir)
 
 
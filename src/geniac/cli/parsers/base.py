@@ -3,20 +3,25 @@
 
 """base.py: Geniac base file parser"""
 
+import copy
+import hashlib
 import logging
 import re
 import tempfile
 import typing
 from abc import abstractmethod
 from collections import OrderedDict
-from io import StringIO
+from io import BytesIO, StringIO
 from json import dumps
-from os import PathLike
+from os import PathLike, fstat
 from pathlib import Path
 
 from dotty_dict import Dotty
 
 from geniac.cli.utils.base import GeniacBase
+from geniac.cli.utils.cache import GeniacCache
+from geniac.cli.utils.logging import RecordCollector
+from geniac.cli.utils.profiler import ProfiledPattern, profile_count
 
 __author__ = "Fabrice Allain"
 __copyright__ = "Institut Curie 2020"
@@ -33,10 +38,69 @@ class GDotty(Dotty):
         self._data.update(other)
 
 
+def merge_content(target: dict, source: dict) -> dict:
+    """Merge a parsed content in another one, concatenating lists, without modifying source"""
+    for key, value in source.items():
+        current = target.get(key)
+        if isinstance(value, dict):
+            if not isinstance(current, dict):
+                # Keep the mapping type (defaultdict for instance) of the source
+                current = copy.copy(value)
+                current.clear()
+                target[key] = current
+            merge_content(current, value)
+        elif isinstance(value, list):
+            target[key] = (current if isinstance(current, list) else []) + value
+        else:
+            target[key] = value
+    return target
+
+
+def split_blocks(lines: list, masked_lines: list = None) -> list:
+    """Split lines without comments in top level blocks
+
+    A block is either a line outside of any curly bracket or the lines between an opening
+    curly bracket at the top level and its closing bracket.
+
+    Args:
+        lines (list): lines without comments
+        masked_lines (list): the same lines where the curly brackets which are not part of the
+            code (e.g. in strings) are masked, used to find the blocks if given
+
+    Returns:
+        blocks (list): (index of the first line, lines) for each block
+    """
+    blocks = []
+    depth = 0
+    start = 0
+    for idx, line in enumerate(masked_lines if masked_lines is not None else lines):
+        depth = max(0, depth + line.count("{") - line.count("}"))
+        if not depth:
+            blocks.append((start, lines[start : idx + 1]))
+            start = idx + 1
+    if start < len(lines):
+        blocks.append((start, lines[start:]))
+    return blocks
+
+
+def _shift_records(records: list, offset: int) -> list:
+    """Move the line of the records saved by a RecordCollector"""
+    return [
+        [*record[:5], record[5] + offset if record[5] is not None else None]
+        for record in records
+    ]
+
+
 class GeniacParser(GeniacBase):
     """Geniac file parser"""
 
-    COM_RE = re.compile(
+    # Parsed top level blocks shared by the parsers of the process (least recently used first)
+    BLOCK_CACHE = OrderedDict()
+    BLOCK_CACHE_SIZE = 4096
+    # Key prefix of the parsed blocks kept in a persistent cache
+    BLOCK_STORE_PREFIX = "parse.block:"
+
+    COM_RE = ProfiledPattern(
         r"(?P<tdquote>\"{3}[\S\s]*?\"{3})|"
         r"(?P<tquote>\'{3}[\S\s]*?\'{3})|"
         r"(?P<squote>\'[^\']*\')|"
@@ -53,6 +117,9 @@ class GeniacParser(GeniacBase):
         self._path = ""
         self._loaded_paths = []
         self._content = OrderedDict()
+        self._lines = OrderedDict()
+        # Definitions of content keys found in the file being parsed
+        self._definitions = []
 
     @property
     def content(self):
@@ -66,6 +133,43 @@ class GeniacParser(GeniacBase):
             value if isinstance(value, GDotty) else GDotty({} if not value else value)
         )
 
+    @property
+    def lines(self):
+        """Line number of the first definition of each content key in the files read"""
+        return self._lines
+
+    def line_of(self, key: str):
+        """Line of a content key, or first line of the keys of its scope (None if not found)"""
+        if key in self._lines:
+            return self._lines[key]
+        return min(
+            (line for name, line in self._lines.items() if name.startswith(f"{key}.")),
+            default=None,
+        )
+
+    def location(self, key: str = None) -> dict:
+        """File and line of a content key, given as extra attributes of a log record"""
+        if not isinstance(self.path, (str, PathLike)) or not self.path:
+            return {"file": None, "line": self.line_of(key) if key else None}
+        path = Path(self.path)
+        if path.is_relative_to(self.src_path):
+            path = path.relative_to(self.src_path)
+        return {"file": str(path), "line": self.line_of(key) if key else None}
+
+    def _set_line(self, key: str, line: int):
+        """Keep the line where a content key is defined for the first time"""
+        self._lines.setdefault(key, line)
+
+    def _annotate_content(self):
+        """Add the line numbers to the parsed content once a file has been read"""
+
+    def _check_definitions(self, definitions: list):
+        """Check the definitions of a file parsed block by block
+
+        Args:
+            definitions (list): (content key, line, checked flag) of each definition of the file
+        """
+
     @property
     def path(self):
         """Content loaded from input file with read method"""
@@ -112,18 +216,132 @@ class GeniacParser(GeniacBase):
             return self[key]
         return default
 
-    def _remove_comments(self, in_file, temp_file):
-        # Remove comments for the analysis
+    @classmethod
+    def _strip_comments(cls, text: str) -> str:
+        """Remove comments, keeping the line breaks of multi-line comments"""
 
         def match_comments(match):
             """Filter comments from match object"""
-            return "" if match.group("mcom") or match.group("scom") else match.group(0)
+            if match.group("mcom") or match.group("scom"):
+                return "\n" * match.group(0).count("\n")
+            return match.group(0)
+
+        return cls.COM_RE.sub(match_comments, text)
+
+    @classmethod
+    def _mask_strings(cls, text: str) -> str:
+        """Replace the curly brackets of the strings by spaces, keeping everything else"""
+
+        def mask_brackets(match):
+            """Mask the curly brackets of quoted strings from match object"""
+            if match.group("mcom") or match.group("scom"):
+                return match.group(0)
+            return match.group(0).replace("{", " ").replace("}", " ")
 
-        input_content = self.COM_RE.sub(match_comments, in_file.read())
+        return cls.COM_RE.sub(mask_brackets, text)
+
+    def _remove_comments(self, in_file, temp_file):
+        # Remove comments for the analysis
+        input_content = self._strip_comments(in_file.read())
+        profile_count("lines", input_content.count("\n"))
         temp_file.write(bytes(input_content, encoding=DEFAULT_ENCODING))
         temp_file.seek(0)
         return temp_file
 
+    def read_text(
+        self,
+        text: str,
+        in_path: PathLike,
+        block_store: GeniacCache = None,
+        block_ttl: float = None,
+        **kwargs,
+    ) -> dict:
+        """Parse the content of a file given as text, block by block
+
+        Each top level block is parsed separately and its content is cached with the messages
+        logged while parsing it. Only the blocks which changed since a previous call are parsed
+        again. Line numbers of the blocks and of their findings are kept relative to the
+        block in the cache, so that a block moved by an edit is not parsed again. Checks which
+        depend on several blocks are run on the definitions of the whole file.
+
+        Args:
+            text (str): content of the file
+            in_path (PathLike): path to the file
+            block_store (GeniacCache): persistent cache where the parsed blocks are also kept,
+                for the next geniac processes
+            block_ttl (float): time to live in seconds of the blocks kept in block_store
+            flush_content (bool): flag used to flush previous content before reading
+            warnings (bool): flag to turn on/off warning messages
+
+        Returns:
+            content (dict): content parsed from the text
+        """
+        self.path = in_path
+        text = self._strip_comments(text)
+        # Content of the files read previously is kept unless flush_content is set
+        if kwargs.get("flush_content"):
+            content, lines = OrderedDict(), OrderedDict()
+        else:
+            content, lines = merge_content(OrderedDict(), self.content), self._lines.copy()
+        definitions = []
+        for start, block in split_blocks(
+            text.splitlines(keepends=True),
+            self._mask_strings(text).splitlines(keepends=True),
+        ):
+            block_text = "".join(block)
+            key = hashlib.sha1(
+                f"{self.__class__.__name__}\0{self.src_path}\0{in_path}\0{block_text}".encode()
+            ).hexdigest()
+            if (cached := self.BLOCK_CACHE.get(key)) is None and block_store is not None:
+                if (cached := block_store.get(self.BLOCK_STORE_PREFIX + key)) is not None:
+                    self.BLOCK_CACHE[key] = cached
+            if cached is not None:
+                self.BLOCK_CACHE.move_to_end(key)
+                block_content, block_lines, block_definitions, records = cached
+                RecordCollector.replay(_shift_records(records, start))
+            else:
+                profile_count("lines", len(block))
+                self._content, self._lines = OrderedDict(), OrderedDict()
+                self._definitions = []
+                with RecordCollector() as collector:
+                    self._read(
+                        BytesIO(block_text.encode(DEFAULT_ENCODING)),
+                        in_path=in_path,
+                        first_line=start,
+                        # Each block is parsed from an empty content
+                        **{**kwargs, "warnings": False, "flush_content": False},
+                    )
+                block_content = merge_content(OrderedDict(), self.content)
+                block_lines = {name: line - start for name, line in self._lines.items()}
+                block_definitions = [
+                    (name, line - start, checked) for name, line, checked in self._definitions
+                ]
+                records = _shift_records(collector.records, -start)
+                self.BLOCK_CACHE[key] = (block_content, block_lines, block_definitions, records)
+                if block_store is not None:
+                    block_store.set(
+                        self.BLOCK_STORE_PREFIX + key,
+                        [block_content, block_lines, block_definitions, records],
+                        ttl=block_ttl,
+                    )
+                if len(self.BLOCK_CACHE) > self.BLOCK_CACHE_SIZE:
+                    self.BLOCK_CACHE.popitem(last=False)
+            merge_content(content, block_content)
+            for name, line in block_lines.items():
+                lines.setdefault(name, line + start)
+            definitions += [
+                (name, line + start, checked) for name, line, checked in block_definitions
+            ]
+        self.content = content
+        self._lines = lines
+        self._definitions = definitions
+        if kwargs.get("warnings", True):
+            self._check_definitions(definitions)
+        self._annotate_content()
+        if in_path not in self.loaded_paths:
+            self.loaded_paths += [in_path]
+        return self.content
+
     @abstractmethod
     def _read(
         self,
@@ -139,6 +357,7 @@ class GeniacParser(GeniacBase):
             in_path (PathLike): path to input file
             flush_content (bool): flag used to flush previous content before reading
             warnings (bool): flag to turn on/off warning messages
+            first_line (int): index of the first line of in_file in the file
 
         Returns:
             content (TextIO): Raw content of the file
@@ -175,6 +394,8 @@ class GeniacParser(GeniacBase):
                 ) as input_file, tempfile.TemporaryFile() as temp_file:
                     # Format files before reading
                     temp_file = self._remove_comments(input_file, temp_file)
+                    profile_count("reads")
+                    profile_count("bytes_read", fstat(input_file.fileno()).st_size)
                     temp_content = self._read(
                         temp_file, encoding=encoding, in_path=in_path, **kwargs
                     )
@@ -184,6 +405,7 @@ class GeniacParser(GeniacBase):
                         dumps(dict(self.content), indent=2),
                     )
                     self.loaded_paths += [in_path]
+                    self._annotate_content()
             except OSError:
                 continue
             read_ok.append((in_path, temp_content))
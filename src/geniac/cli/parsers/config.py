@@ -4,11 +4,11 @@
 """config.py: Nextflow configuration file parser"""
 
 from pathlib import Path
-import re
 import typing
 from collections import ChainMap, OrderedDict
 
 from geniac.cli.parsers.base import DEFAULT_ENCODING, GeniacBase, GeniacParser, PathLike
+from geniac.cli.utils.profiler import ProfiledPattern
 
 __author__ = "Fabrice Allain"
 __copyright__ = "Institut Curie 2020"
@@ -18,20 +18,20 @@ class NextflowConfig(GeniacParser):
     """Nextflow config file parser"""
 
     # Param = value
-    PARAM_RE = re.compile(
+    PARAM_RE = ProfiledPattern(
         r"^ *(?P<scope>[\w.]+(?=\.))?\.?(((?P<property>[\w]+)\s*=\s*"
         r"(?P<elvis>[.\w]+\s*\?:\s*)?(?P<value>([\"\']?.*[\"\']?)|(\d+\.?\w*)|"
         r"(\[[\w\s\'\"/,-]*])|({[\w\s\'\"/,.\-*()]*})))|"
         r"((?P<includeConfig>includeConfig) +['\"](?P<confPath>[\w/.]+))['\"].*) *$"
     )
-    SCOPE_RE = re.compile(
+    SCOPE_RE = ProfiledPattern(
         r"^ *(['\"]?(?P<scope>[\w]+)(?<!try)['\"]?|"
         r"(?P<selector>[\w]+) *: *(?P<label>[\w]+)|"
         r"(?P<beforeClose>})?(?P<other>.+)(?<!\$)) *{ *(?P<afterClose>})?$"
     )
-    ESCOPE_RE = re.compile(r"^ *}\s*$")
+    ESCOPE_RE = ProfiledPattern(r"^ *}\s*$")
     
-    SINGLE_LINE_WITH_LABEL_SCOPE_RE = re.compile(r"^\s*(?P<singleLine>withLabel\s*:\s*\w+)\s*{(?P<singleLineInBracket>.*)}\s*$")
+    SINGLE_LINE_WITH_LABEL_SCOPE_RE = ProfiledPattern(r"^\s*(?P<singleLine>withLabel\s*:\s*\w+)\s*{(?P<singleLineInBracket>.*)}\s*$")
 
 
     def _check_config_scope_format(self, nxf_config_scope: str, scope: dict):
@@ -43,7 +43,7 @@ class NextflowConfig(GeniacParser):
             scope (dict): related scope with the nested Nextflow parameters
         """
         properties_pattern = [
-            re.compile(pattern)
+            ProfiledPattern(pattern)
             for pattern in self.get_config_scope_option_list(
                 nxf_config_scope, "patterns"
             )
@@ -60,6 +60,7 @@ class NextflowConfig(GeniacParser):
                         "Parameter %s is not correctly formatted. Read the documentation for more "
                         "details.",
                         ".".join((nxf_config_scope, property_name)),
+                        extra=self.location(".".join((nxf_config_scope, property_name))),
                     )
 
     def _check_config_scope(self, nxf_config_scope: str, scope: dict):
@@ -106,6 +107,7 @@ class NextflowConfig(GeniacParser):
                                     for _ in filter(None, default_values)
                                 ]
                             ),
+                            extra=self.location(f"{nxf_config_scope}.{config_prop}"),
                         )
                     else:
                         self.error(
@@ -148,6 +150,7 @@ class NextflowConfig(GeniacParser):
                 "Section %s in Nextflow configuration file %s is empty.",
                 nxf_config_scope,
                 self.path.relative_to(self.src_path),
+                extra=self.location(nxf_config_scope),
             )
 
         # Check if config_paths/config_props in the Nextflow config corresponds to
@@ -174,6 +177,7 @@ class NextflowConfig(GeniacParser):
                         "Label %s of %s is not defined neither in params.geniac.tools nor availabe as a module.",
                         label,
                         section_name,
+                        extra=nxf_config.location(f"{section_name}.{label}"),
                     )
 
     def _set_scope(self, values: dict, scope_idx: str, def_flag: bool):
@@ -229,6 +233,7 @@ class NextflowConfig(GeniacParser):
             values (dict): group dict from matching pattern
             scope_idx (str): Index of the scope in content tree structure
             line_idx (int): Index of the current line in the file
+            warnings (bool): flag to turn on/off warning messages
         """
         prop_key = "property" if values.get("property") else "includeConfig"
         value_key = "value" if values.get("value") else "confPath"
@@ -254,37 +259,52 @@ class NextflowConfig(GeniacParser):
             if "'" in value
             else value
         )
+        checked = bool(value) and prop_key != "includeConfig"
         # If parameter has already been defined in a previous configuration
         # file
         if (
-            value
+            checked
             and warnings
             and param_idx in self.content
             and self.content[param_idx]
-            and prop_key != "includeConfig"
         ):
-            history_paths = [
-                conf_path.relative_to(self.src_path).name
-                for conf_path in self.loaded_paths
-            ]
-            extra_msg = (
-                f" in a previous configuration file {history_paths}"
-                if self.loaded_paths
-                else " in the same file"
-            )
-            self.warning(
-                "Parameter %s from %s at line %s has already been defined%s.",
-                param_idx,
-                self.path.relative_to(self.src_path),
-                line_idx + 1,
-                extra_msg,
-            )
+            self._warn_defined(param_idx, line_idx + 1)
+        self._definitions.append((param_idx, line_idx + 1, checked))
+        self._set_line(param_idx, line_idx + 1)
         self.content[param_idx] = (
             [value]
             if param_idx not in self.content
             else self.content[param_idx] + [value]
         )
 
+    def _warn_defined(self, param_idx: str, line: int):
+        """Warn that a parameter is defined again at a line"""
+        history_paths = [
+            conf_path.relative_to(self.src_path).name
+            for conf_path in self.loaded_paths
+        ]
+        extra_msg = (
+            f" in a previous configuration file {history_paths}"
+            if self.loaded_paths
+            else " in the same file"
+        )
+        self.warning(
+            "Parameter %s from %s at line %s has already been defined%s.",
+            param_idx,
+            self.path.relative_to(self.src_path),
+            line,
+            extra_msg,
+            extra={**self.location(), "line": line},
+        )
+
+    def _check_definitions(self, definitions: list):
+        """Warn about the parameters defined several times in a file parsed block by block"""
+        defined = set()
+        for param_idx, line, checked in definitions:
+            if checked and param_idx in defined:
+                self._warn_defined(param_idx, line)
+            defined.add(param_idx)
+
     def _read(
         self,
         in_file: typing.Union[typing.IO, typing.BinaryIO],
@@ -292,6 +312,7 @@ class NextflowConfig(GeniacParser):
         in_path: PathLike = None,
         flush_content: bool = False,
         warnings: bool = True,
+        first_line: int = 0,
         **kwargs,
     ):
         """Load a Nextflow config file into content property
@@ -302,6 +323,7 @@ class NextflowConfig(GeniacParser):
             in_path (PathLike): path to input file
             flush_content (bool): flag used to flush previous content before reading
             warnings (bool): flag to turn on/off warning messages
+            first_line (int): index of the first line of in_file in the file
 
         Returns:
             content (
@@ -311,7 +333,8 @@ class NextflowConfig(GeniacParser):
         scope_idx = ""
         content_cache = self.content
         for line_idx, line in enumerate(
-            super()._read(in_file, encoding=encoding, flush_content=True, **kwargs)
+            super()._read(in_file, encoding=encoding, flush_content=True, **kwargs),
+            start=first_line,
         ):
             # Single line scope (i.e. open and close brackets on the same line in process.config)
             if match := self.SINGLE_LINE_WITH_LABEL_SCOPE_RE.match(line):
@@ -321,7 +344,8 @@ class NextflowConfig(GeniacParser):
                             line,
                             " " + match.groupdict().get("singleLine") + " {",
                             " " + match.groupdict().get("singleLineInBracket"),
-                            " }"
+                            " }",
+                            extra={**self.location(), "line": line_idx + 1},
                             )
             # Pop scope index list if we find a curly bracket
             # Turn off def flag if we reach the last scope in a def
@@ -354,9 +378,21 @@ class NextflowConfig(GeniacParser):
 class NextflowConfigContainer(GeniacBase, ChainMap):
     """Container object to save nextflow config files"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.configs = []
+
     def append(self, item: NextflowConfig):
         """Add a new Nextflow Config"""
         self.maps.append(item.content)
+        self.configs.append(item)
+
+    def location(self, key: str = None) -> dict:
+        """File and line of a content key in the first config file defining it"""
+        for config in self.configs:
+            if (location := config.location(key))["line"] is not None:
+                return location
+        return {"file": None, "line": None}
 
     def check_labels_in_section(self, section_name, labels):
         """Check if given labels exists within a section"""
@@ -3,11 +3,11 @@
 
 """scripts.py: Nextflow scripts parser."""
 
-import re
 import typing
 from collections import OrderedDict, defaultdict
 
 from geniac.cli.parsers.base import GeniacParser, PathLike
+from geniac.cli.utils.profiler import ProfiledPattern
 
 __author__ = "Fabrice Allain"
 __copyright__ = "Institut Curie 2021"
@@ -17,22 +17,22 @@ class NextflowScript(GeniacParser):
     """Nextflow script file parser"""
 
     # process flag
-    PROCESS_RE = re.compile(r"^ *process +(?P<processName>\w+) *{")
+    PROCESS_RE = ProfiledPattern(r"^ *process +(?P<processName>\w+) *{")
     # process label
-    LABEL_RE = re.compile(r"^ *label +['\"](?P<labelName>\w+)['\"] *")
+    LABEL_RE = ProfiledPattern(r"^ *label +['\"](?P<labelName>\w+)['\"] *")
     # process label defined by a variable
-    LABEL_VARIABLE_RE = re.compile(r"^ *label +[(](?P<labelParamsValue>.*) \?\: ['\"'](?P<labelName>.*)['\"'][)] *")
+    LABEL_VARIABLE_RE = ProfiledPattern(r"^ *label +[(](?P<labelParamsValue>.*) \?\: ['\"'](?P<labelName>.*)['\"'][)] *")
     # script flag
-    SCRIPT_RE = re.compile(
+    SCRIPT_RE = ProfiledPattern(
         r"^ *(?P<startScript>[\"']{3})"
         r"((?P<script>.+)(?<=(?P<endScript>[\"']{3})))? *$"
     )
     # output/input flag
-    INOUT_RE=re.compile(r"^[ \t]*(?P<inout>input|output|script):[ \t]*")
+    INOUT_RE=ProfiledPattern(r"^[ \t]*(?P<inout>input|output|script):[ \t]*")
     # renvInit invokation
-    RENV_INIT_RE = re.compile(r"\s*(?P<renvInit>renv\w+Init)\(['\"'](?P<renvLabel>\w+)['\"']\)")
-    RENV_INIT_OUT_RE = re.compile(r"\s*(?P<renvProcess>\w+)\((?P<renvInit>\w+).*\.out\.renvInitDone\)")
-    RENV_INIT_INCLUDE_RE = re.compile(r"\s*include\s*{\s*renvInit\s+as\s+(?P<renvInitInclude>\w+)\s*}\s+from\s+['\"'](?P<renvInitFile>.*)['\"']")
+    RENV_INIT_RE = ProfiledPattern(r"\s*(?P<renvInit>renv\w+Init)\(['\"'](?P<renvLabel>\w+)['\"']\)")
+    RENV_INIT_OUT_RE = ProfiledPattern(r"\s*(?P<renvProcess>\w+)\((?P<renvInit>\w+).*\.out\.renvInitDone\)")
+    RENV_INIT_INCLUDE_RE = ProfiledPattern(r"\s*include\s*{\s*renvInit\s+as\s+(?P<renvInitInclude>\w+)\s*}\s+from\s+['\"'](?P<renvInitFile>.*)['\"']")
 
 
     def _read(
@@ -49,6 +49,7 @@ class NextflowScript(GeniacParser):
             in_path (PathLike): path to the input file
             flush_content (bool): flag used to flush previous content before reading
             warnings (bool): flag to turn on/off warning messages
+            first_line (int): index of the first line of in_file in the file
         """
         script_flag = False
         process = ""
@@ -60,7 +61,8 @@ class NextflowScript(GeniacParser):
         self.content["renvInitLabel"] = self.content.get("renvInitLabel") or OrderedDict()
         self.content["renvInitOut"] = self.content.get("renvInitOut") or OrderedDict()
         self.content["renvInitInclude"] = self.content.get("renvInitInclude") or OrderedDict()
-        for idx, line in enumerate(super()._read(in_file, **kwargs)):
+        first_line = kwargs.pop("first_line", 0)
+        for idx, line in enumerate(super()._read(in_file, **kwargs), start=first_line):
             if match := self.RENV_INIT_RE.match(line):
                 values = match.groupdict()
                 renvInit = values.get("renvInit")
@@ -87,6 +89,7 @@ class NextflowScript(GeniacParser):
                 self.content["process"][process] = defaultdict(list)
                 # Save the path to the nextflow script for future logs
                 self.content["process"][process]["NextflowScriptPath"] = str(in_path)
+                self._set_line(f"process.{process}", idx + 1)
             if match := self.LABEL_RE.match(line):
                 values = match.groupdict()
                 label = values.get("labelName")
@@ -138,3 +141,9 @@ class NextflowScript(GeniacParser):
                 self.debug("Add line %s to process %s scope for input part.", idx, process)
                 self.content["process"][process]["input"].append(line.strip())
                 continue
+
+    def _annotate_content(self):
+        """Save the line of each process with the path to its script"""
+        for process, process_scope in self.content.get("process", {}).items():
+            if (line := self.lines.get(f"process.{process}")) is not None:
+                process_scope["NextflowScriptLine"] = line
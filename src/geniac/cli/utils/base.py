@@ -3,33 +3,40 @@
 
 """base.py: Define GBase class and several utils functions"""
 
+import atexit
 import errno
+import hashlib
+import json
 import logging
 import os
 import re
 import sys
+import time
 import importlib_resources
 from abc import ABC
+from functools import lru_cache
 from configparser import ConfigParser, ExtendedInterpolation
-from distutils.dir_util import copy_tree
 from json import loads as json_loads
 from os.path import basename, dirname, isfile
 from pathlib import Path
-from shutil import rmtree
 from sys import exit as sys_exit
-from tempfile import TemporaryDirectory, mkdtemp
+from tempfile import TemporaryDirectory, gettempdir, mkdtemp
 from typing import NamedTuple
 
-import shutil
-
 import validators
-from git import Repo
+from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError, Repo
 
 # TODO: use importlib.resources in the future
 # https://importlib-resources.readthedocs.io/en/latest/migration.html#pkg-resources-resource-filename
 # from pkg_resources import resource_filename, resource_stream
 
+from geniac.cli.utils.cache import fingerprint_files
+from geniac.cli.utils.cleanup import BackgroundCleaner
+from geniac.cli.utils.fs import MATERIALIZE_METHODS, materialize_tree, stat_tree, sync_tree, walk_tree
 from geniac.cli.utils.logging import LogMixin
+from geniac.cli.utils.mirrors import GitMirrorCache, clone_repository
+from geniac.cli.utils.vfs import LocalTree, SourceTree
+from geniac.cli.utils.workdirs import WorkdirStore
 from geniac import __version__
 
 __author__ = "Fabrice Allain"
@@ -49,6 +56,8 @@ https://docs.microsoft.com/en-us/windows/win32/debug/system-error-codes--0-499-
 """
 
 ### Geniac variables
+# geniac folder of the python package, copied in the source folder of the working directories
+GENIAC_REPO_PATH = Path(__file__).parent / "../../repo"
 GENIAC_CONFIG_FILES=['conda.config',
         'multiconda.config',
         'path.config',
@@ -65,6 +74,13 @@ def load_logging_config(logging_config_path) -> dict:
         return json_loads(logging_config_file.read().decode())
 
 
+@lru_cache(maxsize=None)
+def read_default_config(package: str, resource: str) -> str:
+    """Read a configuration file shipped with geniac once per process"""
+    with importlib_resources.files(package).joinpath(resource).open("rb") as fp:
+        return fp.read().decode()
+
+
 def _dir_checker(value: str):
     """
     Exit if the path is not correct
@@ -76,13 +92,15 @@ def _dir_checker(value: str):
     return path.resolve()
 
 
-def glob_solver(input_path: str, lazy_flag: bool = False):
+def glob_solver(input_path: str, lazy_flag: bool = False, source_tree: SourceTree = None):
     """
     Use native glob solver to expand glob patterns from an input path
 
     Args:
         input_path (str): input file path
         lazy_flag (bool): expand to existing paths or generate paths without any check
+        source_tree (SourceTree): view of the files in which patterns are expanded (the file
+            system by default)
 
     Returns:
         output_paths (list): list of expanded paths
@@ -96,6 +114,7 @@ def glob_solver(input_path: str, lazy_flag: bool = False):
                 basename(input_path),
             )
             no_glob_file = "*" not in file_name
+            source_tree = source_tree or LocalTree(stem_path)
             # IF LAZY
             #   IF no_glob_file THEN we make a pattern without the file_name and add it
             #       to the path after the glob expansion
@@ -119,12 +138,11 @@ def glob_solver(input_path: str, lazy_flag: bool = False):
             return (
                 [
                     path / Path(file_name)
-                    for path in stem_path.glob(glob_pattern)
-                    if path.is_dir()
-                    and not path.resolve().samefile(stem_path.resolve())
+                    for path in source_tree.glob(stem_path, glob_pattern)
+                    if source_tree.is_dir(path) and path.resolve() != stem_path.resolve()
                 ]
                 if lazy_flag and no_glob_file
-                else sorted(stem_path.glob(glob_pattern))
+                else source_tree.glob(stem_path, glob_pattern)
             )
     return [""]
 
@@ -217,6 +235,16 @@ class GeniacBase(ABC, LogMixin):
     CACHE_NAME = ".geniac"
     SRC_NAME = "src"
     BUILD_NAME = "build"
+    # Config sections of the geniac working directory options
+    GENIAC_WORKDIR = "geniac.workdir"
+    GENIAC_WORKDIR_MANIFEST = "geniac.workdir.manifest"
+    # Folders of the project always needed in the working directory (git information is read
+    # by CMake)
+    WORKDIR_FOLDERS = (".git",)
+    # Folder of the project replaced by the geniac repository of the python package
+    GENIAC_REPO_NAME = "geniac"
+    # State entries of a reused working directory which should match to skip its initialization
+    WORKDIR_STATE_KEYS = ("source", "git", "version", "options")
 
     def __init__(
         self,
@@ -226,6 +254,9 @@ class GeniacBase(ABC, LogMixin):
         pre_clean: bool = False,
         post_clean: bool = True,
         init_work_path: bool = False,
+        depth: int = None,
+        clone_filter: str = None,
+        sparse: bool = False,
         **kwargs,
     ) -> None:
         """
@@ -237,6 +268,10 @@ class GeniacBase(ABC, LogMixin):
             pre_clean (bool): should we clean every build folder before running any cmd ?
             post_clean (bool): should we clean every temporary folder at the end of the execution ?
             init_work_path (bool): should we init a working directory with source files inside ?
+            depth (int): number of commits cloned if the project is a git URL
+            clone_filter (str): partial clone filter used if the project is a git URL
+            sparse (bool): only check out the folders needed by the command if the project is a
+                git URL
         """
 
 
@@ -254,6 +289,7 @@ class GeniacBase(ABC, LogMixin):
         # Project path is optional but if it is not a valid url or a valid path, it will correspond
         # to the default config project.metadata.url
         self._src_path = None
+        self._tree = None
         (self.project_type, self.src_is_working_dir) = self._get_src_type(src_path, working_dir)
         self.src_path = src_path
 
@@ -267,8 +303,20 @@ class GeniacBase(ABC, LogMixin):
         self.config_file = Path(config_file) if config_file else None
         self.default_config = self._load_config(config_file=self.config_file)
         self._update_default_config(**kwargs)
+        # Shallow, partial and sparse clone options given on the command line
+        for option, value in (
+            ("cloneDepth", depth),
+            ("cloneFilter", clone_filter),
+            ("sparseClone", sparse),
+        ):
+            if value:
+                self.default_config.set(self.GENIAC_WORKDIR, option, str(value))
 
         self._tmp_dir = None
+        self._cleaner = None
+        # Reused working directory store and fingerprint of the project it has been refreshed with
+        self._workdir_store = None
+        self.workdir_fingerprint = None
 
         self.working_dir_is_valid = self._check_working_dir(working_dir)
         # Working dir correspond to tmp dir or working_dir
@@ -308,8 +356,7 @@ class GeniacBase(ABC, LogMixin):
         # Read default config file
         config.optionxform = str
         # config.read_string(resource_stream(*self.DEFAULT_CONFIG).read().decode())
-        with importlib_resources.files(self.DEFAULT_CONFIG[0]).joinpath(self.DEFAULT_CONFIG[1]).open("rb") as fp:
-            config.read_string(fp.read().decode())
+        config.read_string(read_default_config(*self.DEFAULT_CONFIG))
         if config_file:
             # Read configuration file
             config.read(config_file)
@@ -321,7 +368,9 @@ class GeniacBase(ABC, LogMixin):
         if self.config_section in self.default_config.sections():
             for option in self.default_config.options(self.config_section):
                 if option_value := kwargs.get(option):
-                    self.default_config.set(self.config_section, option, option_value)
+                    self.default_config.set(
+                        self.config_section, option, str(option_value)
+                    )
 
     def _check_working_dir(self, working_dir: str, info: bool = True) -> bool:
         """Check if given working dir is valid"""
@@ -404,7 +453,7 @@ class GeniacBase(ABC, LogMixin):
             if not nested_dir_path.exists():
                 nested_dir_path.mkdir()
             elif nested_dir_path.is_dir():
-                self.warning(
+                (self.debug if self._workdir_store else self.warning)(
                     "%s folder %s already exists",
                     nested_dir_name.capitalize(),
                     nested_dir_path.as_posix(),
@@ -414,16 +463,155 @@ class GeniacBase(ABC, LogMixin):
                     "Path %s should be an empty folder", nested_dir_path.as_posix()
                 )
 
-    def init_working_src_folder(self, git_branch: str):
-        """Copy or clone the project into src temp folder"""
+    def workdir_manifest(self) -> list:
+        """Folders of the project needed in the working directory by the current command
+
+        They are given by the tree sections listed for the command in geniac.workdir.manifest
+        section. The files at the root of the project are always needed.
+
+        Returns:
+            folders (list): paths relative to the project folder (None for the whole project)
+        """
+        if not self.default_config.has_option(self.GENIAC_WORKDIR_MANIFEST, self.geniac_cmd or ""):
+            return None
+        folders = list(self.WORKDIR_FOLDERS)
+        for tree_section in self.default_config.get(
+            self.GENIAC_WORKDIR_MANIFEST, self.geniac_cmd
+        ).split():
+            path = Path(self.default_config.get(f"tree.{tree_section}", "path"))
+            if path.resolve() == Path(self.src_path).resolve():
+                return None
+            folders.append(path.resolve().relative_to(Path(self.src_path).resolve()).as_posix())
+        self.debug("Folders of the project needed by geniac %s: %s", self.geniac_cmd, folders)
+        return folders
+
+    def workdir_files(self) -> dict:
+        """Folders and files of a local project reproduced in the working directory
+
+        Returns:
+            options (dict): included folders and excluded patterns given to materialize_tree
+        """
+        return {
+            "included": self.workdir_manifest(),
+            # The geniac folder of the project is replaced by the one of the python package and
+            # the config files generated by geniac are never copied
+            "excluded": self.default_config.get(
+                self.GENIAC_WORKDIR, "excluded", fallback=""
+            ).split()
+            + [self.GENIAC_REPO_NAME]
+            + [f"conf/{config_file}" for config_file in GENIAC_CONFIG_FILES],
+        }
+
+    @property
+    def hardlink_patterns(self) -> list:
+        """Glob patterns of the project files which can be hard linked in the working directory"""
+        return self.default_config.get(self.GENIAC_WORKDIR, "hardlinkPatterns", fallback="").split()
+
+    def _git_head(self) -> str:
+        """Description of the commit checked out in the project (None without git repository)"""
+        try:
+            repo = Repo(self.src_path)
+            return " ".join(
+                [repo.git.describe("--tags", "--always", "--long")]
+                + ([] if repo.head.is_detached else [repo.active_branch.name])
+            )
+        except (GitCommandError, InvalidGitRepositoryError, NoSuchPathError, ValueError):
+            return None
+
+    def workdir_state(self, previous: dict = None) -> dict:
+        """State of a reused working directory refreshed with the current project
+
+        The git history is described by the commit checked out rather than fingerprinted.
+
+        Args:
+            previous (dict): previous state of the working directory, whose file manifest
+                avoids hashing again the unchanged files
+
+        Returns:
+            state (dict): fingerprint of the project files, git commit, geniac version, options
+                of the copy and manifest of the project files (the files of the git folder being
+                identified by their stats only)
+        """
+        options = self.workdir_files()
+        paths = [
+            (rel_dir / file_name).as_posix()
+            for rel_dir, file_names in walk_tree(
+                self.src_path,
+                options["included"],
+                options["excluded"] + list(self.WORKDIR_FOLDERS),
+            )
+            for file_name in file_names
+        ]
+        fingerprint, manifest = fingerprint_files(
+            self.src_path, (previous or {}).get("manifest"), paths=paths
+        )
+        return {
+            "source": fingerprint,
+            "git": self._git_head(),
+            "version": __version__,
+            "options": options,
+            "manifest": manifest
+            | stat_tree(self.src_path, self.WORKDIR_FOLDERS),
+        }
+
+    def init_working_src_folder(
+        self,
+        git_branch: str,
+        refresh_geniac: bool = True,
+        state: dict = None,
+        previous_state: dict = None,
+    ):
+        """Copy or clone the project into src temp folder
+
+        Args:
+            git_branch (str): branch cloned if the project is a git URL
+            refresh_geniac (bool): should an existing geniac folder be replaced by the one of the
+                python package ?
+            state (dict): state of a reused working directory, whose source folder is only
+                synchronized with the changes of the project
+            previous_state (dict): state of the previous synchronization of the source folder
+        """
         # If src_path, copy it into src
+        copy_kwargs = {
+            "methods": self.default_config.get(
+                self.GENIAC_WORKDIR, "materialize", fallback="copy"
+            ).split(),
+            "workers": self.default_config.getint(self.GENIAC_WORKDIR, "copyWorkers", fallback=1),
+        }
         if self.project_type == "path":
+            start = time.monotonic()
+            counts = (
+                sync_tree(
+                    self.src_path,
+                    self.working_dirs["src"],
+                    state["manifest"],
+                    (previous_state or {}).get("manifest"),
+                    hardlink_patterns=self.hardlink_patterns,
+                    **copy_kwargs,
+                )
+                if state
+                else materialize_tree(
+                    self.src_path,
+                    self.working_dirs["src"],
+                    hardlink_patterns=self.hardlink_patterns,
+                    **copy_kwargs,
+                    **self.workdir_files(),
+                )
+            )
+            elapsed = time.monotonic() - start
+            copied = sum(counts[method] for method in MATERIALIZE_METHODS)
             self.info(
-                "Copy content of %s into geniac working directory %s",
+                "Copy content of %s into geniac working directory %s (%s) in %.2f s, %.0f files/s",
                 self.src_path.as_posix(),
                 self.working_dirs["src"].as_posix(),
+                ", ".join(
+                    f"{count} file(s) {'with ' if method in MATERIALIZE_METHODS else ''}{method}"
+                    for method, count in counts.items()
+                )
+                or "empty project",
+                elapsed,
+                copied / elapsed if elapsed else 0,
             )
-            copy_tree(self.src_path.as_posix(), self.working_dirs["src"].as_posix())
         # Else try to clone project.metadata.url into src folder
         elif self.project_type in ("url", "default"):
             self.info(
@@ -433,13 +621,34 @@ class GeniacBase(ABC, LogMixin):
                 self.working_dirs["src"].as_posix(),
             )
 
-            try:
-                Repo.clone_from(
-                    self.src_path,
-                    self.working_dirs["src"],
-                    branch=git_branch,
-                    multi_options=["--recurse-submodules"],
+            clone_kwargs = {
+                "branch": git_branch,
+                "depth": self.default_config.getint(
+                    self.GENIAC_WORKDIR, "cloneDepth", fallback=0
+                ),
+                "clone_filter": self.default_config.get(
+                    self.GENIAC_WORKDIR, "cloneFilter", fallback=None
+                ),
+                "folders": self.workdir_manifest()
+                if self.default_config.getboolean(
+                    self.GENIAC_WORKDIR, "sparseClone", fallback=False
                 )
+                else None,
+            }
+            if clone_kwargs["folders"] is not None:
+                clone_kwargs["folders"] = [
+                    folder
+                    for folder in clone_kwargs["folders"]
+                    if folder not in self.WORKDIR_FOLDERS
+                ]
+            try:
+                if (mirrors_dir := self.mirrors_dir) is not None:
+                    # History already fetched by previous runs is reused
+                    GitMirrorCache(mirrors_dir).clone(
+                        str(self.src_path), self.working_dirs["src"], **clone_kwargs
+                    )
+                else:
+                    clone_repository(self.src_path, self.working_dirs["src"], **clone_kwargs)
             except Exception as error:
                 self.error(
                     "Unable to clone the project into the temporary directory.\n%s",
@@ -461,12 +670,14 @@ class GeniacBase(ABC, LogMixin):
         ######################################################################
         ### Use src/geniac which corresponds to the same version of geniac CLI
         ######################################################################
-        if os.path.isdir(self.working_dirs["src"].as_posix()+'/geniac'):
-            shutil.rmtree(self.working_dirs["src"].as_posix()+'/geniac')
-            shutil.copytree(os.path.dirname(__file__) + '/../../repo', self.working_dirs["src"].as_posix()+'/geniac')
+        if not refresh_geniac and os.path.isdir(self.working_dirs["src"].as_posix()+'/geniac'):
+            self.info("The geniac folder already corresponds to the geniac folder from the python package.")
+        elif os.path.isdir(self.working_dirs["src"].as_posix()+'/geniac'):
+            self.cleaner.remove(self.working_dirs["src"] / "geniac", tombstone_dir=self.working_dir)
+            materialize_tree(GENIAC_REPO_PATH, self.working_dirs["src"] / "geniac", **copy_kwargs)
             self.info(f"The geniac folder has been replaced using the geniac folder from the python package.")
         else:
-            shutil.copytree(os.path.dirname(__file__) + '/../../repo', self.working_dirs["src"].as_posix()+'/geniac')
+            materialize_tree(GENIAC_REPO_PATH, self.working_dirs["src"] / "geniac", **copy_kwargs)
             self.info(f"The geniac directory does not exist. It has been created using the geniac folder from the python package.")
 
     def init_working_path(
@@ -488,21 +699,28 @@ class GeniacBase(ABC, LogMixin):
 
         if self.project_type != "wd":
             if not self.working_dir_is_valid:
-                # Initialize TMP dir if there is no working directory
-                self._tmp_dir = TemporaryDirectory() if post_clean else mkdtemp()
-
-                if not post_clean:
-                    self.warning(
-                        "Post clean option hasn't been set. The temporary folder '%s' will "
-                        "not been cleaned at the end !",
-                        self._tmp_dir,
+                # Reuse the working directory of the previous run on the same project
+                if post_clean and (workdir := self._acquire_workdir()):
+                    self.working_dir = workdir
+                else:
+                    # Initialize TMP dir if there is no working directory
+                    self._tmp_dir = TemporaryDirectory() if post_clean else mkdtemp()
+                    if post_clean:
+                        # Removed in the background rather than by its finalizer at exit
+                        atexit.register(self.cleaner.remove, self._tmp_dir.name)
+
+                    if not post_clean:
+                        self.warning(
+                            "Post clean option hasn't been set. The temporary folder '%s' will "
+                            "not been cleaned at the end !",
+                            self._tmp_dir,
+                        )
+
+                    self.working_dir = (
+                        Path(self._tmp_dir.name).resolve()
+                        if post_clean
+                        else Path(self._tmp_dir).resolve()
                     )
-
-                self.working_dir = (
-                    Path(self._tmp_dir.name).resolve()
-                    if post_clean
-                    else Path(self._tmp_dir).resolve()
-                )
                 self.working_dirs = {
                     "build": self.working_dir / self.BUILD_NAME,
                     "src": self.working_dir / self.SRC_NAME,
@@ -512,21 +730,107 @@ class GeniacBase(ABC, LogMixin):
             # Create basic tree structure
             self.init_working_tree()
 
+        # Finish the removals interrupted by previous runs
+        self.cleaner.collect(self.working_dir, gettempdir())
+
+        # A reused working directory is only refreshed if the project or geniac has changed
+        refresh_geniac, state, previous = True, None, None
+        if self._workdir_store:
+            previous = self._workdir_store.read_state(self.working_dir)
+            state = self.workdir_state(previous)
+            self.workdir_fingerprint = hashlib.sha1(
+                json.dumps([state[key] for key in self.WORKDIR_STATE_KEYS]).encode()
+            ).hexdigest()
+            if all(previous.get(key) == state[key] for key in self.WORKDIR_STATE_KEYS):
+                self.info(
+                    "Reusing geniac working directory %s, the project has not changed since the "
+                    "previous run",
+                    self.working_dir.as_posix(),
+                )
+                return
+            refresh_geniac = previous.get("version") != __version__
+            # Files left by an unknown or interrupted initialization are not synchronized
+            if not previous:
+                self.clean_src()
+
         # Clean build directory if asked
         if pre_clean:
             self.clean_build()
 
         # Copy or clone the project into src temp folder
         if self.project_type != "wd":
-            self.init_working_src_folder(git_branch)
+            self.init_working_src_folder(
+                git_branch,
+                refresh_geniac=refresh_geniac,
+                state=state,
+                previous_state=previous,
+            )
+
+        if state:
+            self._workdir_store.write_state(self.working_dir, state)
+
+    def _acquire_workdir(self) -> Path:
+        """Reusable working directory of the command on a local project
+
+        Working directories are only reused if the workdirs option of geniac.cache section is
+        set. Those unused for more than workdirsMaxAge seconds are removed.
+
+        Returns:
+            workdir (Path): working directory locked for this run, None if reuse is disabled or
+                if another geniac run uses it
+        """
+        if (
+            self.project_type != "path"
+            or not self.geniac_cmd
+            or (workdirs_dir := self.workdirs_dir) is None
+        ):
+            return None
+        store = WorkdirStore(workdirs_dir)
+        workdir = store.workdir_path(self.src_path, self.geniac_cmd)
+        if not store.acquire(workdir):
+            self.info(
+                "Working directory %s is used by another geniac run. A temporary folder will be "
+                "created instead",
+                workdir.as_posix(),
+            )
+            return None
+        self._workdir_store = store
+        # Working directories of the projects which are not used anymore are evicted
+        max_age = self.default_config.getfloat("geniac.cache", "workdirsMaxAge", fallback=0)
+        if max_age > 0:
+            for stale_workdir in store.stale_workdirs(max_age):
+                self.info(
+                    "Removing working directory %s, unused for more than %s day(s)",
+                    stale_workdir.as_posix(),
+                    round(max_age / 86400, 1),
+                )
+                self.cleaner.remove(stale_workdir)
+                store.release(stale_workdir, remove_lock=True)
+        return workdir
+
+    def clean_src(self):
+        """Clean source directory"""
+        if self.working_dirs["src"].is_dir() and (paths := list(self.working_dirs["src"].iterdir())):
+            self.info("Cleaning source directory %s", self.working_dirs["src"])
+            # Tombstones are kept out of the source directory, which CMake browses
+            self.cleaner.remove(*paths, tombstone_dir=self.working_dir)
 
     def clean_build(self):
         """Clean build directory"""
         if self.working_dirs["build"].exists():
             self.info("Cleaning build directory %s", self.working_dirs["build"])
-            # TODO: catcher l'erreur
-            rmtree(self.working_dirs["build"], ignore_errors=True)
-            self.working_dirs["build"].mkdir()
+            self.cleaner.remove(self.working_dirs["build"], recreate=True)
+
+    @property
+    def cleaner(self) -> BackgroundCleaner:
+        """Remover of the folders cleaned by geniac, in the background by default"""
+        if self._cleaner is None:
+            self._cleaner = BackgroundCleaner(
+                background=self.default_config.getboolean(
+                    self.GENIAC_WORKDIR, "backgroundCleanup", fallback=True
+                )
+            )
+        return self._cleaner
 
     @property
     def src_path(self):
@@ -546,6 +850,61 @@ class GeniacBase(ABC, LogMixin):
             else value
         )
 
+    @property
+    def tree(self) -> SourceTree:
+        """View of the project files, the file system by default"""
+        if self._tree is None:
+            self._tree = LocalTree(self.src_path)
+        return self._tree
+
+    @property
+    def cache_dir(self) -> Path:
+        """Folder where geniac keeps data between runs
+
+        The .geniac folder of the working directory is used if it exists. Otherwise, the path
+        given in geniac.cache section or the user cache directory is used.
+        """
+        if self.working_dirs["cache"].is_dir():
+            return self.working_dirs["cache"]
+        return self.user_cache_dir
+
+    @property
+    def user_cache_dir(self) -> Path:
+        """Geniac cache shared by every working directory
+
+        The path given in geniac.cache section or the user cache directory is used.
+        """
+        if cache_path := self.default_config.get("geniac.cache", "path", fallback=None):
+            return Path(cache_path).expanduser().resolve()
+        return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "geniac"
+
+    def _user_cache_subdir(self, option: str) -> Path:
+        """Folder given by an option of geniac.cache section (None if disabled)
+
+        The folder named after the option in the user cache is used if the option is empty.
+        """
+        if path := self.default_config.get("geniac.cache", option, fallback=None):
+            return None if path == "none" else Path(path).expanduser().resolve()
+        return self.user_cache_dir / option
+
+    @property
+    def mirrors_dir(self) -> Path:
+        """Folder of the bare mirrors of the cloned git repositories (None if disabled)
+
+        The mirrors option of geniac.cache section is used if it is set. Otherwise, the mirrors
+        are kept in the mirrors folder of the geniac cache (but never in a working directory).
+        """
+        return self._user_cache_subdir("mirrors")
+
+    @property
+    def workdirs_dir(self) -> Path:
+        """Folder of the working directories reused between runs (None if disabled)
+
+        Reuse is disabled unless the workdirs option of geniac.cache section is set to a folder,
+        or left empty to keep the working directories in the workdirs folder of the geniac cache.
+        """
+        return self._user_cache_subdir("workdirs")
+
     @property
     def config_file(self):
         """Configuration file (optional)
@@ -605,7 +964,9 @@ class GeniacBase(ABC, LogMixin):
             [
                 Path(in_path) if "*" not in in_path else glob_path
                 for in_path in option
-                for glob_path in glob_solver(in_path, lazy_flag=lazy_glob)
+                for glob_path in glob_solver(
+                    in_path, lazy_flag=lazy_glob, source_tree=self.tree
+                )
             ]
         )
         return result[0] if len(result) == 1 and single_path else result
@@ -649,5 +1010,6 @@ class GeniacBase(ABC, LogMixin):
 
     def __exit__(self, *args):
         """Delete temporary folder if it has been correctly initialized"""
-        if self._tmp_dir:
+        if isinstance(self._tmp_dir, TemporaryDirectory):
+            self.cleaner.remove(self._tmp_dir.name)
             self._tmp_dir.cleanup()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""cache.py: Persistent key/value store used by geniac commands"""
+
+import fcntl
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from stat import S_ISREG
+from threading import Lock
+from tempfile import NamedTemporaryFile
+
+from geniac.cli.utils.logging import LogMixin
+from geniac.cli.utils.profiler import profile_count
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+class GeniacCache(LogMixin):
+    """JSON file store where each entry can expire after a time to live"""
+
+    _SHARED = {}
+    _SHARED_LOCK = Lock()
+
+    @classmethod
+    def shared(cls, path: Path):
+        """Return the cache instance of a file shared by every command of the process"""
+        path = Path(path)
+        with cls._SHARED_LOCK:
+            if path not in cls._SHARED:
+                cls._SHARED[path] = cls(path)
+            return cls._SHARED[path]
+
+    def __init__(self, path: Path):
+        """
+
+        Args:
+            path (Path): path to the JSON file backing the cache
+        """
+        super().__init__()
+        self.path = Path(path)
+        self._entries = None
+        self._modified = set()
+
+    def _read(self) -> dict:
+        """Read the entries of the cache file"""
+        if self.path.is_file():
+            try:
+                with self.path.open(encoding="utf8") as cache_file:
+                    return json.load(cache_file)
+            except (OSError, ValueError) as error:
+                self.debug("Ignoring unreadable cache file %s: %s", self.path, error)
+        return {}
+
+    @property
+    def entries(self) -> dict:
+        """Entries loaded lazily from the cache file"""
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def get(self, key: str, default=None):
+        """Return the value of an entry if it exists and has not expired"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return default
+        if (expires := entry.get("expires")) is not None and expires < time.time():
+            return default
+        return entry.get("value")
+
+    def set(self, key: str, value, ttl: float = None):
+        """Add or replace an entry
+
+        Args:
+            key (str): entry key
+            value: JSON serializable value
+            ttl (float): time to live in seconds (no expiration if None)
+        """
+        self.entries[key] = {
+            "value": value,
+            "expires": time.time() + ttl if ttl is not None else None,
+        }
+        self._modified.add(key)
+
+    def pop(self, key: str, default=None):
+        """Remove an entry and return its value"""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return default
+        self._modified.add(key)
+        return entry.get("value")
+
+    @contextmanager
+    def _lock(self):
+        """Prevent concurrent geniac processes from saving the cache file at the same time"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_suffix(".lock"), "w", encoding="utf8") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def save(self):
+        """Write the entries if they have been modified, dropping the expired ones
+
+        Entries written in the meantime by other geniac processes are kept.
+        """
+        if not self._modified:
+            return
+        try:
+            with self._lock():
+                now = time.time()
+                entries = self._read()
+                for key in self._modified:
+                    if key in self.entries:
+                        entries[key] = self.entries[key]
+                    else:
+                        entries.pop(key, None)
+                entries = {
+                    key: entry
+                    for key, entry in entries.items()
+                    if entry.get("expires") is None or entry.get("expires") >= now
+                }
+                # Write in a temporary file first so that readers never see a partial file
+                with NamedTemporaryFile(
+                    "w", dir=self.path.parent, delete=False, encoding="utf8"
+                ) as tmp_file:
+                    json.dump(entries, tmp_file, separators=(",", ":"))
+                os.replace(tmp_file.name, self.path)
+        except OSError as error:
+            self.warning("Unable to write cache file %s: %s", self.path, error)
+        else:
+            self._entries = entries
+            self._modified = set()
+
+
+def hash_file(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Return the sha1 digest of a file content"""
+    digest = hashlib.sha1()
+    profile_count("reads")
+    with open(path, "rb") as in_file:
+        while chunk := in_file.read(chunk_size):
+            profile_count("bytes_read", len(chunk))
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_files(root: Path, excluded: tuple = (), recursive: bool = True):
+    """Yield the relative path and the path of every file below root
+
+    Symbolic links to folders are not followed.
+
+    Args:
+        root (Path): folder browsed
+        excluded (tuple): names of folders which are not browsed
+        recursive (bool): browse the sub folders of root
+    """
+    dirs = [root]
+    while dirs:
+        profile_count("listings")
+        try:
+            entries = list(os.scandir(dirs.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive and entry.name not in excluded:
+                    dirs.append(Path(entry.path))
+                continue
+            yield Path(entry.path).relative_to(root).as_posix(), entry.path
+
+
+def fingerprint_files(
+    root: Path, manifest: dict = None, excluded: tuple = (".git",), paths: list = None
+):
+    """Compute a fingerprint of every file below root
+
+    Files are identified with their stats first. Their content is hashed only if their size or
+    modification time changed since the previous manifest.
+
+    Args:
+        root (Path): folder analyzed
+        manifest (dict): manifest returned by a previous call
+        excluded (tuple): names of folders which are not browsed
+        paths (list): paths of the files analyzed, relative to root (every file below root if
+            None)
+
+    Returns:
+        fingerprint (str): digest of the relative paths and contents of the files
+        manifest (dict): {relative path: [size, mtime, digest]} for each file
+    """
+    root = Path(root)
+    manifest = manifest or {}
+    new_manifest = {}
+    files = (
+        iter_files(root, excluded)
+        if paths is None
+        else ((rel_path, root / rel_path) for rel_path in paths)
+    )
+    for rel_path, path in files:
+        profile_count("stats")
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if not S_ISREG(stat.st_mode):
+            continue
+        previous = manifest.get(rel_path)
+        if previous and previous[:2] == [stat.st_size, stat.st_mtime_ns]:
+            new_manifest[rel_path] = previous
+        else:
+            new_manifest[rel_path] = [stat.st_size, stat.st_mtime_ns, hash_file(path)]
+    digest = hashlib.sha256()
+    for rel_path in sorted(new_manifest):
+        digest.update(f"{rel_path}\0{new_manifest[rel_path][2]}\0".encode())
+    return digest.hexdigest(), new_manifest
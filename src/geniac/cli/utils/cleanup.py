@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""cleanup.py: Removal of geniac folders without blocking the commands"""
+
+import os
+import shutil
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+from stat import S_ISDIR
+
+from geniac.cli.utils.logging import LogMixin
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+# Prefix of the folders renamed before being removed
+TOMBSTONE_PREFIX = ".geniac-trash-"
+# Script of the detached process removing the tombstones
+_REMOVE_SCRIPT = (
+    "import shutil, sys\n"
+    "for path in sys.argv[1:]:\n"
+    "    shutil.rmtree(path, ignore_errors=True)\n"
+)
+
+
+class BackgroundCleaner(LogMixin):
+    """Remove folders in a detached process
+
+    Each folder is first renamed to a tombstone in the same file system, so that its path is
+    immediately free, then the tombstones are removed by a process which outlives geniac.
+    Tombstones left by an interrupted removal are collected by the next runs.
+    """
+
+    def __init__(self, background: bool = True):
+        """
+
+        Args:
+            background (bool): remove the tombstones in a detached process, or before returning
+                if False
+        """
+        super().__init__()
+        self.background = background
+
+    def bury(self, path: Path, tombstone_dir: Path = None) -> Path:
+        """Rename a file or a folder to a tombstone
+
+        Args:
+            path (Path): file or folder to remove
+            tombstone_dir (Path): folder of the tombstone (parent of path by default), which
+                should be on the same file system
+
+        Returns:
+            tombstone (Path): new path, or None if path does not exist or cannot be renamed
+        """
+        path = Path(path)
+        tombstone = Path(tombstone_dir or path.parent) / (
+            f"{TOMBSTONE_PREFIX}{path.name}-{uuid.uuid4().hex[:8]}"
+        )
+        try:
+            os.rename(path, tombstone)
+        except FileNotFoundError:
+            return None
+        except OSError as error:
+            self.debug("Unable to rename %s before its removal: %s", path, error)
+            return None
+        return tombstone
+
+    def remove(self, *paths: Path, tombstone_dir: Path = None, recreate: bool = False):
+        """Remove files or folders without waiting for their content to be deleted
+
+        Args:
+            paths (Path): files or folders to remove
+            tombstone_dir (Path): folder of the tombstones (parent of each path by default)
+            recreate (bool): create again an empty folder at each path
+        """
+        tombstones = []
+        for path in map(Path, paths):
+            if tombstone := self.bury(path, tombstone_dir):
+                tombstones.append(tombstone)
+            elif path.is_dir() and not path.is_symlink():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+            if recreate:
+                path.mkdir(parents=True, exist_ok=True)
+        self.remove_tombstones(tombstones)
+
+    def collect(self, *folders: Path):
+        """Remove the tombstones left in folders by previous runs"""
+        tombstones = []
+        for folder in map(Path, folders):
+            try:
+                tombstones += [
+                    Path(entry.path)
+                    for entry in os.scandir(folder)
+                    if entry.name.startswith(TOMBSTONE_PREFIX)
+                ]
+            except OSError:
+                continue
+        if tombstones:
+            self.debug("Removing %s tombstone(s) left by previous runs", len(tombstones))
+        self.remove_tombstones(tombstones)
+
+    def remove_tombstones(self, tombstones: list):
+        """Delete tombstones, in a detached process if background is set"""
+        if not tombstones:
+            return
+        if self.background:
+            try:
+                subprocess.Popen(
+                    [sys.executable, "-c", _REMOVE_SCRIPT]
+                    + [Path(tombstone).as_posix() for tombstone in tombstones],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
+            except OSError as error:
+                self.debug("Unable to start the background removal: %s", error)
+            else:
+                return
+        for tombstone in map(Path, tombstones):
+            if tombstone.is_dir() and not tombstone.is_symlink():
+                shutil.rmtree(tombstone, ignore_errors=True)
+            else:
+                tombstone.unlink(missing_ok=True)
+
+
+def disk_usage(path: Path) -> int:
+    """Disk space used by a file or a folder in bytes, hard linked files being counted once"""
+    usage, seen, paths = 0, set(), [Path(path)]
+    while paths:
+        try:
+            stat = os.lstat(current := paths.pop())
+        except OSError:
+            continue
+        if stat.st_nlink > 1:
+            if (stat.st_dev, stat.st_ino) in seen:
+                continue
+            seen.add((stat.st_dev, stat.st_ino))
+        usage += stat.st_blocks * 512
+        if S_ISDIR(stat.st_mode):
+            try:
+                paths += [Path(entry.path) for entry in os.scandir(current)]
+            except OSError:
+                continue
+    return usage
+
+
+def format_size(size: float) -> str:
+    """Human readable size, such as 1.5 GiB"""
+    for unit in ("B", "KiB", "MiB", "GiB", "TiB"):
+        if size < 1024 or unit == "TiB":
+            break
+        size /= 1024
+    return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
@@ -0,0 +1,463 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""conda.py: Verification of conda recipes used by geniac tools"""
+
+import copy
+import hashlib
+import json
+import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from fnmatch import fnmatchcase
+from pathlib import Path
+from shutil import which
+from threading import Event, Lock
+from typing import NamedTuple, Optional
+
+import yaml
+
+from geniac.cli.utils.cache import GeniacCache
+from geniac.cli.utils.logging import LogMixin
+from geniac.cli.utils.profiler import ProfiledPattern, profile_count, profile_subprocess
+
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as YamlSafeLoader
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+# Entries of a conda environment file used by geniac
+CONDA_ENV_KEYS = ("name", "channels", "dependencies")
+# Conda environment files recently loaded in this process, the least recently used ones are
+# dropped beyond _CONDA_ENVS_SIZE entries
+_CONDA_ENVS = OrderedDict()
+_CONDA_ENVS_SIZE = 1024
+
+
+class CondaSearchResult(NamedTuple):
+    """Outcome of the verification of a conda recipe"""
+
+    found: bool
+    output: str
+
+
+class CondaSpec(NamedTuple):
+    """Conda recipe split into its components"""
+
+    channel: str
+    name: str
+    version: str
+    build: str
+
+
+# Name of a conda channel
+CONDA_CHANNEL_RE = ProfiledPattern(r"^[\w.-]+$")
+# channel::name=version=build or name=version=build
+CONDA_SPEC_RE = ProfiledPattern(
+    r"^((?P<channel>[\w-]+)::)?(?P<name>[.\w-]+)=(?P<version>[^=]+)=(?P<build>[\w*]+)$"
+)
+
+
+def parse_conda_spec(recipe: str) -> Optional[CondaSpec]:
+    """Split a conda recipe into a CondaSpec or return None if it is not fully pinned"""
+    if match := CONDA_SPEC_RE.match(recipe):
+        return CondaSpec(**match.groupdict())
+    return None
+
+
+def split_repodata_source(source: str) -> tuple:
+    """Split a repodata source into (channel, path), channel being empty if not given
+
+    The channel is only separated at the first ``=`` so that the path can contain ``=``.
+    """
+    channel, separator, path = source.partition("=")
+    if not separator or not CONDA_CHANNEL_RE.match(channel):
+        return "", source
+    return channel, path
+
+
+def load_conda_env(path: Path, cache: GeniacCache = None, content: bytes = None) -> dict:
+    """Load the entries used by geniac from a conda environment file
+
+    Files are cached in memory and in the optional persistent cache according to their path,
+    modification time and size so that each file is parsed only once.
+
+    Args:
+        path (Path): path to the conda environment file
+        cache (GeniacCache): persistent cache of parsed files
+        content (bytes): content of the file if it is not read from the file system (identified
+            with its digest instead of its stats)
+
+    Returns:
+        conda_env (dict): name, channels and dependencies defined in the file
+    """
+    path = Path(path).resolve()
+    if content is not None:
+        file_stat = ["sha1", hashlib.sha1(content).hexdigest()]
+    else:
+        stat = path.stat()
+        file_stat = [stat.st_mtime_ns, stat.st_size]
+    cache_key = f"conda.env:{path.as_posix()}"
+    conda_env = _CONDA_ENVS.get(path)
+    if conda_env is not None:
+        _CONDA_ENVS.move_to_end(path)
+    if conda_env is None or conda_env[0] != file_stat:
+        cached = cache.get(cache_key) if cache is not None else None
+        if cached and cached.get("stat") == file_stat:
+            conda_env = (file_stat, cached.get("content"))
+        else:
+            if content is not None:
+                content = next(yaml.load_all(content.decode("utf8"), Loader=YamlSafeLoader), None)
+            else:
+                with path.open(encoding="utf8") as yml_file:
+                    content = next(yaml.load_all(yml_file, Loader=YamlSafeLoader), None)
+            conda_env = (
+                file_stat,
+                {
+                    key: content[key]
+                    for key in CONDA_ENV_KEYS
+                    if isinstance(content, dict) and key in content
+                },
+            )
+            if cache is not None:
+                try:
+                    json.dumps(conda_env[1])
+                except TypeError:
+                    pass
+                else:
+                    cache.set(cache_key, {"stat": file_stat, "content": conda_env[1]})
+        _CONDA_ENVS[path] = conda_env
+        if len(_CONDA_ENVS) > _CONDA_ENVS_SIZE:
+            _CONDA_ENVS.popitem(last=False)
+    return copy.deepcopy(conda_env[1])
+
+
+class RepodataIndex(LogMixin):
+    """In-memory index of conda packages loaded from local repodata.json files
+
+    Each source is either a path or a ``channel=path`` pair. A path can be a repodata.json file,
+    a channel subdir (e.g. ``linux-64``) or a channel folder with subdirs such as a mirrored
+    channel or a conda-bld folder. If not given, the channel name is the name of the channel
+    folder.
+    """
+
+    CACHE_KEY = "conda.repodata"
+    REPODATA_NAME = "repodata.json"
+
+    def __init__(self, sources: list, cache: GeniacCache = None):
+        """
+
+        Args:
+            sources (list): repodata sources
+            cache (GeniacCache): persistent cache used to store the compact index
+        """
+        super().__init__()
+        self.sources = [source for source in sources if source]
+        self.cache = cache
+        self._index = None
+
+    def _get_repodata_paths(self) -> list:
+        """List (channel, path) of every repodata.json file available in the sources"""
+        repodata_paths = []
+        for source in self.sources:
+            channel, path = split_repodata_source(source)
+            path = Path(path).expanduser().resolve()
+            profile_count("stats")
+            if path.is_file():
+                paths = [path]
+            else:
+                profile_count("stats")
+                if (path / self.REPODATA_NAME).is_file():
+                    paths = [path / self.REPODATA_NAME]
+                else:
+                    profile_count("globs")
+                    paths = sorted(path.glob(f"*/{self.REPODATA_NAME}"))
+            if not paths:
+                self.warning("No %s file found in %s.", self.REPODATA_NAME, path)
+            # channel/subdir/repodata.json
+            repodata_paths += [
+                (channel or repodata_path.parent.parent.name, repodata_path)
+                for repodata_path in paths
+            ]
+        return repodata_paths
+
+    @staticmethod
+    def _fingerprint(repodata_paths: list) -> list:
+        """Identify the repodata files with their stats"""
+        fingerprint = []
+        for channel, path in repodata_paths:
+            profile_count("stats")
+            stat = path.stat()
+            fingerprint.append([channel, path.as_posix(), stat.st_size, stat.st_mtime_ns])
+        return fingerprint
+
+    def _read(self, repodata_paths: list) -> dict:
+        """Read repodata.json files into {channel: {name: [version=build, ...]}}"""
+        index = {}
+        for channel, repodata_path in repodata_paths:
+            self.debug("Loading conda repodata %s for channel %s.", repodata_path, channel)
+            try:
+                with repodata_path.open(encoding="utf8") as repodata_file:
+                    repodata = json.load(repodata_file)
+            except (OSError, ValueError) as error:
+                self.error("Unable to read conda repodata %s: %s", repodata_path, error)
+                continue
+            channel_index = index.setdefault(channel, {})
+            for packages_key in ("packages", "packages.conda"):
+                for package in repodata.get(packages_key, {}).values():
+                    channel_index.setdefault(package.get("name"), set()).add(
+                        f"{package.get('version')}={package.get('build')}"
+                    )
+        return {
+            channel: {name: sorted(builds) for name, builds in packages.items()}
+            for channel, packages in index.items()
+        }
+
+    @property
+    def index(self) -> dict:
+        """Packages indexed by channel, name and version=build"""
+        if self._index is None:
+            repodata_paths = self._get_repodata_paths()
+            fingerprint = self._fingerprint(repodata_paths)
+            cached = self.cache.get(self.CACHE_KEY, {}) if self.cache is not None else {}
+            if cached.get("fingerprint") == fingerprint:
+                self.debug("Conda repodata index loaded from cache %s.", self.cache.path)
+                self._index = cached.get("index")
+            else:
+                self._index = self._read(repodata_paths)
+                if self.cache is not None:
+                    self.cache.set(
+                        self.CACHE_KEY, {"fingerprint": fingerprint, "index": self._index}
+                    )
+                    self.cache.save()
+            self._index = {
+                channel: {name: set(builds) for name, builds in packages.items()}
+                for channel, packages in self._index.items()
+            }
+        return self._index
+
+    @property
+    def channels(self) -> list:
+        """Channels available in the index"""
+        return list(self.index)
+
+    def contains(self, channel: str, name: str, version: str, build: str) -> bool:
+        """Check if a package is available in a channel (version and build can be globs)"""
+        builds = self.index.get(channel, {}).get(name, set())
+        if f"{version}={build}" in builds:
+            return True
+        return any(
+            fnmatchcase(version_build, f"{version}={build}") for version_build in builds
+        )
+
+    def search(self, recipe: str, channels: tuple = ()) -> CondaSearchResult:
+        """Look for a recipe in its channel or in the given channels"""
+        if not (spec := parse_conda_spec(recipe)):
+            return CondaSearchResult(False, f"{recipe} is not a pinned conda recipe")
+        search_channels = [spec.channel] if spec.channel else list(channels) or self.channels
+        if not (
+            indexed_channels := [
+                channel for channel in search_channels if channel in self.index
+            ]
+        ):
+            return CondaSearchResult(
+                False,
+                f"channel(s) {', '.join(search_channels)} not available in the repodata index",
+            )
+        for channel in indexed_channels:
+            if self.contains(channel, spec.name, spec.version, spec.build):
+                return CondaSearchResult(True, f"{channel}::{spec.name}={spec.version}={spec.build}")
+        return CondaSearchResult(
+            False, f"package not found in channel(s) {', '.join(indexed_channels)}"
+        )
+
+
+class CondaRecipeChecker(LogMixin):
+    """Collect conda recipes from every tool and check each distinct recipe only once
+
+    Recipes are first registered with the labels using them. The check step then resolves every
+    distinct recipe with a bounded pool of ``conda search`` calls so that the cost scales with
+    the number of packages and not with the number of tools. Results can be kept in a
+    persistent cache since a fully pinned recipe rarely changes. If a repodata index is given,
+    recipes are looked up in the index instead of calling conda.
+    """
+
+    CACHE_PREFIX = "conda.search:"
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        conda_cmd: str = "conda",
+        cache: GeniacCache = None,
+        ttl: float = None,
+        negative_ttl: float = None,
+        refresh: bool = False,
+        index: RepodataIndex = None,
+    ):
+        """
+
+        Args:
+            max_workers (int): maximum number of concurrent conda search calls
+            conda_cmd (str): conda executable
+            cache (GeniacCache): persistent cache for search results
+            ttl (float): time to live in seconds of a found recipe in the cache
+            negative_ttl (float): time to live in seconds of a missing recipe in the cache
+            refresh (bool): ignore results already in the cache
+            index (RepodataIndex): offline index used instead of conda search
+        """
+        super().__init__()
+        self.max_workers = max(1, max_workers)
+        self.conda_cmd = conda_cmd
+        self.cache = cache
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.refresh = refresh
+        self.index = index
+        self._recipes = OrderedDict()
+        self._results = OrderedDict()
+        self._processes = set()
+        self._lock = Lock()
+        self._cancelled = Event()
+
+    @property
+    def recipes(self):
+        """Registered (recipe, channels) with the labels using them"""
+        return self._recipes
+
+    @property
+    def results(self):
+        """Search result for each recipe already checked"""
+        return self._results
+
+    @property
+    def is_available(self) -> bool:
+        """Is conda available in the PATH or is there a repodata index ?"""
+        if self.index is not None:
+            return bool(self.index.channels)
+        return which(self.conda_cmd) is not None
+
+    def add(self, recipe: str, label: str, channels: tuple = ()):
+        """Register a conda recipe used by a label
+
+        Args:
+            recipe (str): conda recipe
+            label (str): label using the recipe
+            channels (tuple): channels searched if the recipe does not have any channel
+        """
+        labels = self._recipes.setdefault((recipe, tuple(channels)), [])
+        if label not in labels:
+            labels.append(label)
+
+    def _search(self, recipe: str, channels: tuple = ()) -> CondaSearchResult:
+        """Check a single recipe with conda search (killed if the check is cancelled)"""
+        if self._cancelled.is_set():
+            return CondaSearchResult(False, "conda search cancelled")
+        with profile_subprocess(), subprocess.Popen(
+            [self.conda_cmd, "search"]
+            + [arg for channel in channels for arg in ("-c", channel)]
+            + [recipe],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding="utf8",
+        ) as process:
+            with self._lock:
+                self._processes.add(process)
+            # The check may have been cancelled while the process was starting
+            if self._cancelled.is_set():
+                process.kill()
+            try:
+                stdout, stderr = process.communicate()
+            finally:
+                with self._lock:
+                    self._processes.discard(process)
+        if process.returncode != 0:
+            return CondaSearchResult(False, str(stderr or stdout or ""))
+        return CondaSearchResult(True, stdout)
+
+    def cancel(self):
+        """Cancel the pending searches and kill the running conda processes"""
+        self._cancelled.set()
+        with self._lock:
+            for process in self._processes:
+                process.kill()
+
+    def check(self) -> OrderedDict:
+        """Check every registered recipe which has not been checked yet
+
+        Returns:
+            results (OrderedDict): search result for each registered recipe
+        """
+        return OrderedDict(self.iter_check())
+
+    def iter_check(self):
+        """Check every registered recipe which has not been checked yet
+
+        Results are yielded in the registration order of the recipes while the other searches
+        are still running. If the generator is closed before its end, the pending searches are
+        cancelled and the running conda processes are killed.
+
+        Yields:
+            recipe (tuple): registered (recipe, channels)
+            result (CondaSearchResult): search result of the recipe
+        """
+        self._cancelled.clear()
+        pending = [recipe for recipe in self._recipes if recipe not in self._results]
+        if self.index is not None:
+            for recipe, channels in pending:
+                self._results[(recipe, channels)] = self.index.search(recipe, channels)
+            pending = []
+        if self.cache is not None and not self.refresh:
+            for recipe in pending:
+                if (cached := self.cache.get(self._cache_key(*recipe))) is not None:
+                    self._results[recipe] = CondaSearchResult(*cached)
+            self.debug(
+                "%s conda recipe(s) found in cache %s.",
+                sum(recipe in self._results for recipe in pending),
+                self.cache.path,
+            )
+            pending = [recipe for recipe in pending if recipe not in self._results]
+
+        executor = None
+        futures = OrderedDict()
+        if pending:
+            self.info(
+                "Checking %s distinct conda recipe(s) with %s worker(s).",
+                len(pending),
+                min(self.max_workers, len(pending)),
+            )
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            # Searches are run in a copy of the context to be counted in the lint profile
+            futures = OrderedDict(
+                (recipe, executor.submit(copy_context().run, self._search, *recipe))
+                for recipe in pending
+            )
+        done = False
+        try:
+            for recipe in list(self._recipes):
+                if recipe in futures:
+                    result = futures[recipe].result()
+                    self._results[recipe] = result
+                    if self.cache is not None:
+                        self.cache.set(
+                            self._cache_key(*recipe),
+                            list(result),
+                            ttl=self.ttl if result.found else self.negative_ttl,
+                        )
+                yield recipe, self._results[recipe]
+            done = True
+        finally:
+            if executor is not None:
+                # Results of the searches which have not been yielded are not kept
+                if not done:
+                    self.cancel()
+                executor.shutdown(wait=True, cancel_futures=True)
+            if self.cache is not None and futures:
+                self.cache.save()
+
+    def _cache_key(self, recipe: str, channels: tuple = ()) -> str:
+        """Key of a recipe in the persistent cache"""
+        return self.CACHE_PREFIX + (f"{','.join(channels)}|" if channels else "") + recipe
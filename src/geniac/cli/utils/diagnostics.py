@@ -0,0 +1,262 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""diagnostics.py: Machine readable output of the geniac lint findings"""
+
+import json
+import logging
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import PurePath
+from typing import NamedTuple
+
+from geniac import __version__
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+# Identifier of the lint rule currently executed
+CURRENT_RULE = ContextVar("geniac_lint_rule", default=None)
+# Identifiers of the lint rules whose findings are not reported
+DISABLED_RULES = ContextVar("geniac_disabled_lint_rules", default=frozenset())
+# Maximum number of errors reported before the lint is stopped
+ERROR_BUDGET = ContextVar("geniac_lint_error_budget", default=None)
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_LEVELS = {"critical": "error", "error": "error", "warning": "warning"}
+
+
+class ErrorBudgetExceeded(Exception):
+    """Raised when the maximum number of errors of the lint has been reported"""
+
+
+class ErrorBudget:
+    """Count the errors reported and stop the lint once the maximum is reached"""
+
+    def __init__(self, max_errors: int):
+        """
+
+        Args:
+            max_errors (int): maximum number of errors
+        """
+        self.max_errors = max_errors
+        self.errors = 0
+
+    def consume(self):
+        """Count an error and raise ErrorBudgetExceeded if the maximum is reached"""
+        self.errors += 1
+        if self.errors >= self.max_errors:
+            raise ErrorBudgetExceeded(self.errors)
+
+
+class Diagnostic(NamedTuple):
+    """Lint finding"""
+
+    rule: str
+    severity: str
+    file: str
+    line: int
+    message: str
+
+
+@contextmanager
+def rule_context(rule_id: str):
+    """Attach the findings logged in this context to a lint rule"""
+    token = CURRENT_RULE.set(rule_id)
+    try:
+        yield
+    finally:
+        CURRENT_RULE.reset(token)
+
+
+def rule_enabled(rule_id: str = None) -> bool:
+    """Check if the findings of a rule (by default the current one) are reported"""
+    rule_id = rule_id or CURRENT_RULE.get()
+    return rule_id is None or rule_id not in DISABLED_RULES.get()
+
+
+@contextmanager
+def disabled_rules(rule_ids):
+    """Do not report the findings of some rules in this context"""
+    token = DISABLED_RULES.set(frozenset(rule_ids))
+    try:
+        yield
+    finally:
+        DISABLED_RULES.reset(token)
+
+
+@contextmanager
+def error_budget(max_errors: int = None):
+    """Stop the code executed in this context once max_errors errors have been reported
+
+    Nothing is stopped if max_errors is not a positive number.
+    """
+    token = ERROR_BUDGET.set(ErrorBudget(max_errors) if max_errors and max_errors > 0 else None)
+    try:
+        yield ERROR_BUDGET.get()
+    finally:
+        ERROR_BUDGET.reset(token)
+
+
+def consume_error_budget():
+    """Count an error in the current error budget"""
+    if (budget := ERROR_BUDGET.get()) is not None:
+        budget.consume()
+
+
+def annotate_record(record: logging.LogRecord) -> logging.LogRecord:
+    """Add rule, file and line attributes to a log record if they are not given with extra
+
+    The file defaults to the first path given in the arguments of the message.
+    """
+    if getattr(record, "rule", None) is None:
+        record.rule = CURRENT_RULE.get()
+    if getattr(record, "file", None) is None:
+        args = record.args if isinstance(record.args, tuple) else ()
+        record.file = next((str(arg) for arg in args if isinstance(arg, PurePath)), None)
+    if not hasattr(record, "line"):
+        record.line = None
+    return record
+
+
+def diagnostic_from_record(record: logging.LogRecord) -> Diagnostic:
+    """Convert a log record to a diagnostic"""
+    annotate_record(record)
+    return Diagnostic(
+        rule=record.rule,
+        severity=record.levelname.lower(),
+        file=record.file,
+        line=record.line,
+        message=record.getMessage(),
+    )
+
+
+class JsonLinesWriter:
+    """Write each diagnostic as a JSON object on its own line as soon as it is produced"""
+
+    def __init__(self, path: str):
+        """
+
+        Args:
+            path (str): output file or - for the standard output
+        """
+        self.path = path
+        self._stream = sys.stdout if path == "-" else open(path, "w", encoding="utf8")
+
+    def write(self, diagnostic: Diagnostic):
+        """Write a diagnostic"""
+        self._stream.write(json.dumps(diagnostic._asdict()) + "\n")
+        self._stream.flush()
+
+    def close(self):
+        """Close the output file"""
+        if self._stream is not sys.stdout:
+            self._stream.close()
+
+
+class SarifWriter:
+    """Write the diagnostics in a SARIF log
+
+    Results are written as soon as they are produced. The tool description with the rules which
+    have been triggered is written when the writer is closed.
+    """
+
+    def __init__(self, path: str):
+        """
+
+        Args:
+            path (str): output file
+        """
+        self.path = path
+        self._rules = []
+        self._count = 0
+        self._stream = open(path, "w", encoding="utf8")
+        self._stream.write(
+            f'{{"$schema":{json.dumps(SARIF_SCHEMA)},"version":"2.1.0","runs":[{{"results":['
+        )
+
+    def write(self, diagnostic: Diagnostic):
+        """Write a diagnostic as a SARIF result"""
+        result = {
+            "level": SARIF_LEVELS.get(diagnostic.severity, "note"),
+            "message": {"text": diagnostic.message},
+        }
+        if diagnostic.rule:
+            result["ruleId"] = diagnostic.rule
+            if diagnostic.rule not in self._rules:
+                self._rules.append(diagnostic.rule)
+        if diagnostic.file:
+            location = {"artifactLocation": {"uri": PurePath(diagnostic.file).as_posix()}}
+            if diagnostic.line:
+                location["region"] = {"startLine": diagnostic.line}
+            result["locations"] = [{"physicalLocation": location}]
+        self._stream.write(("," if self._count else "") + json.dumps(result))
+        self._count += 1
+
+    def close(self):
+        """Write the tool description and close the output file"""
+        driver = {
+            "name": "geniac",
+            "version": __version__,
+            "informationUri": "https://geniac.readthedocs.io/en/latest/",
+            "rules": [{"id": rule} for rule in self._rules],
+        }
+        self._stream.write(f'],"tool":{{"driver":{json.dumps(driver)}}}}}]}}\n')
+        self._stream.close()
+
+
+class DiagnosticsHandler(logging.Handler):
+    """Send the geniac log records to diagnostic writers"""
+
+    def __init__(self, writers: list, level: int = logging.WARNING, logger_name: str = "geniac"):
+        """
+
+        Args:
+            writers (list): diagnostic writers
+            level (int): minimum level of the records written
+            logger_name (str): logger to which the handler is attached (None to only use write)
+        """
+        super().__init__(level)
+        self.writers = writers
+        self.logger_name = logger_name
+        self.moved_handlers = []
+
+    def emit(self, record):
+        """Write the diagnostic corresponding to the record"""
+        self.write(diagnostic_from_record(record))
+
+    def write(self, diagnostic: Diagnostic):
+        """Write a diagnostic with every writer"""
+        for writer in self.writers:
+            writer.write(diagnostic)
+
+    def __enter__(self):
+        if self.logger_name is not None:
+            logging.getLogger(self.logger_name).addHandler(self)
+        # Keep the standard output for diagnostics if they are written on it
+        if any(getattr(writer, "path", None) == "-" for writer in self.writers):
+            for handler in logging.getLogger().handlers:
+                if isinstance(handler, logging.StreamHandler) and handler.stream is sys.stdout:
+                    handler.setStream(sys.stderr)
+                    self.moved_handlers.append(handler)
+        return self
+
+    def __exit__(self, *args):
+        if self.logger_name is not None:
+            logging.getLogger(self.logger_name).removeHandler(self)
+        for handler in self.moved_handlers:
+            handler.setStream(sys.stdout)
+        self.moved_handlers = []
+        for writer in self.writers:
+            writer.close()
+
+    @classmethod
+    def from_options(cls, diagnostics_jsonl: str = None, sarif: str = None, **kwargs):
+        """Build a handler from the lint command line options"""
+        writers = []
+        if diagnostics_jsonl:
+            writers.append(JsonLinesWriter(diagnostics_jsonl))
+        if sarif:
+            writers.append(SarifWriter(sarif))
+        return cls(writers, **kwargs)
@@ -0,0 +1,328 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""fs.py: Materialization of project files in geniac working directories"""
+
+import ctypes
+import errno
+import os
+import shutil
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from itertools import starmap
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+# Linux ioctl sharing the extents of a file with another one (copy-on-write clone)
+FICLONE = 0x40049409
+# Flags of Linux renameat2 system call swapping two paths
+AT_FDCWD = -100
+RENAME_EXCHANGE = 2
+# Methods used to reproduce a file, from the cheapest to the most expensive
+MATERIALIZE_METHODS = ("reflink", "hardlink", "copy")
+# Errors meaning that a method is not supported between two folders
+_UNSUPPORTED_ERRNOS = {errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EPERM}
+# Errors meaning that copy_file_range cannot copy a file, which is then copied by shutil
+_COPY_RANGE_ERRNOS = _UNSUPPORTED_ERRNOS | {errno.ENOSYS, errno.EBADF, errno.ETXTBSY}
+
+
+def reflink_file(src: Path, dst: Path):
+    """Clone a file with copy-on-write, the clone sharing the data blocks of the original
+
+    Raises:
+        OSError: if the file system does not support reflinks
+    """
+    if fcntl is None or not hasattr(fcntl, "ioctl"):
+        raise OSError(errno.EOPNOTSUPP, "reflink is not supported on this platform")
+    try:
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+    except OSError:
+        Path(dst).unlink(missing_ok=True)
+        raise
+    shutil.copystat(src, dst)
+
+
+def exchange_paths(path1: Path, path2: Path):
+    """Swap atomically two files or folders of the same file system
+
+    Raises:
+        OSError: if the system does not support renameat2 with RENAME_EXCHANGE
+    """
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (AttributeError, OSError, TypeError) as error:
+        raise OSError(errno.ENOSYS, "renameat2 is not supported on this platform") from error
+    renameat2.argtypes = [
+        ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint
+    ]
+    if renameat2(AT_FDCWD, os.fsencode(path1), AT_FDCWD, os.fsencode(path2), RENAME_EXCHANGE):
+        error_number = ctypes.get_errno()
+        raise OSError(error_number, os.strerror(error_number), str(path1), None, str(path2))
+
+
+def copy_file(src: Path, dst: Path):
+    """Copy a file with its stats, as shutil.copy2
+
+    The content is copied by the kernel with copy_file_range if available, which lets the NFS
+    servers and the copy-on-write file systems copy the data without sending it to the client.
+    """
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            size = os.fstat(src_file.fileno()).st_size
+            try:
+                offset = 0
+                while offset < size:
+                    count = os.copy_file_range(
+                        src_file.fileno(), dst_file.fileno(), size - offset
+                    )
+                    if not count:
+                        break
+                    offset += count
+                # Files whose size is not known, such as pseudo files, are copied by shutil
+                copied = offset == size and size > 0
+            except OSError as error:
+                if error.errno not in _COPY_RANGE_ERRNOS:
+                    raise
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _map_files(function, arguments, workers: int = 1):
+    """Call function on each tuple of arguments with a pool of workers threads
+
+    Arguments are consumed in order before the first result is returned, so that the folders
+    created while they are generated exist before the files are copied into them.
+    """
+    if workers <= 1:
+        return list(starmap(function, arguments))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, *zip(*arguments)))
+
+
+def walk_tree(src_dir: Path, included: tuple = None, excluded: tuple = ()):
+    """Browse the folders of a tree reproduced by materialize_tree
+
+    Args:
+        src_dir (Path): folder browsed
+        included (tuple): folders browsed, relative to src_dir, with the files at the root of
+            src_dir (everything if None)
+        excluded (tuple): glob patterns of the files and folders skipped, relative to src_dir
+
+    Yields:
+        rel_dir (Path): folder relative to src_dir
+        file_names (list): names of the files of the folder which are not skipped
+    """
+    src_dir = Path(src_dir)
+    included = None if included is None else [Path(path) for path in included]
+
+    def is_excluded(rel_path: Path) -> bool:
+        return any(fnmatchcase(rel_path.as_posix(), pattern) for pattern in excluded)
+
+    def is_included(rel_path: Path, is_dir: bool) -> bool:
+        if included is None:
+            return True
+        return any(
+            rel_path.is_relative_to(path) or (is_dir and path.is_relative_to(rel_path))
+            for path in included
+        ) or (not is_dir and rel_path.parent == Path("."))
+
+    for dir_path, dir_names, file_names in os.walk(src_dir, followlinks=True):
+        rel_dir = Path(dir_path).relative_to(src_dir)
+        dir_names[:] = [
+            dir_name
+            for dir_name in dir_names
+            if not is_excluded(rel_dir / dir_name) and is_included(rel_dir / dir_name, True)
+        ]
+        yield rel_dir, [
+            file_name
+            for file_name in file_names
+            if not is_excluded(rel_dir / file_name) and is_included(rel_dir / file_name, False)
+        ]
+
+
+def materialize_tree(
+    src_dir: Path,
+    dst_dir: Path,
+    methods: tuple = MATERIALIZE_METHODS,
+    hardlink_patterns: tuple = (),
+    included: tuple = None,
+    excluded: tuple = (),
+    workers: int = 1,
+) -> Counter:
+    """Reproduce the content of a folder into another one with the cheapest method for each file
+
+    Files are cloned with reflink if the file system supports it. Otherwise, the files matching
+    hardlink_patterns, which are only read by geniac, are hard linked to the original file. The
+    other files are copied. An existing file of dst_dir is always removed first, so that a file
+    previously linked to the project is never written in place. Symbolic links are followed as
+    with a copy.
+
+    A sparse copy is made if included folders are given: only these folders and the files at the
+    root of src_dir are reproduced.
+
+    Args:
+        src_dir (Path): folder to reproduce
+        dst_dir (Path): destination folder
+        methods (tuple): methods allowed among reflink, hardlink and copy
+        hardlink_patterns (tuple): glob patterns of the files which can be hard linked, relative
+            to src_dir
+        included (tuple): folders reproduced, relative to src_dir (everything if None)
+        excluded (tuple): glob patterns of the files and folders not reproduced, relative to
+            src_dir
+        workers (int): number of threads reproducing the files, the folders being created in
+            order by the calling thread
+
+    Returns:
+        counts (Counter): number of files reproduced with each method
+    """
+    src_dir, dst_dir = Path(src_dir), Path(dst_dir)
+    # Methods are given up for the whole tree after their first unsupported error
+    enabled = [method for method in MATERIALIZE_METHODS if method in methods]
+
+    def files():
+        for rel_dir, file_names in walk_tree(src_dir, included, excluded):
+            (dst_dir / rel_dir).mkdir(parents=True, exist_ok=True)
+            for file_name in file_names:
+                yield (
+                    src_dir, dst_dir, (rel_dir / file_name).as_posix(), enabled, hardlink_patterns
+                )
+
+    return Counter(_map_files(_materialize_file, files(), workers))
+
+
+def _materialize_file(
+    src_dir: Path, dst_dir: Path, rel_path: str, enabled: list, hardlink_patterns: tuple
+) -> str:
+    """Reproduce a file with the first method of enabled which is supported
+
+    Unsupported methods are removed from enabled, which can be shared by several threads.
+
+    Returns:
+        method (str): method used
+    """
+    src, dst = src_dir / rel_path, dst_dir / rel_path
+    dst.unlink(missing_ok=True)
+    hardlink = any(fnmatchcase(rel_path, pattern) for pattern in hardlink_patterns)
+    for method in list(enabled):
+        if method == "hardlink" and not hardlink:
+            continue
+        try:
+            if method == "reflink":
+                reflink_file(src, dst)
+            elif method == "hardlink":
+                os.link(src, dst)
+            else:
+                copy_file(src, dst)
+        except OSError as error:
+            if method == "copy" or error.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+            try:
+                enabled.remove(method)
+            except ValueError:
+                # Already given up by another thread
+                pass
+            continue
+        return method
+    # Copy is the last resort even if it has not been allowed
+    copy_file(src, dst)
+    return "copy"
+
+
+def stat_tree(src_dir: Path, folders: tuple) -> dict:
+    """Manifest of the files of some folders identified by their stats only
+
+    Args:
+        src_dir (Path): folder browsed
+        folders (tuple): folders browsed, relative to src_dir
+
+    Returns:
+        manifest (dict): {relative path: [size, mtime, None]} for each file
+    """
+    src_dir = Path(src_dir)
+    manifest = {}
+    for folder in folders:
+        if not (src_dir / folder).is_dir():
+            continue
+        for rel_dir, file_names in walk_tree(src_dir / folder):
+            for file_name in file_names:
+                rel_path = (Path(folder) / rel_dir / file_name).as_posix()
+                try:
+                    stat = os.stat(src_dir / rel_path)
+                except OSError:
+                    continue
+                manifest[rel_path] = [stat.st_size, stat.st_mtime_ns, None]
+    return manifest
+
+
+def sync_tree(
+    src_dir: Path,
+    dst_dir: Path,
+    manifest: dict,
+    previous: dict = None,
+    methods: tuple = MATERIALIZE_METHODS,
+    hardlink_patterns: tuple = (),
+    workers: int = 1,
+) -> Counter:
+    """Update a copy of a folder made from a previous manifest, such as rsync
+
+    Only the files added or changed since the previous synchronization are reproduced with
+    materialize_tree methods, and the files removed since then are deleted. The other files of
+    dst_dir, such as the build outputs, are left untouched to keep their modification time.
+
+    Args:
+        src_dir (Path): folder to reproduce
+        dst_dir (Path): copy of the folder
+        manifest (dict): {relative path: [size, mtime, digest]} of the files to reproduce, files
+            without digest being compared with their size and modification time
+        previous (dict): manifest of the previous synchronization (full copy if None)
+        methods (tuple): methods allowed among reflink, hardlink and copy
+        hardlink_patterns (tuple): glob patterns of the files which can be hard linked, relative
+            to src_dir
+        workers (int): number of threads reproducing the files
+
+    Returns:
+        counts (Counter): number of files reproduced with each method, unchanged and removed
+    """
+    src_dir, dst_dir = Path(src_dir), Path(dst_dir)
+    previous = previous or {}
+    enabled = [method for method in MATERIALIZE_METHODS if method in methods]
+    counts = Counter()
+    for rel_path in sorted(set(previous) - set(manifest)):
+        dst = dst_dir / rel_path
+        if dst.is_file() or dst.is_symlink():
+            dst.unlink()
+            counts["removed"] += 1
+        # Folders emptied by the removal are removed too
+        for parent in dst.parents:
+            if parent == dst_dir or not parent.is_dir() or any(parent.iterdir()):
+                break
+            parent.rmdir()
+
+    def files():
+        for rel_path, entry in manifest.items():
+            old_entry = previous.get(rel_path)
+            dst = dst_dir / rel_path
+            if (
+                old_entry
+                and (old_entry == entry if entry[2] is None else old_entry[2] == entry[2])
+                and dst.is_file()
+                and dst.stat().st_size == entry[0]
+            ):
+                counts["unchanged"] += 1
+                continue
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            yield src_dir, dst_dir, rel_path, enabled, hardlink_patterns
+
+    counts.update(_map_files(_materialize_file, files(), workers))
+    return counts
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""labels.py: Lookup structures for geniac labels"""
+
+from bisect import bisect_left
+from typing import Iterable
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+class LabelIndex:
+    """Sorted index of labels answering prefix queries with bisect
+
+    The index is built once from the label registry. Matches are returned in the order in which
+    labels have been registered so that the output is the same as a linear scan of the registry.
+    """
+
+    def __init__(self, labels: Iterable[str] = ()):
+        """
+
+        Args:
+            labels (Iterable): labels in registration order (duplicates are ignored)
+        """
+        positions = {}
+        for label in labels:
+            positions.setdefault(label, len(positions))
+        self._keys = sorted(positions)
+        self._positions = [positions[key] for key in self._keys]
+
+    def __len__(self):
+        """Number of distinct labels in the index"""
+        return len(self._keys)
+
+    def __contains__(self, label):
+        """Check if a label has been registered"""
+        idx = bisect_left(self._keys, label)
+        return idx < len(self._keys) and self._keys[idx] == label
+
+    def startswith(self, prefix: str) -> list:
+        """Return all the labels starting with prefix
+
+        Args:
+            prefix (str): label prefix
+
+        Returns:
+            labels (list): matching labels in registration order
+        """
+        matches = []
+        idx = bisect_left(self._keys, prefix)
+        while idx < len(self._keys) and self._keys[idx].startswith(prefix):
+            matches.append((self._positions[idx], self._keys[idx]))
+            idx += 1
+        return [label for _, label in sorted(matches)]
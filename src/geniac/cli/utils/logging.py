@@ -5,6 +5,7 @@
 
 import logging
 import geniac.cli.utils.errorcounter
+from geniac.cli.utils.diagnostics import annotate_record, consume_error_budget, rule_enabled
 
 __author__ = "Fabrice Allain"
 __copyright__ = "Institut Curie 2021"
@@ -34,8 +35,13 @@ class LogMixin:
 
     def error(self, *args, **kwargs):
         """Log error message and keep a trace of it"""
+        if not rule_enabled():
+            return None
         self.error_flag = True
-        return self.logger.error(*args, **kwargs)
+        self.logger.error(*args, **kwargs)
+        # Stop the lint once the maximum number of errors is reached
+        consume_error_budget()
+        return None
 
     def info(self, *args, **kwargs):
         """Log info messages"""
@@ -43,6 +49,8 @@ class LogMixin:
 
     def warning(self, *args, **kwargs):
         """Log warning messages"""
+        if not rule_enabled():
+            return None
         return self.logger.warning(*args, **kwargs)
 
     def debug(self, *args, **kwargs):
@@ -58,6 +66,44 @@ class LogMixin:
         return self.logger.exception(*args, **kwargs)
 
 
+class RecordCollector(logging.Handler):
+    """Handler keeping a trace of the geniac log records emitted while it is attached"""
+
+    LOGGER_NAME = "geniac"
+
+    def __init__(self, level: int = logging.WARNING):
+        super().__init__(level)
+        self.records = []
+
+    def emit(self, record):
+        """Save the level, the logger name, the message and the location of the record"""
+        annotate_record(record)
+        self.records.append(
+            [
+                record.levelno,
+                record.name,
+                record.getMessage(),
+                record.rule,
+                record.file,
+                record.line,
+            ]
+        )
+
+    def __enter__(self):
+        logging.getLogger(self.LOGGER_NAME).addHandler(self)
+        return self
+
+    def __exit__(self, *args):
+        logging.getLogger(self.LOGGER_NAME).removeHandler(self)
+
+    @staticmethod
+    def replay(records: list):
+        """Emit again records saved by a collector"""
+        for levelno, name, message, *details in records:
+            extra = dict(zip(("rule", "file", "line"), details))
+            logging.getLogger(name).log(levelno, "%s", message, extra=extra)
+
+
 class ExitOnExceptionHandler(logging.StreamHandler):
     """Custom handler that exit if the log level is critical"""
 
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""mirrors.py: Local bare mirrors of the git repositories cloned by geniac"""
+
+import fcntl
+import hashlib
+import posixpath
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+from git import Repo
+
+from geniac.cli.utils.logging import LogMixin
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+# scp-like syntax of ssh git URLs (user@host:path)
+SCP_URL_RE = re.compile(r"^(?P<host>[\w.@-]+):(?P<path>(?!//).*)$")
+
+
+def resolve_submodule_url(parent_url: str, url: str) -> str:
+    """URL of a submodule, relative URLs being resolved against the URL of its superproject"""
+    if not url.startswith(("./", "../")):
+        return url
+    if "://" in parent_url:
+        parts = urlsplit(parent_url)
+        return urlunsplit(
+            parts._replace(path=posixpath.normpath(posixpath.join(parts.path, url)))
+        )
+    if match := SCP_URL_RE.match(parent_url):
+        return f"{match['host']}:{posixpath.normpath(posixpath.join(match['path'], url))}"
+    return posixpath.normpath(posixpath.join(parent_url, url))
+
+
+def clone_options(depth: int = None, clone_filter: str = None, folders: list = None) -> list:
+    """Options of git clone for a shallow, partial or sparse clone"""
+    options = []
+    if depth:
+        options.append(f"--depth={depth}")
+    if clone_filter:
+        options.append(f"--filter={clone_filter}")
+    if folders is not None:
+        options.append("--sparse")
+    return options
+
+
+def checked_out_submodules(repo: Repo, folders: list = None) -> list:
+    """Submodules of a repository inside the folders of a sparse checkout (all if None)"""
+    return [
+        submodule
+        for submodule in repo.submodules
+        if folders is None
+        or any(Path(submodule.path).is_relative_to(folder) for folder in folders)
+    ]
+
+
+def clone_repository(
+    url: str,
+    dst: Path,
+    branch: str = None,
+    depth: int = None,
+    clone_filter: str = None,
+    folders: list = None,
+) -> Repo:
+    """Clone a repository with its submodules
+
+    Args:
+        url (str): URL of the repository
+        dst (Path): folder of the clone
+        branch (str): branch checked out (default branch of the repository if None)
+        depth (int): number of commits fetched (whole history if None)
+        clone_filter (str): partial clone filter, such as blob:none
+        folders (list): folders checked out in a sparse checkout, with the files at the root of
+            the repository (every file if None)
+
+    Returns:
+        repo (Repo): clone of the repository
+    """
+    repo = Repo.clone_from(
+        url, dst, branch=branch, multi_options=clone_options(depth, clone_filter, folders)
+    )
+    if folders is not None:
+        repo.git.sparse_checkout("set", *folders)
+    # Submodules outside of a sparse checkout are not cloned
+    if submodules := checked_out_submodules(repo, folders):
+        repo.git.submodule(
+            "update",
+            "--init",
+            "--recursive",
+            *([f"--depth={depth}"] if depth else []),
+            "--",
+            *(submodule.path for submodule in submodules),
+        )
+    return repo
+
+
+class GitMirrorCache(LogMixin):
+    """Bare mirrors of git repositories, updated incrementally and used as clone sources
+
+    Each repository is fetched into its mirror, then cloned locally from the mirror. The clone
+    and its submodules keep the original URLs as remotes.
+    """
+
+    # Git options allowing submodules to be cloned from local mirrors
+    LOCAL_CLONE_OPTIONS = {"c": "protocol.file.allow=always"}
+
+    def __init__(self, path: Path):
+        """
+
+        Args:
+            path (Path): folder of the mirrors
+        """
+        super().__init__()
+        self.path = Path(path)
+
+    def mirror_path(self, url: str) -> Path:
+        """Folder of the mirror of a repository"""
+        name = posixpath.basename(url.rstrip("/")).removesuffix(".git") or "repo"
+        key = hashlib.sha1(url.encode()).hexdigest()[:16]
+        return self.path / f"{name}-{key}.git"
+
+    @contextmanager
+    def _lock(self, mirror: Path):
+        """Prevent concurrent geniac runs from updating the same mirror"""
+        self.path.mkdir(parents=True, exist_ok=True)
+        with open(mirror.with_suffix(".lock"), "w", encoding="utf8") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def update(self, url: str) -> Path:
+        """Create or fetch the mirror of a repository
+
+        Returns:
+            mirror (Path): folder of the mirror
+        """
+        mirror = self.mirror_path(url)
+        with self._lock(mirror):
+            if (mirror / "HEAD").is_file():
+                self.info("Fetching %s into git mirror %s", url, mirror)
+                Repo(mirror).git.fetch("--prune", "origin")
+            else:
+                self.info("Creating git mirror %s of %s", mirror, url)
+                Repo.clone_from(url, mirror, mirror=True)
+            # Partial clones can be made from the mirror
+            Repo(mirror).git.config("uploadpack.allowFilter", "true")
+        return mirror
+
+    def clone(
+        self,
+        url: str,
+        dst: Path,
+        branch: str = None,
+        depth: int = None,
+        clone_filter: str = None,
+        folders: list = None,
+    ) -> Repo:
+        """Clone a repository and its submodules from up to date mirrors
+
+        Args:
+            url (str): URL of the repository
+            dst (Path): folder of the clone
+            branch (str): branch checked out (default branch of the repository if None)
+            depth (int): number of commits cloned (whole history if None)
+            clone_filter (str): partial clone filter, such as blob:none
+            folders (list): folders checked out in a sparse checkout, with the files at the root
+                of the repository (every file if None)
+
+        Returns:
+            repo (Repo): clone of the repository
+        """
+        mirror = self.update(url)
+        # Local clones ignore the depth and the filter, the file protocol is used instead
+        repo = Repo.clone_from(
+            mirror.as_uri() if depth or clone_filter else mirror,
+            dst,
+            branch=branch,
+            multi_options=clone_options(depth, clone_filter, folders),
+        )
+        if folders is not None:
+            repo.git.sparse_checkout("set", *folders)
+        self._clone_submodules(repo, url, folders)
+        # Missing objects of a partial clone are fetched from the mirror until here
+        repo.remote().set_url(url)
+        return repo
+
+    def _clone_submodules(self, repo: Repo, url: str, folders: list = None):
+        """Clone recursively the submodules of a repository from their mirrors"""
+        for submodule in checked_out_submodules(repo, folders):
+            submodule_url = resolve_submodule_url(url, submodule.url)
+            mirror = self.update(submodule_url)
+            # The submodule is cloned from the mirror, then its URL is restored
+            repo.git.config(f"submodule.{submodule.name}.url", mirror.as_posix())
+            repo.git(**self.LOCAL_CLONE_OPTIONS).submodule("update", "--init", "--", submodule.path)
+            repo.git.config(f"submodule.{submodule.name}.url", submodule_url)
+            submodule_repo = Repo(Path(repo.working_tree_dir) / submodule.path)
+            submodule_repo.remote().set_url(submodule_url)
+            self._clone_submodules(submodule_repo, submodule_url)
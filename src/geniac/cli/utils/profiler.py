@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""profiler.py: Instrumentation of the geniac lint phases and rules"""
+
+import json
+import re
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import RLock
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+# Counters recorded for each profiled section
+PROFILE_COUNTERS = (
+    "reads",
+    "bytes_read",
+    "lines",
+    "regex",
+    "listings",
+    "globs",
+    "stats",
+    "subprocesses",
+    "subprocess_time",
+)
+# Methods of compiled patterns counted as regex evaluations
+REGEX_METHODS = ("match", "search", "fullmatch", "findall", "finditer", "sub", "subn", "split")
+# Profiler of the sections open in the current context
+_ACTIVE_PROFILER = ContextVar("geniac_profiler", default=None)
+
+
+def profile_count(counter: str, value=1):
+    """Increment a counter of the sections open in the current context, if any"""
+    if (profiler := _ACTIVE_PROFILER.get()) is not None:
+        profiler.count(counter, value)
+
+
+@contextmanager
+def profile_subprocess():
+    """Count a subprocess run in this context and its duration"""
+    profile_count("subprocesses")
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile_count("subprocess_time", time.perf_counter() - start)
+
+
+def _counted_regex_method(name: str):
+    """Method of ProfiledPattern counting a regex evaluation before calling the compiled one"""
+
+    def evaluate(self, *args, **kwargs):
+        profile_count("regex")
+        return getattr(self.compiled, name)(*args, **kwargs)
+
+    evaluate.__name__ = name
+    return evaluate
+
+
+class ProfiledPattern:
+    """Compiled regular expression counting its evaluations in the sections open in the
+    current context
+
+    Geniac parsers and rules compile their regular expressions with this class instead of
+    re.compile, other attributes are those of the compiled pattern.
+    """
+
+    def __init__(self, pattern: str, flags: int = 0):
+        """
+
+        Args:
+            pattern (str): regular expression
+            flags (int): flags of the re module
+        """
+        self.compiled = re.compile(pattern, flags)
+
+    def __getattr__(self, name):
+        if name == "compiled":
+            raise AttributeError(name)
+        return getattr(self.compiled, name)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.compiled.pattern!r})"
+
+
+for _name in REGEX_METHODS:
+    setattr(ProfiledPattern, _name, _counted_regex_method(_name))
+
+
+class LintProfiler:
+    """Record wall time, CPU time and resource usage of nested sections
+
+    While a section is open, geniac counts the files read and the lines parsed by its parsers,
+    the regular expressions evaluated, the accesses to the project files and the subprocesses it runs with profile_count and
+    profile_subprocess. Counters are inclusive: an event is counted in every open section.
+    Worker threads only count their events if they run in a copy of the context.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+
+        Args:
+            enabled (bool): if False, sections are not recorded
+        """
+        self.enabled = enabled
+        self.sections = OrderedDict()
+        self._stack = []
+        self._lock = RLock()
+
+    @contextmanager
+    def section(self, kind: str, name: str):
+        """Profile the code executed in this context
+
+        Args:
+            kind (str): kind of section (phase, rule...)
+            name (str): name of the section
+        """
+        if not self.enabled:
+            yield
+            return
+        with self._lock:
+            stats = self.sections.setdefault(
+                (kind, name),
+                {"wall": 0.0, "cpu": 0.0, **{counter: 0 for counter in PROFILE_COUNTERS}},
+            )
+            self._stack.append(stats)
+        token = _ACTIVE_PROFILER.set(self)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            with self._lock:
+                stats["wall"] += time.perf_counter() - wall
+                stats["cpu"] += time.process_time() - cpu
+                del self._stack[
+                    next(idx for idx, item in enumerate(self._stack) if item is stats)
+                ]
+            _ACTIVE_PROFILER.reset(token)
+
+    def count(self, counter: str, value=1):
+        """Increment a counter of every open section"""
+        with self._lock:
+            for stats in self._stack:
+                stats[counter] += value
+
+    def to_dict(self) -> list:
+        """Recorded sections in a JSON serializable format"""
+        return [
+            {"kind": kind, "name": name, **stats}
+            for (kind, name), stats in self.sections.items()
+        ]
+
+    def dump(self, path: str):
+        """Write the recorded sections in a JSON file"""
+        with open(path, "w", encoding="utf8") as profile_file:
+            json.dump(self.to_dict(), profile_file, indent=2)
+
+    def format_table(self) -> str:
+        """Recorded sections formatted as a table"""
+        header = (
+            "Section", "Wall (s)", "CPU (s)", "Reads", "Read (B)", "Lines", "Regex",
+            "Listings", "Globs", "Stats", "Procs", "Procs (s)",
+        )
+        rows = [
+            (
+                f"{kind} {name}",
+                f"{stats['wall']:.3f}",
+                f"{stats['cpu']:.3f}",
+                str(stats["reads"]),
+                str(stats["bytes_read"]),
+                str(stats["lines"]),
+                str(stats["regex"]),
+                str(stats["listings"]),
+                str(stats["globs"]),
+                str(stats["stats"]),
+                str(stats["subprocesses"]),
+                f"{stats['subprocess_time']:.3f}",
+            )
+            for (kind, name), stats in self.sections.items()
+        ]
+        widths = [max(len(row[idx]) for row in [header] + rows) for idx in range(len(header))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if idx == 0 else cell.rjust(width)
+                for idx, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in [header] + rows
+        )
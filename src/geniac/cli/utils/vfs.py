@@ -0,0 +1,305 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""vfs.py: Views of the files of a project read by geniac commands"""
+
+from abc import ABC, abstractmethod
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+from git import BadName, InvalidGitRepositoryError, NoSuchPathError, Repo
+
+from geniac.cli.utils.profiler import profile_count
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+DEFAULT_ENCODING = "UTF-8"
+
+
+class SourceTree(ABC):
+    """Read-only view of the files of a project
+
+    Attributes:
+        changes (dict): change type (A, D, M or R) of each changed file, or None if the view is
+            not compared with a previous state of the project
+
+    Views implement is_local and the abstract underscore methods. The public methods also count
+    the accesses in the lint profile, if any.
+    """
+
+    changes = None
+    # Identifier of the content of the whole view if it cannot change (None otherwise)
+    fingerprint = None
+
+    def __init__(self, root: Path):
+        """
+
+        Args:
+            root (Path): root folder of the project
+        """
+        self.root = Path(root).resolve()
+
+    @abstractmethod
+    def is_local(self, path: Path) -> bool:
+        """Check if a file can be read directly from the file system"""
+
+    def exists(self, path: Path) -> bool:
+        """Check if a file exists in the view"""
+        profile_count("stats")
+        return self._exists(path)
+
+    def is_dir(self, path: Path) -> bool:
+        """Check if a path is a folder in the view"""
+        profile_count("stats")
+        return self._is_dir(path)
+
+    def iterdir(self, path: Path) -> list:
+        """Paths of the files and folders of a folder"""
+        profile_count("listings")
+        return self._iterdir(path)
+
+    def glob(self, path: Path, pattern: str) -> list:
+        """Sorted paths matching a relative glob pattern in a folder"""
+        profile_count("globs")
+        return self._glob(path, pattern)
+
+    def read_bytes(self, path: Path) -> bytes:
+        """Content of a file"""
+        content = self._read_bytes(path)
+        profile_count("reads")
+        profile_count("bytes_read", len(content))
+        return content
+
+    @abstractmethod
+    def _exists(self, path: Path) -> bool:
+        """Check if a file exists in the view"""
+
+    @abstractmethod
+    def _is_dir(self, path: Path) -> bool:
+        """Check if a path is a folder in the view"""
+
+    @abstractmethod
+    def _iterdir(self, path: Path) -> list:
+        """Paths of the files and folders of a folder"""
+
+    @abstractmethod
+    def _glob(self, path: Path, pattern: str) -> list:
+        """Sorted paths matching a relative glob pattern in a folder"""
+
+    @abstractmethod
+    def _read_bytes(self, path: Path) -> bytes:
+        """Content of a file"""
+
+    def read_text(self, path: Path, encoding: str = DEFAULT_ENCODING) -> str:
+        """Decoded content of a file"""
+        return self.read_bytes(path).decode(encoding)
+
+
+class LocalTree(SourceTree):
+    """Files of the project in the file system"""
+
+    def is_local(self, path: Path) -> bool:
+        return True
+
+    def _exists(self, path: Path) -> bool:
+        return Path(path).exists()
+
+    def _is_dir(self, path: Path) -> bool:
+        return Path(path).is_dir()
+
+    def _iterdir(self, path: Path) -> list:
+        return list(Path(path).iterdir())
+
+    def _glob(self, path: Path, pattern: str) -> list:
+        return sorted(Path(path).glob(pattern))
+
+    def _read_bytes(self, path: Path) -> bytes:
+        return Path(path).read_bytes()
+
+
+def _open_repo(root: Path) -> Repo:
+    """Git repository containing a folder
+
+    Raises:
+        ValueError: if root is not in a git repository
+    """
+    try:
+        return Repo(root, search_parent_directories=True)
+    except (InvalidGitRepositoryError, NoSuchPathError) as error:
+        raise ValueError(f"{root} is not in a git repository") from error
+
+
+def _match_parts(parts: list, patterns: list) -> bool:
+    """Check if the parts of a relative path match the parts of a glob pattern"""
+    if not patterns:
+        return not parts
+    if patterns[0] == "**":
+        return any(_match_parts(parts[idx:], patterns[1:]) for idx in range(len(parts) + 1))
+    return (
+        bool(parts)
+        and fnmatchcase(parts[0], patterns[0])
+        and _match_parts(parts[1:], patterns[1:])
+    )
+
+
+class GitIndexTree(LocalTree):
+    """Files of the project as they are staged in the git index
+
+    Only the files which differ between the index and HEAD or the working tree are read from the
+    index blobs. The other files are read from the file system. Untracked files and files
+    removed from the index do not exist in this view.
+    """
+
+    def __init__(self, root: Path):
+        """
+
+        Args:
+            root (Path): root folder of the project, in a git repository
+
+        Raises:
+            ValueError: if root is not in a git repository
+        """
+        super().__init__(root)
+        self.repo = _open_repo(self.root)
+        self.workdir = Path(self.repo.working_tree_dir).resolve()
+        entries = self.repo.index.entries
+        self.changes = {}
+        # Index blob of each file read from the index (None if the file is not in the index)
+        self._blobs = {}
+
+        def blob(rel_path: str):
+            entry = entries.get((rel_path, 0))
+            return entry.binsha if entry is not None else None
+
+        if self.repo.head.is_valid():
+            staged = [
+                (diff.change_type[0], diff.a_path, diff.b_path)
+                for diff in self.repo.head.commit.diff()
+            ]
+        else:
+            # Nothing has been committed yet
+            staged = [("A", rel_path, rel_path) for rel_path, _ in entries]
+        for change_type, a_path, b_path in staged:
+            if change_type == "R":
+                self._set(a_path, None, "D")
+            rel_path = a_path if change_type == "D" else b_path
+            self._set(rel_path, blob(rel_path), change_type if change_type != "R" else "A")
+        # Files modified in the working tree are read as they are staged
+        for diff in self.repo.index.diff(None):
+            if (path := self.workdir / diff.a_path) not in self._blobs:
+                self._blobs[path] = blob(diff.a_path)
+        for rel_path in self.repo.untracked_files:
+            self._blobs.setdefault(self.workdir / rel_path, None)
+
+    def _set(self, rel_path: str, binsha: bytes, change_type: str):
+        """Record a staged change of a file of the project"""
+        path = self.workdir / rel_path
+        self._blobs[path] = binsha
+        if path.is_relative_to(self.root):
+            self.changes[path] = change_type
+
+    def is_local(self, path: Path) -> bool:
+        return Path(path).resolve() not in self._blobs
+
+    def _exists(self, path: Path) -> bool:
+        if (path := Path(path).resolve()) in self._blobs:
+            return self._blobs[path] is not None
+        return path.exists()
+
+    def _iterdir(self, path: Path) -> list:
+        return [child for child in super()._iterdir(path) if self._exists(child)]
+
+    def _glob(self, path: Path, pattern: str) -> list:
+        return [child for child in super()._glob(path, pattern) if self._exists(child)]
+
+    def _read_bytes(self, path: Path) -> bytes:
+        if (path := Path(path).resolve()) not in self._blobs:
+            return path.read_bytes()
+        if (binsha := self._blobs[path]) is None:
+            raise FileNotFoundError(f"{path} is not in the git index")
+        return self.repo.odb.stream(binsha).read()
+
+
+class GitRevisionTree(SourceTree):
+    """Files of the project at a git revision, read from the git object database
+
+    Paths are given as if the revision was checked out in the working tree of the repository,
+    but nothing is read from the working tree.
+    """
+
+    def __init__(self, root: Path, rev: str):
+        """
+
+        Args:
+            root (Path): root folder of the project, in a git repository
+            rev (str): git revision (commit, branch or tag) to read
+
+        Raises:
+            ValueError: if root is not in a git repository or rev is not a valid revision
+        """
+        super().__init__(root)
+        self.repo = _open_repo(self.root)
+        self.workdir = Path(self.repo.working_tree_dir).resolve()
+        try:
+            self.commit = self.repo.commit(rev)
+        except (BadName, ValueError) as error:
+            raise ValueError(f"{rev} is not a valid git revision") from error
+        self.fingerprint = self.commit.tree.hexsha
+
+    def _item(self, path: Path):
+        """Git object of a path (None if it does not exist at the revision)"""
+        path = Path(path).resolve()
+        if not path.is_relative_to(self.workdir):
+            return None
+        if path == self.workdir:
+            return self.commit.tree
+        try:
+            return self.commit.tree / path.relative_to(self.workdir).as_posix()
+        except KeyError:
+            return None
+
+    @staticmethod
+    def _walk(tree, prefix: str = "", depth: int = None):
+        """Relative paths and git objects of the content of a tree"""
+        for item in tree:
+            rel_path = f"{prefix}{item.name}"
+            yield rel_path, item
+            if item.type == "tree" and (depth is None or depth > 1):
+                yield from GitRevisionTree._walk(
+                    item, f"{rel_path}/", None if depth is None else depth - 1
+                )
+
+    def is_local(self, path: Path) -> bool:
+        return False
+
+    def _exists(self, path: Path) -> bool:
+        return self._item(path) is not None
+
+    def _is_dir(self, path: Path) -> bool:
+        return (item := self._item(path)) is not None and item.type in ("tree", "submodule")
+
+    def _iterdir(self, path: Path) -> list:
+        if (item := self._item(path)) is None or item.type != "tree":
+            return []
+        return [Path(path) / child.name for child in item]
+
+    def _glob(self, path: Path, pattern: str) -> list:
+        if (item := self._item(path)) is None or item.type != "tree":
+            return []
+        patterns = pattern.split("/")
+        # Only the levels which can match the pattern are browsed
+        depth = None if "**" in patterns else len(patterns)
+        return sorted(
+            Path(path) / rel_path
+            for rel_path, child in self._walk(item, depth=depth)
+            if _match_parts(rel_path.split("/"), patterns)
+            and (patterns[-1] != "**" or child.type == "tree")
+        )
+
+    def _read_bytes(self, path: Path) -> bytes:
+        if (item := self._item(path)) is None:
+            raise FileNotFoundError(f"{path} does not exist at git revision {self.commit.hexsha}")
+        if item.type != "blob":
+            raise IsADirectoryError(f"{path} is a folder at git revision {self.commit.hexsha}")
+        return item.data_stream.read()
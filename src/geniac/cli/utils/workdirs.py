@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""workdirs.py: Geniac working directories kept between runs"""
+
+import fcntl
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+
+from geniac.cli.utils.cleanup import TOMBSTONE_PREFIX
+from geniac.cli.utils.logging import LogMixin
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+class WorkdirStore(LogMixin):
+    """Working directories reused by the commands run on the same local project
+
+    Each project and command has its own working directory. The state of the working directory
+    records the fingerprint of the project files it has been initialized with, so that a run on
+    an unchanged project can reuse the source and build folders as they are. Working directories
+    which have not been used for a while can be evicted.
+    """
+
+    # State of a working directory, in its cache folder
+    STATE_PATH = Path(".geniac") / "workdir.json"
+
+    def __init__(self, path: Path):
+        """
+
+        Args:
+            path (Path): folder of the working directories
+        """
+        super().__init__()
+        self.path = Path(path)
+        self._locks = {}
+
+    def workdir_path(self, src_path: Path, command: str) -> Path:
+        """Working directory of a command run on a project"""
+        src_path = Path(src_path).resolve()
+        key = hashlib.sha1(f"{src_path.as_posix()}\0{command}".encode()).hexdigest()[:16]
+        return self.path / f"{src_path.name or 'project'}-{command}-{key}"
+
+    @staticmethod
+    def lock_path(workdir: Path) -> Path:
+        """Lock file of a working directory, touched by each run using it"""
+        return workdir.parent / f"{workdir.name}.lock"
+
+    def acquire(self, workdir: Path) -> bool:
+        """Lock a working directory until the end of the process
+
+        Returns:
+            locked (bool): False if the working directory is used by another geniac run
+        """
+        if workdir in self._locks:
+            return True
+        self.path.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.lock_path(workdir), "w", encoding="utf8")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._locks[workdir] = lock_file
+        return True
+
+    def release(self, workdir: Path, remove_lock: bool = False):
+        """Unlock a working directory
+
+        Args:
+            workdir (Path): working directory locked by this process
+            remove_lock (bool): also remove the lock file once the working directory is removed
+        """
+        if lock_file := self._locks.pop(workdir, None):
+            if remove_lock:
+                self.lock_path(workdir).unlink(missing_ok=True)
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+
+    def stale_workdirs(self, max_age: float) -> list:
+        """Working directories unused for more than max_age seconds, locked for their removal
+
+        Working directories used by another geniac run are never returned.
+        """
+        if not self.path.is_dir():
+            return []
+        limit = time.time() - max_age
+        stale = []
+        for workdir in sorted(self.path.iterdir()):
+            if (
+                workdir in self._locks
+                or workdir.name.startswith(TOMBSTONE_PREFIX)
+                or not workdir.is_dir()
+            ):
+                continue
+            try:
+                last_use = self.lock_path(workdir).stat().st_mtime
+            except OSError:
+                last_use = workdir.stat().st_mtime
+            if last_use < limit and self.acquire(workdir):
+                stale.append(workdir)
+        return stale
+
+    def read_state(self, workdir: Path) -> dict:
+        """State of a working directory (empty if it has never been initialized)"""
+        try:
+            return json.loads((workdir / self.STATE_PATH).read_text(encoding="utf8"))
+        except (OSError, ValueError):
+            return {}
+
+    def write_state(self, workdir: Path, state: dict):
+        """Save the state of a working directory (removed if state is None)"""
+        state_path = workdir / self.STATE_PATH
+        if state is None:
+            state_path.unlink(missing_ok=True)
+            return
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(
+            "w", dir=state_path.parent, delete=False, encoding="utf8"
+        ) as tmp_file:
+            json.dump(state, tmp_file, separators=(",", ":"))
+        os.replace(tmp_file.name, state_path)
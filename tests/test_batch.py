@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""test_batch.py: Test geniac.cli.commands.batch module"""
+
+import json
+import shutil
+
+import pytest
+
+from geniac.cli.commands.batch import GeniacLintBatch, lint_project
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+def test_read_projects_file(tmp_path):
+    """Check comments are skipped and relative paths are relative to the manifest"""
+    manifest = tmp_path / "projects.txt"
+    manifest.write_text("# nightly lint\n/data/pipeline-a\n\n  pipelines/b  \n")
+    assert GeniacLintBatch.read_projects_file(manifest) == [
+        "/data/pipeline-a",
+        str(tmp_path / "pipelines" / "b"),
+    ]
+
+
+def test_lint_batch(shared_datadir, tmp_path, monkeypatch):
+    """Check that two projects linted by concurrent workers keep their cached results"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    projects = [tmp_path / "pipeline-a", tmp_path / "pipeline-b"]
+    for project in projects:
+        shutil.copytree(shared_datadir, project)
+
+    with pytest.raises(SystemExit):
+        GeniacLintBatch(projects=projects, jobs=2).run()
+    results = json.loads((tmp_path / "cache" / "geniac" / "lint.json").read_text())
+    assert {key.rpartition(":")[2] for key in results} == {
+        str(project.resolve()) for project in projects
+    }
+
+    # Diagnostics of an unchanged project are replayed from the cache
+    src_path, status, _, records = lint_project(str(projects[0]), {})
+    assert src_path == str(projects[0]) and status == 1
+    assert any(record[3] == "process-labels" for record in records)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""test_cache.py: Test geniac.cli.utils.cache module"""
+
+from geniac.cli.utils.cache import GeniacCache, fingerprint_files
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+def test_fingerprint_files(tmp_path):
+    """Check the fingerprint only depends on the content of the files which are not ignored"""
+    (tmp_path / "modules").mkdir()
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "main.nf").write_text("workflow {}\n")
+    (tmp_path / "modules" / "tool.nf").write_text("process tool {}\n")
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/master\n")
+    # Links to folders are not followed
+    (tmp_path / "modules" / "loop").symlink_to("..")
+
+    fingerprint, manifest = fingerprint_files(tmp_path)
+    assert sorted(manifest) == ["main.nf", "modules/tool.nf"]
+    assert fingerprint_files(tmp_path, manifest) == (fingerprint, manifest)
+
+    # Ignored folders do not change the fingerprint
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/devel\n")
+    assert fingerprint_files(tmp_path, manifest)[0] == fingerprint
+
+    (tmp_path / "main.nf").write_text("workflow { tool() }\n")
+    assert fingerprint_files(tmp_path, manifest)[0] != fingerprint
+
+
+def test_cache_save_keeps_other_entries(tmp_path):
+    """Check entries written by another process are not lost when saving"""
+    first = GeniacCache(tmp_path / "cache.json")
+    second = GeniacCache(tmp_path / "cache.json")
+    assert first.get("a") is None and second.get("b") is None
+    first.set("a", 1)
+    second.set("b", 2)
+    first.save()
+    second.save()
+    assert GeniacCache(tmp_path / "cache.json").entries.keys() == {"a", "b"}
+    assert GeniacCache.shared(tmp_path / "cache.json") is GeniacCache.shared(
+        tmp_path / "cache.json"
+    )
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""test_clean.py: Test geniac.cli.commands.clean module"""
+
+from geniac.cli.commands.clean import GeniacClean
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+def test_clean_selection(tmp_path):
+    """Check that geniac clean only removes the selected build files of a working directory"""
+    for rel_path in (
+        ".geniac/lint.json",
+        "src/main.nf",
+        "build/CMakeCache.txt",
+        "build/workDir/work/ab/cd/.command.sh",
+        "build/workDir/results/singularity/images/fastqc.sif",
+        "build/workDir/results/conf/docker.config",
+    ):
+        (tmp_path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel_path).write_text(rel_path)
+
+    GeniacClean(src_path=tmp_path, images=True, work=True, dry_run=True, which="clean").run()
+    assert (tmp_path / "build" / "workDir" / "work").is_dir()
+
+    clean = GeniacClean(src_path=tmp_path, images=True, work=True, which="clean")
+    clean.cleaner.background = False
+    clean.run()
+    assert sorted(
+        path.relative_to(tmp_path).as_posix() for path in tmp_path.rglob("*") if path.is_file()
+    ) == [
+        ".geniac/lint.json",
+        "build/CMakeCache.txt",
+        "build/workDir/results/conf/docker.config",
+        "src/main.nf",
+    ]
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""test_cleanup.py: Test geniac.cli.utils.cleanup module"""
+
+import time
+
+from geniac.cli.utils.cleanup import TOMBSTONE_PREFIX, BackgroundCleaner
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+def test_background_cleaner(tmp_path):
+    """Check that removed folders are renamed at once and deleted by a detached process"""
+    build = tmp_path / "build"
+    (build / "workDir" / "results").mkdir(parents=True)
+    (build / "workDir" / "results" / "docker.config").write_text("docker {}\n")
+
+    BackgroundCleaner().remove(build, recreate=True)
+    assert build.is_dir() and not any(build.iterdir())
+    for _ in range(100):
+        if not list(tmp_path.glob(f"{TOMBSTONE_PREFIX}*")):
+            break
+        time.sleep(0.1)
+    assert [path.name for path in tmp_path.iterdir()] == ["build"]
+
+
+def test_background_cleaner_collect(tmp_path):
+    """Check that tombstones left by previous runs are collected"""
+    (tmp_path / f"{TOMBSTONE_PREFIX}build-1234" / "work").mkdir(parents=True)
+    (tmp_path / "configs").mkdir()
+    BackgroundCleaner(background=False).collect(tmp_path, tmp_path / "missing")
+    assert [path.name for path in tmp_path.iterdir()] == ["configs"]
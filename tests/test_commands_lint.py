@@ -3,11 +3,17 @@
 
 """test_check.py: Test geniac.check module"""
 
+import json
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
+from git import Repo
 
 from geniac.cli.commands.lint import GeniacLint
+from geniac.cli.parsers.base import GeniacParser
+from geniac.cli.parsers.config import NextflowConfig
+from geniac.cli.parsers.scripts import NextflowScript
 
 __author__ = "Fabrice Allain"
 __copyright__ = "Institut Curie 2020"
@@ -22,3 +28,124 @@ def gcheck_data(shared_datadir):
 def test_data_gcheck(gcheck_data, shared_datadir):
     """Check if  GChek with data has been instantiated correctly"""
     assert gcheck_data.src_path == Path(shared_datadir)
+
+
+def test_enabled_rules(shared_datadir):
+    """Check rules are selected and ignored with glob patterns"""
+    lint = GeniacLint(shared_datadir, select="conda-*,process-labels", ignore="conda-availability")
+    assert [rule.rule_id for rule in lint.enabled_rules] == [
+        "conda-pattern",
+        "process-labels",
+        "conda-labels",
+    ]
+    assert len(GeniacLint(shared_datadir).enabled_rules) == len(GeniacLint.RULES)
+
+
+def test_lint_inputs(shared_datadir):
+    """Check that only the files read by the lint are fingerprinted"""
+    (shared_datadir / "work" / "ab").mkdir(parents=True)
+    (shared_datadir / "work" / "ab" / ".command.sh").write_text("fastqc\n")
+    (shared_datadir / "modules" / "fromSource" / "loop").symlink_to("..")
+    paths, listing = GeniacLint(shared_datadir)._lint_inputs()
+    assert {"main.nf", "nextflow.config", "conf/geniac.config"} <= set(paths)
+    assert "modules/fromSource/CMakeLists.txt" in paths
+    assert "conf/README.md" in paths
+    assert not any(path.startswith(("work/", "channels/")) for path in paths + listing)
+
+
+def test_lint_diagnostics_lines(shared_datadir, tmp_path, monkeypatch):
+    """Check that findings about processes and tools are located at their definition"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    jsonl_path = tmp_path / "lint.jsonl"
+    with pytest.raises(SystemExit):
+        GeniacLint(shared_datadir, diagnostics_jsonl=str(jsonl_path)).run()
+    diagnostics = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+    main_lines = (shared_datadir / "main.nf").read_text().splitlines()
+    [unlabelled] = [
+        diagnostic
+        for diagnostic in diagnostics
+        if diagnostic["message"].startswith("Process fastqc in main.nf")
+    ]
+    assert unlabelled["file"] == "main.nf"
+    assert main_lines[unlabelled["line"] - 1].startswith("process fastqc {")
+    config_lines = (shared_datadir / "conf" / "geniac.config").read_text().splitlines()
+    tool = next(
+        diagnostic for diagnostic in diagnostics if diagnostic["file"] == "conf/geniac.config"
+    )
+    assert config_lines[tool["line"] - 1].strip().startswith("fastqc =")
+
+
+@pytest.mark.parametrize("ignore, called", [("", True), ("config-files,container-labels", False)])
+def test_disabled_rules_not_checked(shared_datadir, tmp_path, monkeypatch, ignore, called):
+    """Check that the checks of disabled rules are not run while their phase is parsed"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    calls = []
+    monkeypatch.setattr(
+        NextflowConfig, "check_config_scope", lambda *args, **kwargs: calls.append("config")
+    )
+    monkeypatch.setattr(
+        GeniacLint, "_check_containers_folders", lambda self: calls.append("containers")
+    )
+    with pytest.raises(SystemExit):
+        GeniacLint(shared_datadir, ignore=ignore, no_result_cache=True).run()
+    assert sorted(set(calls)) == (["config", "containers"] if called else [])
+
+
+def test_lint_staged_parse_cache(shared_datadir, tmp_path, monkeypatch):
+    """Check that a staged lint reuses the blocks parsed by a previous geniac process"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    repo = Repo.init(shared_datadir)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "geniac")
+        config.set_value("user", "email", "geniac@example.com")
+    repo.git.add(A=True)
+    repo.index.commit("init")
+    with (shared_datadir / "main.nf").open("a") as script:
+        script.write("\n")
+    repo.index.add(["main.nf"])
+
+    reads = []
+    script_read = NextflowScript._read
+    monkeypatch.setattr(
+        NextflowScript,
+        "_read",
+        lambda *args, **kwargs: reads.append(1) or script_read(*args, **kwargs),
+    )
+    counts = []
+    for _ in range(2):
+        # Each lint starts with the in-memory blocks of a new process
+        monkeypatch.setattr(GeniacParser, "BLOCK_CACHE", OrderedDict())
+        reads.clear()
+        with pytest.raises(SystemExit):
+            GeniacLint(shared_datadir, staged=True).run()
+        counts.append(len(reads))
+    assert counts[0] > 0 and counts[1] == 0
+
+
+def test_lint_staged_conda_recipe(shared_datadir, tmp_path, monkeypatch):
+    """Check that a staged change of a conda environment file runs the conda rules"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    repo = Repo.init(shared_datadir)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "geniac")
+        config.set_value("user", "email", "geniac@example.com")
+    conda_path = shared_datadir / "recipes" / "conda" / "fastqc.yml"
+    conda_path.parent.mkdir(parents=True)
+    recipe = "channels:\n  - bioconda\n  - nodefaults\ndependencies:\n  - fastqc=0.11.9=0\n"
+    conda_path.write_text("name: fastqc_env\n" + recipe)
+    repo.git.add(A=True)
+    repo.index.commit("init")
+    conda_path.write_text(recipe)
+    repo.index.add([conda_path.relative_to(shared_datadir).as_posix()])
+
+    jsonl_path = tmp_path / "lint.jsonl"
+    try:
+        GeniacLint(shared_datadir, staged=True, diagnostics_jsonl=str(jsonl_path)).run()
+    except SystemExit:
+        pass
+    diagnostics = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+    assert any(
+        "recipes/conda/fastqc.yml" in diagnostic["message"]
+        and "does not have a name entry" in diagnostic["message"]
+        for diagnostic in diagnostics
+    )
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""test_conda.py: Test geniac.cli.utils.conda module"""
+
+import time
+from collections import OrderedDict
+
+import pytest
+
+from geniac.cli.utils import conda
+from geniac.cli.utils.cache import GeniacCache
+from geniac.cli.utils.conda import (
+    CondaRecipeChecker,
+    RepodataIndex,
+    load_conda_env,
+    split_repodata_source,
+)
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+@pytest.fixture
+def fake_conda(tmp_path):
+    """Fake conda executable logging each search and failing for missing packages"""
+    conda_path = tmp_path / "conda"
+    conda_path.write_text(
+        "#!/bin/sh\n"
+        f'echo "$2" >> {tmp_path / "calls.log"}\n'
+        'case "$2" in *missing*) exit 1;; esac\n'
+        'echo "$2"\n'
+    )
+    conda_path.chmod(0o755)
+    return conda_path
+
+
+def test_conda_recipe_checker(fake_conda):
+    """Check that each distinct recipe is searched once and mapped back to its labels"""
+    checker = CondaRecipeChecker(max_workers=2, conda_cmd=str(fake_conda))
+    checker.add("bioconda::fastqc=0.11.6=2", "fastqc")
+    checker.add("conda-forge::python=3.8=h1_0", "multiqc")
+    checker.add("conda-forge::python=3.8=h1_0", "python")
+    checker.add("bioconda::missing=1=0", "python")
+
+    results = checker.check()
+
+    assert [recipe for recipe, _ in results] == [
+        "bioconda::fastqc=0.11.6=2",
+        "conda-forge::python=3.8=h1_0",
+        "bioconda::missing=1=0",
+    ]
+    assert [result.found for result in results.values()] == [True, True, False]
+    assert checker.recipes[("conda-forge::python=3.8=h1_0", ())] == ["multiqc", "python"]
+    assert len((fake_conda.parent / "calls.log").read_text().split()) == 3
+
+
+def test_conda_recipe_checker_cache(fake_conda, tmp_path):
+    """Check that cached results are used instead of calling conda search again"""
+    cache_path = tmp_path / "cache" / "conda.json"
+    calls_log = fake_conda.parent / "calls.log"
+    for refresh, expected_calls in ((False, 2), (False, 2), (True, 4)):
+        checker = CondaRecipeChecker(
+            conda_cmd=str(fake_conda),
+            cache=GeniacCache(cache_path),
+            ttl=3600,
+            negative_ttl=60,
+            refresh=refresh,
+        )
+        checker.add("bioconda::fastqc=0.11.6=2", "fastqc")
+        checker.add("bioconda::missing=1=0", "python")
+        results = checker.check()
+        assert [result.found for result in results.values()] == [True, False]
+        assert len(calls_log.read_text().split()) == expected_calls
+
+
+def test_repodata_index(shared_datadir, tmp_path):
+    """Check recipes against a fixture channel without calling conda"""
+    cache = GeniacCache(tmp_path / "conda.json")
+    for _ in range(2):
+        index = RepodataIndex([str(shared_datadir / "channels" / "bioconda")], cache=cache)
+        assert index.channels == ["bioconda"]
+        assert index.search("bioconda::fastqc=0.11.6=2").found
+        assert index.search("bioconda::multiqc=1.9=py_1").found
+        assert index.search("samtools=1.10=h9402c20_2", ("conda-forge", "bioconda")).found
+        assert index.search("bioconda::samtools=1.*=h9402c20_2").found
+        assert not index.search("bioconda::fastqc=0.11.6=3").found
+        assert not index.search("conda-forge::python=3.8=h1_0").found
+    assert cache.get(RepodataIndex.CACHE_KEY)["index"]["bioconda"]["fastqc"] == ["0.11.6=2"]
+
+    checker = CondaRecipeChecker(conda_cmd="not-conda", index=index)
+    assert checker.is_available
+    checker.add("bioconda::fastqc=0.11.6=2", "fastqc")
+    checker.add("bioconda::missing=1=0", "missing")
+    assert [result.found for result in checker.check().values()] == [True, False]
+
+
+def test_split_repodata_source():
+    """Check that the channel is only split at the first '=' of a repodata source"""
+    assert split_repodata_source("bioconda=/data/a=b") == ("bioconda", "/data/a=b")
+    assert split_repodata_source("/data/channels/bioconda") == ("", "/data/channels/bioconda")
+    assert split_repodata_source("/data/a=b/repodata.json") == ("", "/data/a=b/repodata.json")
+
+
+def test_load_conda_env(tmp_path):
+    """Check that only geniac entries are loaded and that parsed files are cached"""
+    yml_path = tmp_path / "fastqc.yml"
+    yml_path.write_text(
+        "name: fastqc_env\nchannels:\n  - bioconda\n  - nodefaults\n"
+        "dependencies:\n  - bioconda::fastqc=0.11.6=2\nprefix: /opt/env\n"
+    )
+    cache = GeniacCache(tmp_path / "parse.json")
+    conda_env = load_conda_env(yml_path, cache=cache)
+    assert conda_env == {
+        "name": "fastqc_env",
+        "channels": ["bioconda", "nodefaults"],
+        "dependencies": ["bioconda::fastqc=0.11.6=2"],
+    }
+    assert cache.get(f"conda.env:{yml_path.as_posix()}")["content"] == conda_env
+
+    yml_path.write_text("name: fastqc_env_2\n")
+    assert load_conda_env(yml_path, cache=cache) == {"name": "fastqc_env_2"}
+
+
+def test_load_conda_env_bounded(tmp_path, monkeypatch):
+    """Check that only the most recently loaded conda environment files are kept in memory"""
+    monkeypatch.setattr(conda, "_CONDA_ENVS", OrderedDict())
+    monkeypatch.setattr(conda, "_CONDA_ENVS_SIZE", 2)
+    yml_paths = [tmp_path / f"tool{idx}.yml" for idx in range(3)]
+    for yml_path in yml_paths:
+        yml_path.write_text(f"name: {yml_path.stem}\n")
+    load_conda_env(yml_paths[0])
+    load_conda_env(yml_paths[1])
+    load_conda_env(yml_paths[0])
+    load_conda_env(yml_paths[2])
+    assert list(conda._CONDA_ENVS) == [yml_paths[0].resolve(), yml_paths[2].resolve()]
+
+
+def test_conda_recipe_checker_cancel(tmp_path):
+    """Check that closing the results before their end kills the running conda searches"""
+    conda_path = tmp_path / "conda"
+    conda_path.write_text(
+        '#!/bin/sh\ncase "$2" in *slow*) exec sleep 30;; esac\necho "$2"\n'
+    )
+    conda_path.chmod(0o755)
+    checker = CondaRecipeChecker(max_workers=2, conda_cmd=str(conda_path))
+    checker.add("bioconda::fastqc=0.11.6=2", "fastqc")
+    checker.add("bioconda::slow=1=0", "slow")
+
+    start = time.perf_counter()
+    results = checker.iter_check()
+    recipe, result = next(results)
+    assert recipe == ("bioconda::fastqc=0.11.6=2", ()) and result.found
+    results.close()
+
+    assert time.perf_counter() - start < 10
+    assert not checker._processes
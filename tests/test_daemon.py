@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""test_daemon.py: Test geniac.cli.commands.daemon module"""
+
+import json
+import stat
+import threading
+
+import pytest
+
+from geniac.cli.commands.daemon import (
+    GeniacDaemon,
+    GeniacLintClient,
+    daemon_socket_path,
+    send_request,
+)
+from geniac.cli.commands.lint import GeniacLint
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+def test_daemon_socket_path(tmp_path):
+    """Check that each project has its own socket with a path short enough"""
+    first = daemon_socket_path(tmp_path, tmp_path / "first")
+    assert first.parent == tmp_path / "daemon"
+    assert first != daemon_socket_path(tmp_path, tmp_path / "second")
+    assert len(str(daemon_socket_path(tmp_path / ("x" * 120), tmp_path / "first"))) <= 100
+
+
+def test_daemon_requests(shared_datadir, tmp_path, monkeypatch):
+    """Check that a daemon answers requests until it is stopped"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    daemon = GeniacDaemon(shared_datadir)
+    thread = threading.Thread(target=daemon.serve)
+    thread.start()
+    try:
+        for _ in range(100):
+            if daemon.is_running():
+                break
+            thread.join(0.05)
+        response = send_request(daemon.socket_path, {"command": "ping"})
+        assert response["requests"] == 0
+        assert "error" in send_request(daemon.socket_path, {"command": "unknown"})
+    finally:
+        send_request(daemon.socket_path, {"command": "stop"})
+        thread.join(10)
+    assert not thread.is_alive()
+    assert not daemon.socket_path.exists()
+
+
+def test_daemon_lint(shared_datadir, tmp_path, monkeypatch):
+    """Check that the client lints with the daemon, which reuses the lint of unchanged files"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    runs = []
+    lint_run = GeniacLint.run
+    monkeypatch.setattr(GeniacLint, "run", lambda self: runs.append(self) or lint_run(self))
+    daemon = GeniacDaemon(shared_datadir)
+    thread = threading.Thread(target=daemon.serve)
+    thread.start()
+    jsonl_path = tmp_path / "diagnostics.jsonl"
+    try:
+        for _ in range(100):
+            if daemon.is_running():
+                break
+            thread.join(0.05)
+        assert stat.S_IMODE(daemon.socket_path.stat().st_mode) & 0o077 == 0
+        for _ in range(2):
+            with pytest.raises(SystemExit):
+                GeniacLintClient(shared_datadir, diagnostics_jsonl=str(jsonl_path)).run()
+            diagnostics = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+            assert any(diagnostic["rule"] == "process-labels" for diagnostic in diagnostics)
+            assert len(runs) == 1
+        with (shared_datadir / "main.nf").open("a") as script:
+            script.write("\n")
+        with pytest.raises(SystemExit):
+            GeniacLintClient(shared_datadir, diagnostics_jsonl=str(jsonl_path)).run()
+        assert len(runs) == 2 and runs[0] is not runs[1]
+        assert send_request(daemon.socket_path, {"command": "ping"})["requests"] == 3
+    finally:
+        send_request(daemon.socket_path, {"command": "stop"})
+        thread.join(10)
+    assert not thread.is_alive()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""test_diagnostics.py: Test geniac.cli.utils.diagnostics module"""
+
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+from geniac.cli.utils.diagnostics import (
+    DiagnosticsHandler,
+    ErrorBudgetExceeded,
+    consume_error_budget,
+    error_budget,
+    rule_context,
+)
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+def test_diagnostics_handler(tmp_path):
+    """Check findings are written with their rule and file in JSON Lines and SARIF"""
+    logger = logging.getLogger("geniac.test")
+    jsonl_path, sarif_path = tmp_path / "lint.jsonl", tmp_path / "lint.sarif"
+    with DiagnosticsHandler.from_options(str(jsonl_path), str(sarif_path)):
+        with rule_context("tree-structure"):
+            logger.warning("Directory %s does not exist.", Path("env"))
+            # Written before the end of the lint
+            assert len(jsonl_path.read_text().splitlines()) == 1
+        logger.error("Wrong label", extra={"rule": "process-labels", "file": "main.nf", "line": 3})
+        logger.info("Not a finding")
+
+    diagnostics = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+    assert diagnostics == [
+        {
+            "rule": "tree-structure",
+            "severity": "warning",
+            "file": "env",
+            "line": None,
+            "message": "Directory env does not exist.",
+        },
+        {
+            "rule": "process-labels",
+            "severity": "error",
+            "file": "main.nf",
+            "line": 3,
+            "message": "Wrong label",
+        },
+    ]
+    sarif_run = json.loads(sarif_path.read_text())["runs"][0]
+    assert [rule["id"] for rule in sarif_run["tool"]["driver"]["rules"]] == [
+        "tree-structure",
+        "process-labels",
+    ]
+    assert sarif_run["results"][1]["locations"][0]["physicalLocation"]["region"] == {
+        "startLine": 3
+    }
+
+
+def test_error_budget():
+    """Check that the lint is stopped only once the maximum number of errors is reached"""
+    with error_budget(0):
+        for _ in range(5):
+            consume_error_budget()
+    with error_budget(2) as budget:
+        consume_error_budget()
+        with pytest.raises(ErrorBudgetExceeded):
+            consume_error_budget()
+    assert budget.errors == 2
+    # No budget outside of the context
+    consume_error_budget()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""test_fs.py: Test geniac.cli.utils.fs module"""
+
+import os
+
+from geniac.cli.utils.fs import materialize_tree, sync_tree
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+def test_materialize_tree(tmp_path):
+    """Check that only read-only files are hard linked and that links are never written"""
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    (src / "test" / "data").mkdir(parents=True)
+    (src / "main.nf").write_text("// main\n")
+    (src / "test" / "data" / "reads.fastq").write_text("@read\n")
+    (dst / "main.nf").parent.mkdir()
+    (dst / "main.nf").hardlink_to(src / "main.nf")
+
+    counts = materialize_tree(
+        src, dst, methods=("hardlink", "copy"), hardlink_patterns=("test/data/*",)
+    )
+    assert counts == {"hardlink": 1, "copy": 1}
+    assert (dst / "test" / "data" / "reads.fastq").samefile(src / "test" / "data" / "reads.fastq")
+    assert not (dst / "main.nf").samefile(src / "main.nf")
+
+    (dst / "main.nf").write_text("// edited\n")
+    assert (src / "main.nf").read_text() == "// main\n"
+
+
+def test_materialize_tree_sparse(tmp_path):
+    """Check that a sparse copy keeps the root files and the included folders only"""
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    for rel_path in (
+        "main.nf", "conf/base.config", "recipes/conda/tool.yml", "test/data/reads.fastq",
+        "work/ab/cd/.command.sh", ".nextflow.log",
+    ):
+        (src / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (src / rel_path).write_text(rel_path)
+
+    materialize_tree(
+        src,
+        dst,
+        methods=("copy",),
+        included=("conf", "recipes/conda"),
+        excluded=("work", ".nextflow.log*"),
+    )
+    assert sorted(
+        path.relative_to(dst).as_posix() for path in dst.rglob("*") if path.is_file()
+    ) == ["conf/base.config", "main.nf", "recipes/conda/tool.yml"]
+
+
+def test_sync_tree(tmp_path):
+    """Check that only changed files are copied again and that removed files are deleted"""
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    (src / "conf").mkdir(parents=True)
+    (src / "main.nf").write_text("// main\n")
+    (src / "conf" / "base.config").write_text("// base\n")
+    previous = {"main.nf": [8, 1, "a"], "conf/base.config": [8, 1, "b"]}
+    assert sync_tree(src, dst, previous, methods=("copy",)) == {"copy": 2}
+
+    (dst / "build.log").write_text("kept\n")
+    (src / "main.nf").write_text("// main v2\n")
+    (src / "conf" / "base.config").unlink()
+    (src / "nextflow.config").write_text("// config\n")
+    manifest = {"main.nf": [11, 2, "c"], "nextflow.config": [10, 1, "d"]}
+    counts = sync_tree(src, dst, manifest, previous, methods=("copy",))
+    assert counts == {"copy": 2, "removed": 1}
+    assert (dst / "main.nf").read_text() == "// main v2\n"
+    assert not (dst / "conf").exists()
+    assert (dst / "build.log").is_file()
+
+    os.utime(dst / "main.nf", ns=(0, 0))
+    assert sync_tree(src, dst, manifest, manifest) == {"unchanged": 2}
+    assert (dst / "main.nf").stat().st_mtime_ns == 0
+
+
+def test_materialize_tree_workers(tmp_path):
+    """Check that a copy made by several threads reproduces the content and times of the files"""
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    for index in range(50):
+        (src / f"modules/module{index % 5}").mkdir(parents=True, exist_ok=True)
+        (src / f"modules/module{index % 5}/file{index}.nf").write_text(f"// {index}\n" * index)
+        os.utime(src / f"modules/module{index % 5}/file{index}.nf", ns=(index, index))
+
+    assert materialize_tree(src, dst, methods=("copy",), workers=4) == {"copy": 50}
+    for path in src.rglob("*.nf"):
+        assert (dst / path.relative_to(src)).read_text() == path.read_text()
+        assert (dst / path.relative_to(src)).stat().st_mtime_ns == path.stat().st_mtime_ns
@@ -0,0 +1,21 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""test_labels.py: Test geniac.cli.utils.labels module"""
+
+from geniac.cli.utils.labels import LabelIndex
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+def test_label_index_startswith():
+    """Check prefix queries keep the registration order of the labels"""
+    index = LabelIndex(["star_2_7", "salmon", "star_2_5", "samtools", "star_2_7"])
+    assert len(index) == 4
+    assert "salmon" in index
+    assert "sal" not in index
+    assert index.startswith("star") == ["star_2_7", "star_2_5"]
+    assert index.startswith("sa") == ["salmon", "samtools"]
+    assert index.startswith("bwa") == []
+    assert index.startswith("") == ["star_2_7", "salmon", "star_2_5", "samtools"]
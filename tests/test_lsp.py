@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""test_lsp.py: Test geniac.cli.commands.lsp module"""
+
+import io
+
+from geniac.cli.commands.lsp import GeniacLanguageServer, TextDocument, read_message
+from geniac.cli.parsers.base import GeniacParser, split_blocks
+from geniac.cli.parsers.config import NextflowConfig
+from geniac.cli.parsers.scripts import NextflowScript
+from geniac.cli.utils.logging import RecordCollector
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+def test_text_document_changes():
+    """Check incremental changes with positions given in UTF-16 code units"""
+    document = TextDocument("file:///project/main.nf", "process a {\n  label 'x'\n}\n")
+    document.apply_change(
+        {
+            "range": {"start": {"line": 1, "character": 9}, "end": {"line": 1, "character": 10}},
+            "text": "tool",
+        }
+    )
+    assert document.text == "process a {\n  label 'tool'\n}\n"
+    document.apply_change(
+        {
+            "range": {"start": {"line": 0, "character": 8}, "end": {"line": 2, "character": 1}},
+            "text": "\U0001F600 {\n}",
+        }
+    )
+    assert document.text == "process \U0001F600 {\n}\n"
+    document.apply_change(
+        {
+            "range": {"start": {"line": 0, "character": 10}, "end": {"line": 0, "character": 10}},
+            "text": "b",
+        }
+    )
+    assert document.text == "process \U0001F600b {\n}\n"
+
+
+def test_language_server(shared_datadir):
+    """Check diagnostics are published for an edited workflow and blocks are parsed once"""
+    output = io.BytesIO()
+    server = GeniacLanguageServer(shared_datadir, stdin=io.BytesIO(), stdout=output)
+    server.handle({"id": 1, "method": "initialize", "params": {"rootUri": shared_datadir.as_uri()}})
+    server.handle({"method": "initialized"})
+    main_path = shared_datadir.resolve() / "main.nf"
+    text = main_path.read_text()
+    server.handle(
+        {
+            "method": "textDocument/didOpen",
+            "params": {"textDocument": {"uri": main_path.as_uri(), "text": text}},
+        }
+    )
+    server.relint()
+    cached_blocks = len(NextflowScript.BLOCK_CACHE)
+    server.handle(
+        {
+            "method": "textDocument/didChange",
+            "params": {
+                "textDocument": {"uri": main_path.as_uri(), "version": 2},
+                "contentChanges": [{"text": text + "\nprocess unlabelled {\n  script:\n}\n"}],
+            },
+        }
+    )
+    server.relint()
+    # Only the new process block has been parsed
+    assert len(NextflowScript.BLOCK_CACHE) == cached_blocks + 1
+
+    output.seek(0)
+    messages = []
+    while (message := read_message(output)) is not None:
+        messages.append(message)
+    assert messages[0]["result"]["capabilities"]["textDocumentSync"]["change"] == 2
+    diagnostics = [
+        message["params"]["diagnostics"]
+        for message in messages
+        if message.get("params", {}).get("uri") == main_path.as_uri()
+    ][-1]
+    [unlabelled] = [
+        diagnostic
+        for diagnostic in diagnostics
+        if "Process unlabelled" in diagnostic["message"]
+    ]
+    assert unlabelled["code"] == "workflow-scripts"
+    assert unlabelled["range"]["start"]["line"] == len(text.splitlines()) + 1
+
+
+def test_read_text_lines(shared_datadir):
+    """Check that the lines of cached blocks follow the lines inserted above them"""
+    text = "process a {\n  label 'x'\n}\n/* two\nlines */\nprocess b {\n}\n"
+    script = NextflowScript(src_path=shared_datadir)
+    script.read_text(text, shared_datadir / "main.nf", flush_content=True)
+    assert script.content["process"]["b"]["NextflowScriptLine"] == 6
+    cached_blocks = len(NextflowScript.BLOCK_CACHE)
+    script = NextflowScript(src_path=shared_datadir)
+    script.read_text("// header\n\n" + text, shared_datadir / "main.nf")
+    assert len(NextflowScript.BLOCK_CACHE) == cached_blocks
+    assert script.content["process"]["a"]["NextflowScriptLine"] == 3
+    assert script.content["process"]["b"]["NextflowScriptLine"] == 8
+
+
+def test_read_text_definitions(shared_datadir):
+    """Check that strings do not split blocks and parameters defined in two blocks are reported"""
+    text = (
+        'params {\n  outDir = "./results"\n  summary = "${outDir} {"\n}\n'
+        'params.outDir = "./other"\nprocess {\n  cpus = 1\n}\n'
+    )
+    lines = text.splitlines(keepends=True)
+    masked_lines = GeniacParser._mask_strings(text).splitlines(keepends=True)
+    assert [start for start, _ in split_blocks(lines, masked_lines)] == [0, 4, 5]
+    for _ in range(2):
+        config = NextflowConfig(src_path=shared_datadir)
+        with RecordCollector() as collector:
+            config.read_text(text, shared_datadir / "conf" / "base.config")
+        assert [
+            (record[2], record[5]) for record in collector.records if record[0] == 30
+        ] == [
+            (
+                "Parameter params.outDir from conf/base.config at line 5 has already been "
+                "defined in the same file.",
+                5,
+            )
+        ]
+        assert config.lines["process.cpus"] == 7
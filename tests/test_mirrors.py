@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""test_mirrors.py: Test geniac.cli.utils.mirrors module"""
+
+from pathlib import Path
+
+from git import Repo
+
+from geniac.cli.utils.mirrors import GitMirrorCache, clone_repository, resolve_submodule_url
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+def _commit(repo: Repo, file_name: str, content: str):
+    """Commit a file in a test repository"""
+    (Path(repo.working_tree_dir) / file_name).write_text(content)
+    repo.index.add([file_name])
+    repo.index.commit(f"Update {file_name}")
+
+
+def _init_repo(path):
+    """Create a test repository"""
+    repo = Repo.init(path, initial_branch="main")
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "geniac")
+        config.set_value("user", "email", "geniac@example.com")
+    return repo
+
+
+def test_resolve_submodule_url():
+    """Check that relative submodule URLs are resolved against the superproject URL"""
+    assert (
+        resolve_submodule_url("https://host/group/pipeline.git", "../geniac.git")
+        == "https://host/group/geniac.git"
+    )
+    assert resolve_submodule_url("git@host:group/pipeline", "../geniac") == "git@host:group/geniac"
+    assert resolve_submodule_url("/repos/pipeline", "../geniac") == "/repos/geniac"
+    assert resolve_submodule_url("/repos/pipeline", "file:///geniac") == "file:///geniac"
+
+
+def test_git_mirror_cache(tmp_path):
+    """Check that clones and their submodules are served from updated mirrors"""
+    geniac_repo = _init_repo(tmp_path / "remote" / "geniac")
+    _commit(geniac_repo, "CMakeLists.txt", "project(geniac)\n")
+    pipeline_repo = _init_repo(tmp_path / "remote" / "pipeline")
+    _commit(pipeline_repo, "main.nf", "// v1\n")
+    pipeline_repo.git(c="protocol.file.allow=always").submodule("add", "../geniac", "geniac")
+    pipeline_repo.index.commit("Add geniac submodule")
+    url = (tmp_path / "remote" / "pipeline").as_uri()
+
+    mirrors = GitMirrorCache(tmp_path / "mirrors")
+    clone = mirrors.clone(url, tmp_path / "src1")
+    assert (tmp_path / "src1" / "geniac" / "CMakeLists.txt").is_file()
+    assert clone.remote().url == url
+    assert Repo(tmp_path / "src1" / "geniac").remote().url == f"{url.rsplit('/', 1)[0]}/geniac"
+    assert mirrors.mirror_path(url).is_dir()
+
+    _commit(pipeline_repo, "main.nf", "// v2\n")
+    mirrors.clone(url, tmp_path / "src2", branch="main")
+    assert (tmp_path / "src2" / "main.nf").read_text() == "// v2\n"
+
+
+def test_clone_repository_shallow_sparse(tmp_path):
+    """Check that a shallow sparse clone only checks out the root files and given folders"""
+    pipeline_repo = _init_repo(tmp_path / "remote" / "pipeline")
+    (tmp_path / "remote" / "pipeline" / "conf").mkdir()
+    (tmp_path / "remote" / "pipeline" / "test").mkdir()
+    _commit(pipeline_repo, "conf/base.config", "// base\n")
+    _commit(pipeline_repo, "test/data.txt", "data\n")
+    _commit(pipeline_repo, "main.nf", "// main\n")
+
+    clone = clone_repository(
+        (tmp_path / "remote" / "pipeline").as_uri(),
+        tmp_path / "src",
+        depth=1,
+        clone_filter="blob:none",
+        folders=["conf"],
+    )
+    assert len(list(clone.iter_commits())) == 1
+    assert (tmp_path / "src" / "conf" / "base.config").is_file()
+    assert (tmp_path / "src" / "main.nf").is_file()
+    assert not (tmp_path / "src" / "test").exists()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""test_profiler.py: Test geniac.cli.utils.profiler module"""
+
+import builtins
+import re
+import subprocess
+import sys
+
+from geniac.cli.parsers.scripts import NextflowScript
+from geniac.cli.utils.conda import CondaRecipeChecker
+from geniac.cli.utils.profiler import LintProfiler, profile_count
+from geniac.cli.utils.vfs import LocalTree
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+def test_lint_profiler(tmp_path):
+    """Check events are counted at geniac choke points in nested sections only"""
+    original = (builtins.open, re.match, subprocess.Popen)
+    script = "process fastqc {\n  label 'fastqc'\n}\n"
+    (tmp_path / "main.nf").write_text(script)
+    fake_conda = tmp_path / "conda"
+    fake_conda.write_text(f"#!{sys.executable}\n")
+    fake_conda.chmod(0o755)
+    profiler = LintProfiler()
+    with profiler.section("phase", "workflow"):
+        with profiler.section("rule", "workflow-scripts"):
+            NextflowScript().read(tmp_path / "main.nf")
+            assert (builtins.open, re.match, subprocess.Popen) == original
+        tree = LocalTree(tmp_path)
+        tree.exists(tmp_path / "main.nf")
+        tree.iterdir(tmp_path)
+        tree.glob(tmp_path, "*.nf")
+        checker = CondaRecipeChecker(conda_cmd=str(fake_conda))
+        checker.add("fastqc=0.11.9", "fastqc")
+        checker.check()
+    profile_count("reads")
+
+    workflow = profiler.sections[("phase", "workflow")]
+    rule = profiler.sections[("rule", "workflow-scripts")]
+    assert (rule["reads"], rule["bytes_read"], rule["lines"]) == (1, len(script), 3)
+    assert workflow["regex"] == rule["regex"] > 0
+    assert rule["subprocesses"] == 0 and workflow["subprocesses"] == 1
+    assert (workflow["reads"], workflow["stats"], workflow["listings"]) == (1, 1, 1)
+    assert workflow["globs"] == 1
+    assert workflow["wall"] >= rule["wall"]
+    assert "rule workflow-scripts" in profiler.format_table()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""test_publish.py: Test the publishing of geniac command outputs"""
+
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from geniac.cli.commands.base import GeniacCommand
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+class PublishingCommand(GeniacCommand):
+    """Command run in a geniac working directory, only used to publish outputs"""
+
+    def run(self):
+        pass
+
+
+@pytest.fixture
+def command(tmp_path):
+    """Command whose working directory is tmp_path, removing its temporary folder afterwards"""
+    (tmp_path / ".geniac").mkdir()
+    command = PublishingCommand(src_path=tmp_path, which="publish")
+    command.cleaner.background = False
+    yield command
+    if command._tmp_dir is not None:
+        command._tmp_dir.cleanup()
+
+
+def test_publish_outputs(command, tmp_path):
+    """Check that outputs replace the previous ones, moved from a temporary build folder"""
+    results = tmp_path / "build" / "workDir" / "results" / "conf"
+    results.mkdir(parents=True)
+    (results / "docker.config").write_text("docker {}\n")
+    (results / "list.txt").write_text("docker\n")
+    (tmp_path / "configs").mkdir()
+    (tmp_path / "configs" / "old.config").write_text("old\n")
+
+    command.publish_outputs({".": results}, tmp_path / "configs", excluded=("*.txt",))
+    assert [path.name for path in (tmp_path / "configs").iterdir()] == ["docker.config"]
+    assert results.is_dir()
+
+    # Outputs of a temporary working directory are moved rather than copied
+    command._tmp_dir = TemporaryDirectory()
+    command.publish_outputs({"docker": results}, tmp_path / "recipes")
+    assert sorted(path.name for path in (tmp_path / "recipes" / "docker").iterdir()) == [
+        "docker.config",
+        "list.txt",
+    ]
+    assert not results.exists()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        ".geniac", "build", "configs", "recipes"
+    ]
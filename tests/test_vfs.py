@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""test_vfs.py: Test geniac.cli.utils.vfs module"""
+
+import pytest
+from git import Repo
+
+from geniac.cli.utils.vfs import GitIndexTree, GitRevisionTree
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+def test_git_index_tree(tmp_path):
+    """Check that files are read as they are staged in the git index"""
+    repo = Repo.init(tmp_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "geniac")
+        config.set_value("user", "email", "geniac@example.com")
+    for name in ("main.nf", "removed.config", "unchanged.config"):
+        (tmp_path / name).write_text(f"// {name}\n")
+    repo.index.add(["main.nf", "removed.config", "unchanged.config"])
+    repo.index.commit("init")
+
+    (tmp_path / "main.nf").write_text("// staged\n")
+    (tmp_path / "added.config").write_text("// added\n")
+    repo.index.add(["main.nf", "added.config"])
+    repo.index.remove(["removed.config"])
+    (tmp_path / "main.nf").write_text("// not staged\n")
+    (tmp_path / "untracked.nf").write_text("// untracked\n")
+
+    tree = GitIndexTree(tmp_path)
+    assert tree.changes == {
+        tmp_path.resolve() / "main.nf": "M",
+        tmp_path.resolve() / "added.config": "A",
+        tmp_path.resolve() / "removed.config": "D",
+    }
+    assert tree.read_text(tmp_path / "main.nf") == "// staged\n"
+    assert tree.read_text(tmp_path / "unchanged.config") == "// unchanged.config\n"
+    assert tree.is_local(tmp_path / "unchanged.config")
+    assert not tree.is_local(tmp_path / "main.nf")
+    assert not tree.exists(tmp_path / "removed.config")
+    assert not tree.exists(tmp_path / "untracked.nf")
+    with pytest.raises(FileNotFoundError):
+        tree.read_bytes(tmp_path / "untracked.nf")
+
+
+def test_git_revision_tree(tmp_path):
+    """Check that files are read from a git revision and not from the working tree"""
+    repo = Repo.init(tmp_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "geniac")
+        config.set_value("user", "email", "geniac@example.com")
+    (tmp_path / "conf").mkdir()
+    (tmp_path / "conf" / "base.config").write_text("// v1\n")
+    (tmp_path / "main.nf").write_text("// v1\n")
+    repo.index.add(["conf/base.config", "main.nf"])
+    repo.index.commit("v1")
+    repo.create_tag("v1")
+    (tmp_path / "conf" / "base.config").write_text("// v2\n")
+    (tmp_path / "conf" / "extra.config").write_text("// v2\n")
+
+    tree = GitRevisionTree(tmp_path, "v1")
+    assert tree.read_text(tmp_path / "conf" / "base.config") == "// v1\n"
+    assert not tree.exists(tmp_path / "conf" / "extra.config")
+    assert tree.is_dir(tmp_path / "conf")
+    assert sorted(tree.iterdir(tmp_path)) == [tmp_path / "conf", tmp_path / "main.nf"]
+    assert tree.glob(tmp_path, "*/*.config") == [tmp_path / "conf" / "base.config"]
+    assert tree.glob(tmp_path, "**/*") == [
+        tmp_path / "conf", tmp_path / "conf" / "base.config", tmp_path / "main.nf",
+    ]
+    with pytest.raises(ValueError):
+        GitRevisionTree(tmp_path, "v2")
+
+
+def test_git_index_tree_outside_repository(tmp_path):
+    """Check that a folder outside of a git repository is rejected"""
+    with pytest.raises(ValueError):
+        GitIndexTree(tmp_path)
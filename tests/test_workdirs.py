@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""test_workdirs.py: Test geniac.cli.utils.workdirs module"""
+
+import os
+import time
+
+from geniac.cli.commands.base import GeniacCommand
+from geniac.cli.utils.workdirs import WorkdirStore
+
+__author__ = "Fabrice Allain"
+__copyright__ = "Institut Curie 2026"
+
+
+def test_workdir_store(tmp_path):
+    """Check that a working directory is locked by one run and keeps its state between runs"""
+    store = WorkdirStore(tmp_path / "workdirs")
+    workdir = store.workdir_path(tmp_path / "pipeline", "configs")
+    assert workdir.parent == tmp_path / "workdirs"
+    assert workdir != store.workdir_path(tmp_path / "pipeline", "recipes")
+    assert store.read_state(workdir) == {}
+
+    assert store.acquire(workdir)
+    assert not WorkdirStore(tmp_path / "workdirs").acquire(workdir)
+    store.write_state(workdir, {"source": "abc", "version": "3.0"})
+    store.release(workdir)
+
+    other_store = WorkdirStore(tmp_path / "workdirs")
+    assert other_store.acquire(workdir)
+    assert other_store.read_state(workdir) == {"source": "abc", "version": "3.0"}
+    other_store.write_state(workdir, None)
+    assert other_store.read_state(workdir) == {}
+
+
+def test_stale_workdirs(tmp_path):
+    """Check that only the working directories unused for a while and not locked are evicted"""
+    store = WorkdirStore(tmp_path / "workdirs")
+    old, recent, used = (
+        store.workdir_path(tmp_path / name, "configs") for name in ("old", "recent", "used")
+    )
+    for workdir in (old, recent, used):
+        workdir.mkdir(parents=True)
+        store.lock_path(workdir).touch()
+    for workdir in (old, used):
+        os.utime(store.lock_path(workdir), (time.time() - 7200,) * 2)
+    other_store = WorkdirStore(tmp_path / "workdirs")
+    assert other_store.acquire(used)
+    assert store.stale_workdirs(3600) == [old]
+    store.release(old, remove_lock=True)
+    assert not store.lock_path(old).exists()
+    other_store.release(used)
+
+
+def test_workdir_reuse(shared_datadir, tmp_path, monkeypatch):
+    """Check that an unchanged project is not copied again and its CMake configuration is kept"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    config_path = tmp_path / "geniac.ini"
+    config_path.write_text(f"[geniac.cache]\nworkdirs = {tmp_path / 'workdirs'}\n")
+    copies, runs = [], []
+
+    class ReusingCommand(GeniacCommand):
+        """Command recording the copies of the project and the commands run"""
+
+        def init_working_src_folder(self, *args, **kwargs):
+            copies.append(kwargs)
+
+        def _subprocess_run(self, cmd, *args, **kwargs):
+            runs.append(cmd)
+            return True
+
+        def run(self):
+            pass
+
+    # Working directories are only reused if a folder is configured
+    command = ReusingCommand(src_path=shared_datadir, init_work_path=True, which="configs")
+    assert command._workdir_store is None and command.workdir_fingerprint is None
+    copies.clear()
+
+    commands = []
+    for _ in range(2):
+        command = ReusingCommand(
+            src_path=shared_datadir, config_file=config_path, init_work_path=True, which="configs"
+        )
+        command.working_dirs["build"].mkdir(exist_ok=True)
+        (command.working_dirs["build"] / "CMakeCache.txt").touch()
+        command._cmake_configure(["cmake", "../src"], cwd=command.working_dirs["build"])
+        command._workdir_store.release(command.working_dir)
+        commands.append(command)
+    assert commands[0].working_dir == commands[1].working_dir
+    assert commands[0].working_dir.parent == tmp_path / "workdirs"
+    assert len(copies) == 1 and len(runs) == 1
+
+    # The project files changed since the build folder was configured
+    with (shared_datadir / "main.nf").open("a") as script:
+        script.write("\n")
+    command = ReusingCommand(
+        src_path=shared_datadir, config_file=config_path, init_work_path=True, which="configs"
+    )
+    command._cmake_configure(["cmake", "../src"], cwd=command.working_dirs["build"])
+    command._workdir_store.release(command.working_dir)
+    assert len(copies) == 2 and len(runs) == 2